@@ -33,8 +33,15 @@ from PathConfig import save_shared_path
 import functions.header_functions as header_functions
 from functions.app_functions import lock_widgets
 from functions.header_functions import get_user_id
+from functions.json_functions import flush_pending_writes, invalidate_cache
+from functions.json_functions import restore_offline_writes, replay_offline_writes
+from functions.write_functions import recover_journals
+from functions.mirror_functions import start_mirror_sync, is_share_available
+from functions.offline_functions import SHARE_CHECK_INTERVAL, start_share_monitor, count_queued_writes
+from functions.verify_functions import start_integrity_verifier, get_flagged_schedules
 from functions.login_functions import load_user_access_levels
 from functions.app_functions import center_toplevel_window, forward_outlook_email
+from functions.app_functions import show_save_conflicts
 from HeaderFrame import HeaderFrame
 from HdrDateGrid import HdrDateGrid
 from ScrolledFrame import ScrolledFrame
@@ -77,6 +84,19 @@ logging.basicConfig(level=logging.ERROR,
                     filename=log_file,
                     filemode='a')
 
+# Finish or roll back any save that was interrupted by a crash or dropped connection
+recover_journals()
+
+# Keep the local SaveFiles mirror in sync with the share in the background
+start_mirror_sync()
+
+# Pick up saves queued while the share was offline and watch for it dropping again
+restore_offline_writes()
+start_share_monitor()
+
+# Check the SaveFiles schedules against their integrity records in the background
+start_integrity_verifier()
+
 class App(tk.Tk):
     """
     The main application window.
@@ -166,10 +186,19 @@ class App(tk.Tk):
         self.autosave_label = ctk.CTkLabel(self.bottom_frame, text="Autosave: Off", font=("Calibri", 12), text_color=constants.TEXT_COLOR)
         self.autosave_label.pack(side=tk.RIGHT, padx=10)
         
+        self.connection_label = ctk.CTkLabel(self.bottom_frame, text="Share: Online", font=("Calibri", 12), text_color=constants.TEXT_COLOR)
+        self.connection_label.pack(side=tk.RIGHT, padx=10)
+        
         self.save_status_label = ctk.CTkLabel(self.bottom_frame, text="", font=("Calibri", 12), text_color="green")
         self.save_status_label.pack(side=tk.LEFT, padx=10)
         
+        self.integrity_label = ctk.CTkLabel(self.bottom_frame, text="", font=("Calibri", 12), text_color="red")
+        self.integrity_label.pack(side=tk.LEFT, padx=10)
+        self.reported_integrity_failures = set()
+        
         self.start_clock_thread()  # Start the clock thread
+        self.after(0, self.update_connection_status)
+        self.after(0, self.update_integrity_status)
         
     def start_clock_thread(self):
         clock_thread = threading.Thread(target=self.update_clock)
@@ -348,6 +377,43 @@ class App(tk.Tk):
         else:
             messagebox.showinfo("Tracking Log", "No schedule is currently loaded.")
     
+    def update_connection_status(self):
+        """
+        Shows whether the share can be reached and how many saves are queued, and
+        replays the queued saves once the share is back.
+        """
+        queued = count_queued_writes()
+        if not is_share_available():
+            self.connection_label.configure(text=f"Share: Offline ({queued} queued)" if queued else "Share: Offline", text_color="red")
+        elif queued:
+            self.connection_label.configure(text=f"Share: Syncing {queued}", text_color="orange")
+            try:
+                conflicts = replay_offline_writes()
+                if conflicts:
+                    show_save_conflicts(conflicts)
+            except Exception as e:
+                logging.error(f"Failed to replay offline saves: {str(e)}")
+        else:
+            self.connection_label.configure(text="Share: Online", text_color=constants.TEXT_COLOR)
+        self.after(int(SHARE_CHECK_INTERVAL * 1000), self.update_connection_status)
+
+    def update_integrity_status(self):
+        """
+        Shows how many schedules failed the background integrity check and warns
+        once per session about each newly flagged one. The details are in the log.
+        """
+        flagged = get_flagged_schedules()
+        if flagged:
+            self.integrity_label.configure(text=f"Integrity: {len(flagged)} flagged")
+        else:
+            self.integrity_label.configure(text="")
+
+        new_failures = sorted(set(flagged) - self.reported_integrity_failures)
+        if new_failures:
+            self.reported_integrity_failures.update(new_failures)
+            messagebox.showwarning("Integrity Check", "These schedules do not match what was last saved by the app and may be corrupted or hand-edited:\n\n" + "\n".join(new_failures) + "\n\nSee the application log for details.")
+        self.after(int(SHARE_CHECK_INTERVAL * 1000), self.update_integrity_status)
+
     def update_autosave_label(self):
         if self.autosave_var.get():
             self.autosave_label.configure(text="Autosave: On")
@@ -692,9 +758,13 @@ class App(tk.Tk):
                 if self.autosave_var.get():
                     self.save_schedule_data()
                     self.display_save_status()
-                super().destroy()
-            else:
-                super().destroy()
+            
+            # Write out anything still held in the schedule cache
+            try:
+                flush_pending_writes()
+            except Exception as e:
+                logging.error(f"Failed to write pending schedule data on exit: {str(e)}")
+            super().destroy()
     
     """
     Menu Bar Options
@@ -765,6 +835,9 @@ class App(tk.Tk):
         if not self.left_pane_frame.winfo_viewable():
             self.toggle_nav_pane()
         
+        # Pick up changes other users made to the shared files
+        invalidate_cache()
+        
         self.open_input_window()
         
         # Update the HdrDateGrid instance with the new user selections
@@ -4,6 +4,7 @@
 # Third-Party Library Imports
 
 # Local Application/Library Specific Imports
+from functions.hours_functions import parse_hours, sum_hours
 
 
 class CrewMemberHours:
@@ -12,18 +13,56 @@ class CrewMemberHours:
     data for a single crew member. It provides methods to update, retrieve, and convert 
     the hours data to and from dictionaries. 
     
+    Overtime day entries are also kept as typed integer arrays (asking_hours and
+    working_hours) parsed on first access, so totals never re-parse the string lists
+    and members that are never summed are never parsed. The string lists in
+    monthly_hours remain the JSON format; assigning monthly_hours drops the arrays.
+
+    Instances are slotted, so a loaded roster holds no per-member __dict__.
+    
     This class is used in conjunction with other parts of the application to handle and 
     process crew member hours data.
     """
-    def __init__(self, name=''):
+    __slots__ = ('name', '_monthly_hours', '_asking_hours', '_working_hours')
+
+    def __init__(self, name='', monthly_hours=None):
         """
         The constructor method initializes a new instance of the CrewMemberHours class.
 
         Args:
             name (str, optional): name of the crew member. Defaults to ''.
+            monthly_hours (dict, optional): monthly hours data of the crew member. Defaults to {}.
         """
         self.name = name
-        self.monthly_hours = {}
+        self.monthly_hours = {} if monthly_hours is None else monthly_hours
+
+    @property
+    def monthly_hours(self):
+        return self._monthly_hours
+
+    @monthly_hours.setter
+    def monthly_hours(self, monthly_hours):
+        self._monthly_hours = monthly_hours
+        self._asking_hours = None
+        self._working_hours = None
+
+    @property
+    def asking_hours(self):
+        """
+        Typed asking day entries, parsed from monthly_hours on first access.
+        """
+        if self._asking_hours is None:
+            self._asking_hours = parse_hours(self._monthly_hours.get('asking_hours_data', []))
+        return self._asking_hours
+
+    @property
+    def working_hours(self):
+        """
+        Typed working day entries, parsed from monthly_hours on first access.
+        """
+        if self._working_hours is None:
+            self._working_hours = parse_hours(self._monthly_hours.get('working_hours_data', []))
+        return self._working_hours
 
     def update_hours(self, starting_asking_hours, starting_working_hours, total_asking_hours, total_working_hours, asking_hours_data, working_hours_data):
         """
@@ -47,6 +86,28 @@ class CrewMemberHours:
             'working_hours_data': working_hours_data
         }
 
+    def parse_hours_data(self):
+        """
+        Drops the typed arrays so they are parsed again from monthly_hours. Call this
+        after changing the day entries of monthly_hours in place.
+        """
+        self._asking_hours = None
+        self._working_hours = None
+
+    def get_total_asking_hours(self):
+        """
+        Returns the month's asking total: starting asking hours plus every asking
+        and working entry of the month.
+        """
+        return self.monthly_hours.get('starting_asking_hours', 0) + sum_hours(self.asking_hours) + sum_hours(self.working_hours)
+
+    def get_total_working_hours(self):
+        """
+        Returns the month's working total: starting working hours plus every
+        working entry of the month.
+        """
+        return self.monthly_hours.get('starting_working_hours', 0) + sum_hours(self.working_hours)
+
     def get_hours(self):
         """
         Retrieves the monthly hours data for a specific month.
@@ -107,14 +168,28 @@ class CrewMemberHours:
             CrewMemberHours: An instance of CrewMemberHours class populated with the data.
         """
         name = list(data.keys())[0]
-        crew_member = cls(name)
-        
-        if "monthly_hours" in data[name]:
-            crew_member.monthly_hours = data[name]["monthly_hours"]
-        else:
-            crew_member.monthly_hours = {}
+        crew_member = cls(name, data[name].get("monthly_hours"))
         
         return crew_member
+
+    @classmethod
+    def from_month_data(cls, month_data):
+        """
+        Bulk counterpart to from_dict: builds the CrewMemberHours instances of a whole
+        month straight from the loaded document, without wrapping each member in an
+        intermediate dictionary.
+
+        Args:
+            month_data (dict): keys are crew member names, and the values are 
+            dictionaries containing the monthly hours data.
+
+        Returns:
+            dict: crew member names mapped to CrewMemberHours instances, in roster order.
+        """
+        return {
+            name: cls(name, member_data["monthly_hours"])
+            for name, member_data in month_data.items()
+        }
     
 
     def __repr__(self):
@@ -9,6 +9,7 @@ from tkinter import messagebox
 
 # Local Application/Library Specific Imports
 import functions.logging_config as logging_config
+from functions.hours_functions import parse_hours, sum_hours
 from functions.header_functions import get_user_id
 from constants import TRACKING_LOGS_DIR
 from constants import ASKING_HRS_BG_COLOR, ASKING_HRS_FG_COLOR
@@ -42,6 +43,9 @@ class HrsMatrixFrame(tk.Frame):
         self.working_hours_entries = []  # List to store the created entries
         self.asking_hours_entries = []  # List to store the created entries
         self.asking_hours_tracking = []  # List to store the tracked asking hour labels
+        self.entry_positions = {}  # Maps each entry to its typed array and column
+        self.working_hours = parse_hours([])  # Typed working hours, one per column
+        self.asking_hours = parse_hours([])  # Typed asking hours, one per column
         self.labels = []  # List to store the created labels
         
         self.cols = cols
@@ -161,6 +165,7 @@ class HrsMatrixFrame(tk.Frame):
                 entry=working_hours_entry: [self.update_column_sums(event), self.entry_modified(entry)]
             )
             self.working_hours_entries.append(working_hours_entry)
+            self.entry_positions[working_hours_entry] = ("working_hours", j)
 
             asking_hours_entry = tk.Entry(
                 column_frame, width=4,
@@ -177,6 +182,7 @@ class HrsMatrixFrame(tk.Frame):
                 entry=asking_hours_entry: [self.update_column_sums(event), self.entry_modified(entry)]
             )
             self.asking_hours_entries.append(asking_hours_entry)
+            self.entry_positions[asking_hours_entry] = ("asking_hours", j)
 
             working_hours_entry.bind("<FocusIn>", self.on_entry_focus)
             asking_hours_entry.bind("<FocusIn>", self.on_entry_focus)
@@ -238,53 +244,44 @@ class HrsMatrixFrame(tk.Frame):
                 asking_hours_entry.grid(row=i*2+1, column=j+1, padx=5, pady=0)
                 self.asking_hours_entries.append(asking_hours_entry)
                 
-    def update_column_sums(self, event):
-        total_working_hours = 0
-        total_asking_hours = 0
-        for col in range(self.cols):
-            working_hours_sum = 0
-            asking_hours_sum = 0
-
-            for row in range(len(self.labels)):
-                working_hours_entry = self.working_hours_entries[row * self.cols + col]
-                asking_hours_entry = self.asking_hours_entries[row * self.cols + col]
-
-                working_hours_value = working_hours_entry.get()
-                asking_hours_value = asking_hours_entry.get()
-
-                if working_hours_value:
-                    try:
-                        working_hours_sum += int(working_hours_value)
-                    except ValueError:
-                        pass
-
-                if asking_hours_value:
-                    try:
-                        asking_hours_sum += int(asking_hours_value)
-                    except ValueError:
-                        pass
+    def read_hours_from_entries(self):
+        """
+        Parses every working and asking entry into the typed day arrays.
+        """
+        self.working_hours = parse_hours([entry.get() for entry in self.working_hours_entries])
+        self.asking_hours = parse_hours([entry.get() for entry in self.asking_hours_entries])
 
-            # Update total sums
-            total_working_hours += working_hours_sum
-            total_asking_hours += asking_hours_sum
+    def read_hours_from_entry(self, entry):
+        """
+        Parses a single edited entry into its slot of the typed day arrays.
+        """
+        array_name, col = self.entry_positions[entry]
+        hours = getattr(self, array_name)
+        if col < len(hours):
+            hours[col] = parse_hours([entry.get()])[0]
+        else:
+            self.read_hours_from_entries()
 
-            if col == 0:
-                # For the first column, use the starting asking hours as the base value
-                cumulative_sum = self.starting_asking_hours + working_hours_sum + asking_hours_sum
-            else:
-                # For subsequent columns, use the previous column's cumulative sum as the base value
-                previous_sum = int(self.asking_hours_tracking[col - 1].cget("text"))
-                cumulative_sum = previous_sum + working_hours_sum + asking_hours_sum
+    def update_column_sums(self, event):
+        if event is None or event.widget not in self.entry_positions:
+            self.read_hours_from_entries()
+        else:
+            self.read_hours_from_entry(event.widget)
 
-            self.asking_hours_tracking[col].config(text=str(cumulative_sum))
+        # Each column adds its working and asking hours to the running asking total,
+        # starting from the member's starting asking hours
+        cumulative_sum = self.starting_asking_hours
+        for col, asking_hours_tracking_label in enumerate(self.asking_hours_tracking):
+            cumulative_sum += max(self.working_hours[col], 0) + max(self.asking_hours[col], 0)
+            asking_hours_tracking_label.config(text=str(cumulative_sum))
 
         # Use the value from the last asking_hours_tracking label for total asking hours
         if self.asking_hours_tracking:
-            last_asking_hours_value = self.asking_hours_tracking[-1].cget("text")
+            last_asking_hours_value = str(cumulative_sum)
         else:
             last_asking_hours_value = "0"  # Default to "0" if the list is empty
 
-        self.total_working_hours_value = total_working_hours + self.starting_working_hours
+        self.total_working_hours_value = sum_hours(self.working_hours) + self.starting_working_hours
         
         # Update the total hours labels
         self.total_working_hours_label.config(text=str(self.total_working_hours_value))
@@ -1,56 +1,34 @@
 # PEP8 Compliant Guidance
 # Standard Library Imports
 import os
-import json
 import logging
 import tkinter as tk
 
 # Third-Party Library Imports
 
 # Local Application/Library Specific Imports
-from PathConfig import get_shared_path
+from PathConfig import get_paths
 from constants import APP_BG_COLOR, FG_COLOR
 from functions.header_functions import get_user_id
 from functions.app_functions import apply_entry_color_specs
+from functions.json_functions import load_overtime_slots_data, save_overtime_slots_data
+from functions.sqlite_functions import uses_database
+from functions.sqlite_functions import load_overtime_slots_from_db, save_overtime_slots_to_db
 
 def save_overtime_slots(data, crew, month, year, num_slots):
-    shared_path = get_shared_path() or os.getcwd()
-    json_dir = os.path.normpath(os.path.join(shared_path, "SaveFiles", "OT_Slots"))
-    os.makedirs(json_dir, exist_ok=True)  # Ensure the directory exists
-    json_filepath = os.path.normpath(os.path.join(json_dir, f"OT_{crew}_{year}.json"))
+    json_filepath = get_paths().get_slots_filepath(crew, year)
+    if uses_database(json_filepath):
+        save_overtime_slots_to_db(data, crew, month, year, num_slots)
+        return
 
-    if not os.path.exists(os.path.normpath(json_filepath)):
-        # If the file does not exist, create an initial structure
-        existing_data = {'month': {}}
-    else:
-        with open(json_filepath, 'r') as file:
-            existing_data = json.load(file)
-
-    if str(month) not in existing_data['month']:
-        existing_data['month'][str(month)] = {}
-
-    existing_data['month'][str(month)]['count'] = num_slots
-
-    for slot, hours in data.items():
-        existing_data['month'][str(month)][slot] = hours
-
-    with open(json_filepath, 'w') as file:
-        json.dump(existing_data, file, indent=4)
+    save_overtime_slots_data(data, crew, month, year, num_slots)
 
 def load_overtime_slots(crew, month, year):
-    shared_path = get_shared_path() or os.getcwd()
-    json_dir = os.path.normpath(os.path.join(shared_path, "SaveFiles", "OT_Slots"))
-    os.makedirs(json_dir, exist_ok=True)  # Ensure the directory exists
-    json_filepath = os.path.normpath(os.path.join(json_dir, f"OT_{crew}_{year}.json"))
-
-    if not os.path.exists(os.path.normpath(json_filepath)):
-        return {}, 3  # Return an empty dictionary and default to 3 slots if the file does not exist
-
-    with open(json_filepath, 'r') as file:
-        data = json.load(file)
+    json_filepath = get_paths().get_slots_filepath(crew, year)
+    if uses_database(json_filepath):
+        return load_overtime_slots_from_db(crew, month, year)
 
-    num_slots = data['month'].get(str(month), {}).get('count', 3)
-    return data['month'].get(str(month), {}), num_slots
+    return load_overtime_slots_data(crew, month, year)
 
 
 class OvertimeSlots(tk.Frame):
@@ -1,18 +1,102 @@
 import os
+import threading
+
+CONFIG_DIR = os.path.normpath(os.path.join(os.getcwd(), "SaveFiles", "UserRegistry"))
+CONFIG_FILE = os.path.normpath(os.path.join(CONFIG_DIR, "shared_path.txt"))
+
+_lock = threading.Lock()
+_shared_path = None
+_loaded = False
+_paths = None
 
 def get_shared_path():
-    config_file = os.path.normpath(os.path.join(os.getcwd(), "SaveFiles", "UserRegistry", "shared_path.txt"))
-    if os.path.exists(os.path.normpath(config_file)):
-        with open(config_file, 'r') as file:
-            return file.read().strip()
-    return None
+    """
+    Returns the configured shared path, or None if none is set. The config file is
+    read once; save_shared_path() updates the cached value.
+    """
+    global _shared_path, _loaded
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                if os.path.exists(CONFIG_FILE):
+                    with open(CONFIG_FILE, 'r') as file:
+                        _shared_path = file.read().strip() or None
+                _loaded = True
+    return _shared_path
 
 def save_shared_path(path):
-    config_dir = os.path.normpath(os.path.join(os.getcwd(), "SaveFiles", "UserRegistry"))
-    config_file = os.path.normpath(os.path.join(config_dir, "shared_path.txt"))
-    
+    global _shared_path, _loaded, _paths
     # Create the directory if it doesn't exist
-    os.makedirs(config_dir, exist_ok=True)
-    
-    with open(config_file, 'w') as file:
-        file.write(path)
\ No newline at end of file
+    os.makedirs(CONFIG_DIR, exist_ok=True)
+
+    with open(CONFIG_FILE, 'w') as file:
+        file.write(path)
+
+    with _lock:
+        _shared_path = path.strip() or None
+        _loaded = True
+        _paths = None
+
+def get_schedule_prefix(schedule_type):
+    if schedule_type == "Overtime":
+        return "OT"
+    if schedule_type == "OT_Slots":
+        return "OT_Slots"
+    return "WS"
+
+
+class SharedPaths:
+    """
+    The folders and file paths under SaveFiles for one shared path, computed once.
+    Use get_paths() for the instance matching the current configuration.
+
+    Args:
+        shared_path (str or None): The shared path, or None to use the working directory.
+    """
+    def __init__(self, shared_path):
+        self.shared_path = shared_path
+        self.save_folder = os.path.normpath(os.path.join(shared_path or os.getcwd(), "SaveFiles"))
+        self.journal_folder = os.path.normpath(os.path.join(self.save_folder, ".journal"))
+        self.slots_folder = os.path.normpath(os.path.join(self.save_folder, "OT_Slots"))
+        self.database_path = os.path.normpath(os.path.join(self.save_folder, "plan_matrix.db"))
+        self.archive_folder = os.path.normpath(os.path.join(self.save_folder, "Archive"))
+        self.schedule_paths = {}
+        self.slots_paths = {}
+
+    def get_schedule_filepath(self, crew, year, schedule_type):
+        """
+        Returns the year-file path of a crew-year schedule. Other layouts derive
+        their folders from the same name without the extension.
+        """
+        key = (crew, int(year), schedule_type)
+        path = self.schedule_paths.get(key)
+        if path is None:
+            path = os.path.normpath(os.path.join(self.save_folder, f"{get_schedule_prefix(schedule_type)}_{crew}_{year}.json"))
+            self.schedule_paths[key] = path
+        return path
+
+    def get_schedule_dirpath(self, crew, year, schedule_type):
+        return self.get_schedule_filepath(crew, year, schedule_type)[:-len(".json")]
+
+    def get_slots_filepath(self, crew, year):
+        key = (crew, int(year))
+        path = self.slots_paths.get(key)
+        if path is None:
+            path = os.path.normpath(os.path.join(self.slots_folder, f"OT_{crew}_{year}.json"))
+            self.slots_paths[key] = path
+        return path
+
+    def get_archive_filepath(self, crew, year, schedule_type):
+        return os.path.normpath(os.path.join(self.archive_folder, f"{get_schedule_prefix(schedule_type)}_{crew}_{year}.json.xz"))
+
+def get_paths():
+    """
+    Returns the SharedPaths of the configured shared path. The instance is reused
+    until save_shared_path() changes the path.
+    """
+    global _paths
+    paths = _paths
+    if paths is None:
+        paths = SharedPaths(get_shared_path())
+        _paths = paths
+    return paths
@@ -10,6 +10,8 @@ import customtkinter as ctk # type: ignore
 
 # Local Application/Library Specific Imports
 from functions.json_functions import save_legend_job_codes
+from functions.json_functions import load_month_ranking
+from functions.hours_functions import sum_hours
 from constants import APP_BG_COLOR, PANE_BG_COLOR, TEXT_COLOR
 from constants import ASKING_HRS_FG_COLOR, ASKING_HRS_BG_COLOR
 from constants import WORKING_HRS_FG_COLOR, WORKING_HRS_BG_COLOR
@@ -23,6 +25,7 @@ class RankingFrame(ctk.CTkFrame):
         super().__init__(parent, bg_color=PANE_BG_COLOR, fg_color=PANE_BG_COLOR)
         self.schedule_hrs_frame = schedule_hrs_frame
         self.num_exclusions = tk.IntVar(value=2)
+        self.edited_members = set()
         self.build_frame()
 
     def build_frame(self):
@@ -220,40 +223,52 @@ class RankingFrame(ctk.CTkFrame):
         return frame
     
     def calculate_total_working_hours(self, member_frame):
-        total_working_hours = int(member_frame.starting_working_hours)
-        for entry in member_frame.working_hours_entries:
-            try:
-                total_working_hours += int(entry.get() or 0)
-            except ValueError:
-                # Skip the entry if it is not a valid integer
-                pass
-        return total_working_hours
+        # The member frame keeps its working hours parsed as a typed array
+        return int(member_frame.starting_working_hours) + sum_hours(member_frame.working_hours)
 
     def calculate_total_asking_hours(self, member_frame):
         return int(member_frame.asking_hours_tracking[-1].cget("text"))
 
+    def create_ranking_row(self, row, member_name, total_working_hours, total_asking_hours):
+        name_frame = self.create_label_frame(self, member_name, is_name=True)
+        name_frame.grid(row=row, column=0, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
+
+        tw_frame = self.create_label_frame(self, total_working_hours, is_working_hours=True)
+        tw_frame.grid(row=row, column=1, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
+
+        ta_frame = self.create_label_frame(self, total_asking_hours, is_name=False, is_working_hours=False)
+        ta_frame.grid(row=row, column=2, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
+
+        return name_frame, tw_frame, ta_frame
+
     def create_ranking_labels(self):
-        if not self.schedule_hrs_frame.frames:
+        if self.schedule_hrs_frame.schedule_type != "Overtime":
             return
-        
-        num_exclusions = self.num_exclusions.get()
-        
-        self.ranking_labels = []
-        for i, member_frame in enumerate(self.schedule_hrs_frame.frames[num_exclusions:], start=1):
-            member_name = member_frame.labels[0].cget("text")
-            total_working_hours = self.calculate_total_working_hours(member_frame)
-            total_asking_hours = self.calculate_total_asking_hours(member_frame)
 
-            name_frame = self.create_label_frame(self, member_name, is_name=True)
-            name_frame.grid(row=i, column=0, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
-
-            tw_frame = self.create_label_frame(self, total_working_hours, is_working_hours=True)
-            tw_frame.grid(row=i, column=1, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
+        # The saved ranking comes from the month index, so the pane does not wait
+        # for the grid widgets to be built
+        user_selections = self.schedule_hrs_frame.user_selections
+        self.ranking = load_month_ranking(
+            user_selections['selected_crew'],
+            user_selections['selected_month'].month,
+            user_selections['selected_year'].year,
+            self.num_exclusions.get()
+        )
+        self.ranking_totals = {
+            name: (totals['total_working_hours'], totals['total_asking_hours'])
+            for name, totals in self.ranking['totals'].items()
+        }
 
-            ta_frame = self.create_label_frame(self, total_asking_hours, is_name=False, is_working_hours=False)
-            ta_frame.grid(row=i, column=2, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
+        # Members edited since the month was loaded show their unsaved totals
+        for member_frame in self.schedule_hrs_frame.frames:
+            member_name = member_frame.labels[0].cget("text")
+            if member_name in self.edited_members and member_name in self.ranking_totals:
+                self.ranking_totals[member_name] = (self.calculate_total_working_hours(member_frame), self.calculate_total_asking_hours(member_frame))
 
-            self.ranking_labels.append((name_frame, tw_frame, ta_frame))
+        self.ranking_labels = []
+        for i, member_name in enumerate(self.ranking['members'], start=1):
+            total_working_hours, total_asking_hours = self.ranking_totals[member_name]
+            self.ranking_labels.append(self.create_ranking_row(i, member_name, total_working_hours, total_asking_hours))
 
         self.update_scrollbar()
             
@@ -264,38 +279,22 @@ class RankingFrame(ctk.CTkFrame):
             if entry_value != '':
                 return
         
-        # Update the totals and labels
         member_name = member_frame.labels[0].cget("text")
+        self.edited_members.add(member_name)
+        if self.schedule_hrs_frame.frames.index(member_frame) < self.num_exclusions.get():
+            return
+
+        # Update the member's totals, the rest of the ranking is unchanged
         total_working_hours = self.calculate_total_working_hours(member_frame)
         total_asking_hours = self.calculate_total_asking_hours(member_frame)
+        self.ranking_totals[member_name] = (total_working_hours, total_asking_hours)
 
-        num_exclusions = self.num_exclusions.get()
-        row_index = self.schedule_hrs_frame.frames.index(member_frame) - num_exclusions
-
-        if row_index < len(self.ranking_labels) and row_index >= 0:
-            name_frame, tw_frame, ta_frame = self.ranking_labels[row_index]
-            name_frame.winfo_children()[0].configure(text=member_name)
-            tw_frame.winfo_children()[0].configure(text=total_working_hours)
-            ta_frame.winfo_children()[0].configure(text=total_asking_hours)
-        else:
-            if row_index >= 0:
-                name_frame = self.create_label_frame(self, member_name, is_name=True)
-                name_frame.grid(row=row_index+num_exclusions, column=0, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
+        if member_name not in self.ranking['members']:
+            # Added since the month was saved
+            self.ranking['members'].append(member_name)
+            self.ranking_labels.append(self.create_ranking_row(len(self.ranking_labels) + 1, member_name, total_working_hours, total_asking_hours))
 
-                tw_frame = self.create_label_frame(self, total_working_hours, is_working_hours=True)
-                tw_frame.grid(row=row_index+num_exclusions, column=1, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
-
-                ta_frame = self.create_label_frame(self, total_asking_hours, is_name=False, is_working_hours=False)
-                ta_frame.grid(row=row_index+num_exclusions, column=2, padx=2, pady=5, sticky="ew", in_=self.inner_frame)
-
-                self.ranking_labels.append((name_frame, tw_frame, ta_frame))
-            
-        # Toggle the sort switch to update the ranking
-        current_sort_state = self.sort_switch_var.get()
-        if current_sort_state == "asking":
-            self.sort_by_asking_hours() 
-        else:
-            self.sort_by_working_hours()        
+        self.sort_ranking_labels()
         
     def update_scrollbar(self):
         if hasattr(self, 'canvas') and self.canvas:
@@ -336,32 +335,31 @@ class RankingFrame(ctk.CTkFrame):
         )
 
     def sort_ranking_labels(self, sort_key=None, reverse=True, update_lowest=True):
-        num_exclusions = self.num_exclusions.get()
-        
-        ranking_data = []
-        for i, member_frame in enumerate(self.schedule_hrs_frame.frames[num_exclusions:], start=1):
-            member_name = member_frame.labels[0].cget("text")
-            total_working_hours = self.calculate_total_working_hours(member_frame)
-            total_asking_hours = self.calculate_total_asking_hours(member_frame)
-            ranking_data.append((member_name, total_working_hours, total_asking_hours))
-
         if self.sort_switch_var.get() == "asking":
             sort_key = self.sort_by_asking_hours_key
         else:
             sort_key = self.sort_by_working_hours_key
-        
-        ranking_data.sort(key=sort_key, reverse=True)
+
+        if self.edited_members:
+            # Unsaved edits are ranked from the live totals
+            ranking_data = [(member_name, *self.ranking_totals[member_name]) for member_name in self.ranking['members']]
+            ranking_data.sort(key=sort_key, reverse=True)
+            lowest_asking_person = min(ranking_data, key=lambda x: x[2])[0] if ranking_data else None
+            lowest_working_person = min(ranking_data, key=lambda x: x[1])[0] if ranking_data else None
+        else:
+            order = self.ranking['by_asking'] if self.sort_switch_var.get() == "asking" else self.ranking['by_working']
+            ranking_data = [(member_name, *self.ranking_totals[member_name]) for member_name in order]
+            lowest_asking_person = self.ranking['lowest_asking']
+            lowest_working_person = self.ranking['lowest_working']
 
         if update_lowest and ranking_data:
-            lowest_asking_person = min(ranking_data, key=lambda x: x[2])
-            lowest_working_person = min(ranking_data, key=lambda x: x[1])
             if self.schedule_hrs_frame.schedule_type == "work_schedule":
                 self.lowest_asking_label.configure(text="")
             else:
                 if self.sort_switch_var.get() == "asking":
-                    self.lowest_asking_label.configure(text=f"Lowest Asking: {lowest_asking_person[0]}", text_color=ASKING_HRS_BG_COLOR)
+                    self.lowest_asking_label.configure(text=f"Lowest Asking: {lowest_asking_person}", text_color=ASKING_HRS_BG_COLOR)
                 else:
-                    self.lowest_asking_label.configure(text=f"Lowest Working: {lowest_working_person[0]}", text_color=WORKING_HRS_BG_COLOR)
+                    self.lowest_asking_label.configure(text=f"Lowest Working: {lowest_working_person}", text_color=WORKING_HRS_BG_COLOR)
         else:
             self.lowest_asking_label.configure(text="")
 
@@ -373,7 +371,10 @@ class RankingFrame(ctk.CTkFrame):
 
         self.update_scrollbar()
             
-    def rebuild_ranking_system(self):
+    def rebuild_ranking_system(self, clear_edits=False):
+        if clear_edits:
+            # The month was reloaded, so the saved ranking is current again
+            self.edited_members.clear()
         self.build_frame()
         # Clear the existing ranking labels
         if self.schedule_hrs_frame.schedule_type == "Overtime":
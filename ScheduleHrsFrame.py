@@ -12,7 +12,13 @@ import customtkinter as ctk # type: ignore
 from functions.app_functions import lock_widgets
 from functions.app_functions import apply_entry_color_specs
 from functions.app_functions import lock_and_color_entry_widgets
+from functions.app_functions import show_save_conflicts
 from functions.json_functions import load_hours_data_from_json, save_hours_data_to_json
+from functions.json_functions import flush_pending_writes, hold_schedule_locks
+from functions.json_functions import adjust_starting_hours, load_year_index, rank_members
+from functions.write_functions import WriteJournal
+from functions.storage_functions import OT_SLOTS
+from functions.hours_functions import format_hours, sum_hours
 from constants import log_file
 from constants import APP_BG_COLOR, TEXT_COLOR
 from constants import SCROLLBAR_FG_COLOR, SCROLLBAR_HOVER_COLOR
@@ -182,73 +188,74 @@ class ScheduleHrsFrame(tk.Frame):
             month_str = str(month_number)
 
             if self.schedule_type == "Overtime":
-                for i, frame in enumerate(self.frames, start=2):
+                # Load the month once and reuse it for every crew member
+                existing_data = load_hours_data_from_json(self.user_selections['selected_crew'], self.user_selections['selected_month'].month, self.user_selections['selected_year'].year, self.schedule_type)
+                changed_members = {}
+
+                for frame in self.frames:
                     name = frame.labels[0].cget("text")
-                    if name not in self.crew_member_hours:
-                        self.crew_member_hours[name] = CrewMemberHours(name)
-                    
-                    member = self.crew_member_hours[name]
+                    frame.read_hours_from_entries()
+                    working_hours = frame.working_hours
+                    asking_hours = frame.asking_hours
 
-                    # Retrieve the existing starting hours and total hours from the JSON file
-                    existing_data = load_hours_data_from_json(self.user_selections['selected_crew'], self.user_selections['selected_month'].month, self.user_selections['selected_year'].year, self.schedule_type)
+                    # Retrieve the existing starting hours from the loaded month
                     existing_member_data = existing_data.get(name)
                     if existing_member_data:
                         existing_monthly_hours = existing_member_data.monthly_hours
+                        
+                        # Members whose entries did not change keep their stored totals
+                        if (existing_member_data.working_hours == working_hours and
+                                existing_member_data.asking_hours == asking_hours):
+                            continue
+                        
                         starting_asking_hours = existing_monthly_hours.get('starting_asking_hours', 0)
                         starting_working_hours = existing_monthly_hours.get('starting_working_hours', 0)
-                        total_asking_hours = existing_monthly_hours.get('total_asking_hours', 0)
-                        total_working_hours = existing_monthly_hours.get('total_working_hours', 0)
                     else:
                         starting_asking_hours = 0
                         starting_working_hours = 0
-                        total_asking_hours = 0
-                        total_working_hours = 0
 
+                    total_working_hours = sum_hours(working_hours) + int(starting_working_hours)
+                    
+                    total_asking_hours = (
+                        sum_hours(asking_hours) +
+                        sum_hours(working_hours) +
+                        int(starting_asking_hours)
+                    )
+
+                    member = self.crew_member_hours.get(name) or CrewMemberHours(name)
                     member.monthly_hours = {
                         'starting_asking_hours': starting_asking_hours,
                         'starting_working_hours': starting_working_hours,
                         'total_asking_hours': total_asking_hours,
                         'total_working_hours': total_working_hours,
-                        'asking_hours_data': [],
-                        'working_hours_data': []
+                        'asking_hours_data': format_hours(asking_hours),
+                        'working_hours_data': format_hours(working_hours)
                     }
+                    self.crew_member_hours[name] = member
+                    changed_members[name] = member
 
-                    monthly_hours = member.monthly_hours
-                    working_hours_data = [entry.get() for entry in frame.working_hours_entries]
-                    asking_hours_data = [entry.get() for entry in frame.asking_hours_entries]
-
-                    monthly_hours['working_hours_data'] = working_hours_data
-                    monthly_hours['asking_hours_data'] = asking_hours_data
-
-                    monthly_hours['total_working_hours'] = sum(
-                        int(hours) for hours in working_hours_data if hours.isdigit()
-                    ) + int(monthly_hours['starting_working_hours'])
-                    
-                    monthly_hours['total_asking_hours'] = (
-                        sum(int(hours) for hours in asking_hours_data if hours.strip()) +
-                        sum(int(hours) for hours in working_hours_data if hours.strip()) +
-                        int(monthly_hours['starting_asking_hours'])
-)
-                save_hours_data_to_json(self.crew_member_hours, self.user_selections['selected_crew'], self.user_selections['selected_year'].year, self.schedule_type, month_number)
+                # Write only the edited members; nothing to propagate if none changed
+                if changed_members:
+                    save_hours_data_to_json(changed_members, self.user_selections['selected_crew'], self.user_selections['selected_year'].year, self.schedule_type, month_number)
                 
             elif self.schedule_type == "work_schedule":
-                for i, frame in enumerate(self.work_schedule_frames, start=2):
+                saved_members = {}
+                for frame in self.work_schedule_frames:
                     name = frame.labels[0].cget("text")
-                    if name not in self.crew_member_hours:
-                        self.crew_member_hours[name] = CrewMemberHours(name)
-
-                    member = self.crew_member_hours[name]
+                    role_data = [entry.get() for entry in frame.crew_member_role_entries]
 
-                    # Ensure monthly hours are initialized
-                    if month_str not in member.monthly_hours:
-                        member.monthly_hours[month_str] = {
-                            'entry_data': []
+                    # A new dict rather than an edit of the loaded one, which belongs to
+                    # the cached document and must stay as loaded until it is marked dirty
+                    member = self.crew_member_hours.get(name) or CrewMemberHours(name)
+                    member.monthly_hours = {
+                        month_str: {
+                            'entry_data': role_data
                         }
+                    }
+                    self.crew_member_hours[name] = member
+                    saved_members[name] = member
 
-                    role_data = [entry.get() for entry in frame.crew_member_role_entries]
-                    member.monthly_hours[month_str]['entry_data'] = role_data
-
-                save_hours_data_to_json(self.crew_member_hours, self.user_selections['selected_crew'], self.user_selections['selected_year'].year, self.schedule_type, month_number)
+                save_hours_data_to_json(saved_members, self.user_selections['selected_crew'], self.user_selections['selected_year'].year, self.schedule_type, month_number)
                 self.overtime_frame.save_overtime_data()
 
         except Exception as e:
@@ -258,29 +265,20 @@ class ScheduleHrsFrame(tk.Frame):
     
     #TODO: Testing Phase
     def reset_hours_for_new_year(self):
+        """
+        Re-seeds the January starting hours of the selected Overtime year from the
+        previous year's December rankings, e.g. after December was corrected once
+        the new year had been rolled over, and reloads the displayed month.
+        """
         if self.schedule_type == "Overtime":
-            prev_year = self.user_selections['selected_year'].year - 1
-            prev_crew = self.user_selections['selected_crew']
-            prev_year_data = load_hours_data_from_json(prev_crew, prev_year, self.schedule_type)
-            ranking_data = [(name, member.monthly_hours[12]['total_working_hours'], member.monthly_hours[12]['total_asking_hours'])
-                            for name, member in prev_year_data.items()]
-            ranking_data.sort(key=lambda x: x[1])
-            working_hours_ranks = {name: rank for rank, (name, _, _) in enumerate(ranking_data)}
-            ranking_data.sort(key=lambda x: x[2])
-            asking_hours_ranks = {name: rank for rank, (name, _, _) in enumerate(ranking_data)}
-            
-            current_year = self.user_selections['selected_year'].year
-            current_crew = self.user_selections['selected_crew']
-            current_year_data = self.crew_member_hours
-            
-            for name, member in current_year_data.items():
-                member.monthly_hours[1]['starting_working_hours'] = working_hours_ranks[name]
-                member.monthly_hours[1]['starting_asking_hours'] = asking_hours_ranks[name]
-                member.monthly_hours[1]['total_working_hours'] = working_hours_ranks[name]
-                member.monthly_hours[1]['total_asking_hours'] = asking_hours_ranks[name]
-            
-            save_hours_data_to_json(current_year_data, current_crew, current_year, self.schedule_type, 1)
-                
+            crew = self.user_selections['selected_crew']
+            year = self.user_selections['selected_year'].year
+            prev_year_totals = load_year_index(crew, year - 1, self.schedule_type)["months"].get("12", {}).get("totals", {})
+            working_hours_ranks, asking_hours_ranks = rank_members(prev_year_totals)
+
+            adjust_starting_hours(crew, year, {name: (working_hours_ranks[name], asking_hours_ranks[name]) for name in prev_year_totals})
+            self.crew_member_hours = load_hours_data_from_json(crew, self.user_selections['selected_month'].month, year, self.schedule_type)
+
     def recalculate_hours(self, name, start_month, adjustment):
         # Recalculate starting hours and total hours for subsequent months
         crew_member = self.crew_member_hours.get(name)
@@ -407,7 +405,7 @@ class ScheduleHrsFrame(tk.Frame):
         self.adjust_canvas_size()
 
         if self.ranking_frame:
-            self.ranking_frame.rebuild_ranking_system()
+            self.ranking_frame.rebuild_ranking_system(clear_edits=True)
 
         def check_frames_created():
             if self.schedule_type == "Overtime":
@@ -456,9 +454,20 @@ class ScheduleHrsFrame(tk.Frame):
         """
 
         self.selected_month = self.user_selections['selected_month'].month
-        self.save_workbook_data(self.selected_month)
-        if self.schedule_type == "work_schedule":
-            self.overtime_frame.save_overtime_data()
+        conflicts = []
+        try:
+            # The schedule, its propagated totals and the OT slots land together or not at all
+            with WriteJournal():
+                schedule_types = [self.schedule_type, OT_SLOTS] if self.schedule_type == "Overtime" else [self.schedule_type]
+                hold_schedule_locks(self.user_selections['selected_crew'], [self.user_selections['selected_year'].year], schedule_types)
+                self.save_workbook_data(self.selected_month)
+                conflicts = flush_pending_writes()
+        except Exception as e:
+            logging.error(f"An error occurred while writing data to JSON file: {str(e)}")
+            messagebox.showerror("Error", "An error occurred while saving the data.")
+        
+        if conflicts:
+            show_save_conflicts(conflicts)
         self.app.display_save_status()  # Ensure the save status is displayed
 
     def update_scrollbar(self):
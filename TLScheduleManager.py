@@ -14,8 +14,7 @@ import customtkinter as ctk # type: ignore
 
 # Local Application/Library Specific Imports  
 from functions.json_functions import adjust_crew_member_starting_hours
-from functions.json_functions import load_hours_data_from_json, save_new_crew_member
-from functions.json_functions import remove_crew_member, change_crew_member_name, move_person_data
+from functions.json_functions import load_hours_data_from_json, RosterTransaction
 from functions.app_functions import center_toplevel_window
 from constants import log_file
 from constants import load_icons
@@ -611,36 +610,33 @@ class TLScheduleManager(tk.Toplevel):
             # Get the current crew member names from the Treeview
             current_crew_member_names = [self.tree.item(name)['values'][0] for name in self.tree.get_children()]
             
-            # Handle new and existing crew members for the selected month and future months
-            for month in range(self.user_selections['selected_month'].month, 13):
-                for name in current_crew_member_names:
-                    if name not in overtime_data:
-                        save_new_crew_member(name, self.user_selections['selected_crew'], month, self.user_selections['selected_year'].year, "Overtime")
-                    
-                    if name not in work_schedule_data:
-                        save_new_crew_member(name, self.user_selections['selected_crew'], month, self.user_selections['selected_year'].year, "work_schedule")
-            
-            # Move the personnel data in the JSON files if they were moved
+            # Collect every roster change and write each schedule file once
+            transaction = RosterTransaction(self.user_selections['selected_crew'], self.user_selections['selected_year'].year, self.user_selections['selected_month'].month)
+
+            # Update the crew member names if they were edited
+            if self.edited_crew_members:
+                for old_name, new_name in self.edited_crew_members.items():
+                    transaction.rename_member(old_name, new_name)
+
+            # Remove the crew members if they were removed from the Treeview
+            if self.removed_crew_members:
+                for name in self.removed_crew_members:
+                    transaction.remove_member(name)
+
+            # Handle new crew members for the selected month and future months
+            renamed_to = set(self.edited_crew_members.values()) if self.edited_crew_members else set()
+            for name in current_crew_member_names:
+                if name in renamed_to:
+                    continue
+                if name not in overtime_data or name not in work_schedule_data:
+                    transaction.add_member(name)
+
+            # Reorder the personnel to match the Treeview if they were moved
             if self.moved_personnel:
-                for month in range(self.user_selections['selected_month'].month, 13):
-                    move_person_data(self.user_selections, self.moved_personnel, "Overtime")
-                    move_person_data(self.user_selections, self.moved_personnel, "work_schedule")
+                transaction.set_order(current_crew_member_names)
                 self.moved_personnel = []
-            
-            # Remove the crew members from the JSON files if they were removed from the Treeview
-            if self.removed_crew_members:
-                removed_crew_members_copy = self.removed_crew_members.copy()
-                for month in range(self.user_selections['selected_month'].month, 13):
-                    for name in removed_crew_members_copy:
-                        remove_crew_member(name, self.user_selections['selected_crew'], month, self.user_selections['selected_year'].year, "Overtime")
-                        remove_crew_member(name, self.user_selections['selected_crew'], month, self.user_selections['selected_year'].year, "work_schedule")
-                
-            # Update the crew member names in the JSON files if they were edited
-            if self.edited_crew_members:
-                for month in range(self.user_selections['selected_month'].month, 13):
-                    for old_name, new_name in self.edited_crew_members.items():
-                        change_crew_member_name(old_name, new_name, self.user_selections['selected_crew'], month, self.user_selections['selected_year'].year, "Overtime")
-                        change_crew_member_name(old_name, new_name, self.user_selections['selected_crew'], month, self.user_selections['selected_year'].year, "work_schedule")
+
+            transaction.commit()
             
             # Clear the edited and removed crew member lists
             self.edited_crew_members = {}
@@ -1,6 +1,5 @@
 # PEP8 Compliant Guidance
 # Standard Library Imports
-import json
 import tkinter as tk
 
 # Third-Party Library Imports
@@ -9,10 +8,10 @@ import customtkinter as ctk # type: ignore
 # Local Application/Library Specific Imports
 from constants import APP_BG_COLOR, PANE_BG_COLOR, TEXT_COLOR
 from constants import COLOR_SPECS, ASSIGNMENT_CODES
-from constants import LEGEND_CODES
 from constants import BG_COLOR
 from constants import load_icons
 import functions.app_functions as app_functions
+from functions.json_functions import load_legend_job_codes
 
 class WSLegendWindow(tk.Toplevel):
     def __init__(self, parent):
@@ -76,12 +75,8 @@ class WSLegendWindow(tk.Toplevel):
         )
         self.job_code_title_label.grid(row=0, column=0, columnspan=2, sticky="nsew", padx=10)
         
-        # Load job codes from the JSON file
-        try:
-            with open(LEGEND_CODES, 'r') as file:
-                job_codes = json.load(file)
-        except FileNotFoundError:
-            job_codes = {}
+        # Load job codes from the JSON file or the schedule database
+        job_codes = load_legend_job_codes()
         
         # Create labels dynamically using a loop
         for index, (title, code) in enumerate(job_codes.items(), start=1):
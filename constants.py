@@ -5,6 +5,7 @@ import csv
 import time
 import subprocess
 import threading
+import multiprocessing
 from tkinter import messagebox, filedialog
 from PIL import ImageTk
 from PathConfig import get_shared_path, save_shared_path
@@ -30,7 +31,9 @@ def map_network_drives():
     # Start the mapping process in a separate thread
     threading.Thread(target=mapping_thread, daemon=True).start()
 
-map_network_drives()
+# Worker processes (e.g. the SaveFiles migration pool) re-import this module
+if multiprocessing.parent_process() is None:
+    map_network_drives()
 
 def prompt_shared_path():
     shared_path = get_shared_path()
@@ -105,6 +108,22 @@ ACCESS_LEVEL_ENCRYPTION = os.path.normpath(os.path.join(shared_path, "SaveFiles"
 if not os.path.exists(os.path.normpath(ACCESS_LEVEL_ENCRYPTION)):
     open(ACCESS_LEVEL_ENCRYPTION, 'w').close()
 
+"""Storage"""
+# "year" keeps one JSON file per crew-year, "month" shards each crew-year into per-month files,
+# "log" appends each save's changes to a delta log that is compacted in the background,
+# "sqlite" keeps schedules, OT slots and legend codes in SaveFiles/plan_matrix.db
+STORAGE_LAYOUT = "year"
+# Schedule files are written as "pretty" (indented) JSON, "compact" JSON or "binary" (zlib-compressed);
+# every format is detected on read, so files written in another format still load. "pretty" is the
+# format the app has always written; switch to "compact" or "binary" only once every user has updated
+STORAGE_FORMAT = "pretty"
+# Local copy of the shared SaveFiles data files under the user profile; reads are served from it, writes go to the share
+LOCAL_MIRROR_DIR = os.path.normpath(os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "Plan_Matrix_App", "SaveFiles"))
+# Saves made while the share cannot be reached wait here until it is back
+LOCAL_OUTBOX_DIR = os.path.normpath(os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "Plan_Matrix_App", "Outbox"))
+# File stamps of the schedules the background integrity check has verified, so each session only re-checks changed files
+LOCAL_VERIFY_STATE = os.path.normpath(os.path.join(os.environ.get("LOCALAPPDATA", os.path.expanduser("~")), "Plan_Matrix_App", "verified.json"))
+
 """HrsMatrixFrame.py"""
 MEMBER_SAVE_DATA = os.path.normpath(os.path.join(os.getcwd(), "SaveFiles", "Crew_Member_Save_Data.csv"))
 
@@ -181,6 +181,26 @@ def set_theme(root, color, widget_type=None):
 
     apply_theme(root)
 
+def show_save_conflicts(conflicts):
+    """
+    Tells the user which cells another user saved with a different value while
+    this schedule was open. Their other changes were merged in; for these cells
+    the value entered here was kept.
+
+    Args:
+        conflicts (list[MergeConflict]): The conflicting cells.
+    """
+    lines = [
+        f"{conflict.member} (month {conflict.month}, {conflict.field}): kept {conflict.mine!r}, other user saved {conflict.theirs!r}"
+        for conflict in conflicts[:10]
+    ]
+    if len(conflicts) > 10:
+        lines.append(f"...and {len(conflicts) - 10} more")
+    messagebox.showwarning(
+        "Save Conflict",
+        "Another user changed some of the same cells while you were editing. Your values were kept for:\n\n" + "\n".join(lines)
+    )
+
 def center_toplevel_window(toplevel):
     """
     Center a Toplevel window on the screen.
@@ -0,0 +1,221 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+from array import array
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+
+# Typecode and blank marker of the typed day arrays
+HOURS_TYPECODE = 'i'
+BLANK_HOURS = -1
+
+def parse_hours(hours_data):
+    """
+    Converts a list of day entries as stored in JSON ("8", "") to a typed array.
+    Blanks and anything that is not a whole number become BLANK_HOURS.
+    """
+    return array(HOURS_TYPECODE, [int(hours) if hours.isdigit() else BLANK_HOURS for hours in hours_data])
+
+def format_hours(hours):
+    """
+    Converts a typed day array back to the JSON representation ("8", "").
+    """
+    return [str(value) if value != BLANK_HOURS else "" for value in hours]
+
+def sum_hours(hours):
+    """
+    Sums a typed day array, skipping blank days.
+    """
+    return sum(value for value in hours if value > 0)
+
+
+class CarryForward:
+    """
+    Carry-forward engine for the monthly totals of one Overtime crew-year.
+
+    Every month starts where the previous month ended:
+
+        starting_*_hours[m]     = total_*_hours[m - 1]
+        total_working_hours[m]  = total_working_hours[m - 1] + working entries in m
+        total_asking_hours[m]   = total_asking_hours[m - 1] + asking and working entries in m
+
+    Worked hours count towards the asking total, as in the month's hours grid.
+    Earlier versions carried only the asking entries into later months; running
+    "python -m functions.migration_functions migrate" once recomputes years saved
+    that way, see recompute_overtime_totals().
+
+    The engine keeps each member's monthly sums (the month's own delta) so carrying
+    an edit forward only adds integers month by month. Day arrays are parsed once
+    per month and again only after invalidate() is called for that month.
+
+    The results are identical to json_functions.update_subsequent_months().
+    """
+    def __init__(self):
+        self.month_sums = {}
+
+    def invalidate(self, month=None):
+        """
+        Drops the cached sums of a month whose day entries changed.
+
+        Args:
+            month (int or str, optional): Month to invalidate. Defaults to all.
+        """
+        if month is None:
+            self.month_sums.clear()
+        else:
+            self.month_sums.pop(str(month), None)
+
+    def get_month_sums(self, month_data, month):
+        """
+        Returns {name: (asking_sum, working_sum)} for a month, parsing the day
+        arrays only for members that have no cached sums yet.
+        """
+        sums = self.month_sums.setdefault(str(month), {})
+        for name, member_data in month_data.items():
+            if name not in sums:
+                monthly_hours = member_data['monthly_hours']
+                sums[name] = (
+                    sum_hours(parse_hours(monthly_hours['asking_hours_data'])),
+                    sum_hours(parse_hours(monthly_hours['working_hours_data']))
+                )
+        return sums
+
+    def propagate(self, document, month):
+        """
+        Carries the totals of a month into every following month of the document.
+
+        Args:
+            document (dict): The crew-year document with a "month" mapping.
+            month (int): The month whose totals changed.
+
+        Returns:
+            list[str]: The months that were updated.
+        """
+        updated_months = []
+        for subsequent_month in range(month + 1, 13):
+            subsequent_month_str = str(subsequent_month)
+            previous_month_str = str(subsequent_month - 1)
+            if subsequent_month_str not in document['month']:
+                continue
+
+            previous_month_data = document['month'].get(previous_month_str, {})
+            month_data = document['month'][subsequent_month_str]
+            sums = self.get_month_sums(month_data, subsequent_month_str)
+
+            for name, crew_member_data in month_data.items():
+                if name not in previous_month_data:
+                    continue
+                previous_hours = previous_month_data[name]['monthly_hours']
+                monthly_hours = crew_member_data['monthly_hours']
+                asking_sum, working_sum = sums[name]
+
+                monthly_hours['starting_asking_hours'] = previous_hours['total_asking_hours']
+                monthly_hours['starting_working_hours'] = previous_hours['total_working_hours']
+                monthly_hours['total_asking_hours'] = previous_hours['total_asking_hours'] + asking_sum + working_sum
+                monthly_hours['total_working_hours'] = previous_hours['total_working_hours'] + working_sum
+
+            updated_months.append(subsequent_month_str)
+        return updated_months
+
+    def recalculate(self, document, month):
+        """
+        Recomputes a month's totals from its starting hours and day entries, the way
+        saving the month does, then carries them into every following month.
+
+        Args:
+            document (dict): The crew-year document with a "month" mapping.
+            month (int): The first month to recompute.
+
+        Returns:
+            list[str]: The months that were updated.
+        """
+        month_str = str(month)
+        self.invalidate()
+        for member_data in document['month'].get(month_str, {}).values():
+            monthly_hours = member_data['monthly_hours']
+            asking_sum = sum_hours(parse_hours(monthly_hours['asking_hours_data']))
+            working_sum = sum_hours(parse_hours(monthly_hours['working_hours_data']))
+            monthly_hours['total_working_hours'] = monthly_hours['starting_working_hours'] + working_sum
+            monthly_hours['total_asking_hours'] = monthly_hours['starting_asking_hours'] + asking_sum + working_sum
+        return [month_str] + self.propagate(document, month)
+
+    def get_carry_months(self, document, name, month=1):
+        """
+        Returns the months a member's totals carry through from the given month:
+        that month and every following one until the member is missing.
+        """
+        months = []
+        for carry_month in range(month, 13):
+            if name not in document['month'].get(str(carry_month), {}):
+                break
+            months.append(str(carry_month))
+        return months
+
+    def shift(self, document, name, working_delta, asking_delta, month=1):
+        """
+        Applies a change of a member's starting hours as a delta. The starting and
+        total hours of the month and of every month they carry into move by the
+        same amount; the day entries, and so the cached sums, are unchanged.
+
+        Args:
+            document (dict): The crew-year document with a "month" mapping.
+            name (str): The crew member.
+            working_delta (int): Change of the starting working hours.
+            asking_delta (int): Change of the starting asking hours.
+            month (int, optional): The month whose starting hours changed. Defaults to 1.
+
+        Returns:
+            list[str]: The months that were updated.
+        """
+        months = self.get_carry_months(document, name, month)
+        for carry_month in months:
+            monthly_hours = document['month'][carry_month][name]['monthly_hours']
+            monthly_hours['starting_working_hours'] += working_delta
+            monthly_hours['total_working_hours'] += working_delta
+            monthly_hours['starting_asking_hours'] += asking_delta
+            monthly_hours['total_asking_hours'] += asking_delta
+        return months
+
+    def check(self, document, names=None):
+        """
+        Recomputes the starting and total hours of every member from the day entries
+        and reports the stored values that disagree. Each month must start where the
+        previous one ended, its working total is its starting hours plus its working
+        entries and its asking total its starting hours plus its asking and working
+        entries.
+
+        Args:
+            document (dict): The crew-year document with a "month" mapping.
+            names (iterable, optional): Only check these members. Defaults to all.
+
+        Returns:
+            list[tuple]: (month, name, field, stored, expected) for each mismatch.
+        """
+        names = None if names is None else set(names)
+        mismatches = []
+        for month in range(1, 13):
+            month_str = str(month)
+            if month_str not in document['month']:
+                continue
+            month_data = document['month'][month_str]
+            previous_month_data = document['month'].get(str(month - 1), {})
+            sums = self.get_month_sums(month_data, month_str)
+
+            for name, member_data in month_data.items():
+                if names is not None and name not in names:
+                    continue
+                monthly_hours = member_data['monthly_hours']
+                asking_sum, working_sum = sums[name]
+                expected = {
+                    'total_working_hours': monthly_hours['starting_working_hours'] + working_sum,
+                    'total_asking_hours': monthly_hours['starting_asking_hours'] + asking_sum + working_sum
+                }
+                if name in previous_month_data:
+                    previous_hours = previous_month_data[name]['monthly_hours']
+                    expected['starting_working_hours'] = previous_hours['total_working_hours']
+                    expected['starting_asking_hours'] = previous_hours['total_asking_hours']
+                for field, value in expected.items():
+                    if monthly_hours[field] != value:
+                        mismatches.append((month_str, name, field, monthly_hours[field], value))
+        return mismatches
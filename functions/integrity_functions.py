@@ -0,0 +1,117 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import json
+import hashlib
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+
+
+# Saved schedules carry an "integrity" record next to their months:
+#
+#   {"1": {"checksum": sha256 of the month, "members": int,
+#          "total_working_hours": int, "total_asking_hours": int}, ...}
+#
+# The totals are the sums of the members' month-end totals and are only kept for
+# the Overtime schedule. OT_Slots months count their slots as members. The year
+# file layouts store the record in the file, the month layout in index.json and
+# the delta log layout in its snapshot and in every log record.
+#
+# A record kept in a file is stamped with the document version it was built for
+# ("integrity_version"). Older builds keep the record as they found it while
+# saving new data, so a record whose stamp does not match is outdated: only the
+# months that still match it are kept, the others are unverified rather than
+# corrupt until the next save records them again.
+
+def get_month_checksum(month_data):
+    """
+    Returns the checksum of one month. Members are hashed in roster order, since
+    the order is part of the schedule, and each member's fields by name.
+    """
+    contents = json.dumps(list(month_data.items()), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(contents.encode("utf-8")).hexdigest()
+
+def summarize_month(month_data, schedule_type):
+    """
+    Returns the integrity record of one month: its checksum and its structure.
+    """
+    summary = {
+        "checksum": get_month_checksum(month_data),
+        "members": len([name for name in month_data if name != "count"]),
+    }
+    if schedule_type == "Overtime":
+        summary["total_working_hours"] = sum(member_data["monthly_hours"]["total_working_hours"] for member_data in month_data.values())
+        summary["total_asking_hours"] = sum(member_data["monthly_hours"]["total_asking_hours"] for member_data in month_data.values())
+    return summary
+
+def build_integrity(document, schedule_type, integrity=None, months=None):
+    """
+    Returns the integrity record of a document. Months not listed in months keep
+    their entry from the previous record, so a save only hashes what it changed.
+
+    Args:
+        document (dict): The document being saved.
+        schedule_type (str): "Overtime", "work_schedule" or "OT_Slots".
+        integrity (dict, optional): The record the document was loaded with.
+        months (iterable, optional): The months that changed. Defaults to all.
+
+    Returns:
+        dict: {month: summary} for every month of the document.
+    """
+    integrity = integrity or {}
+    changed = None if months is None else {str(month) for month in months}
+    return {
+        month: integrity[month] if month in integrity and changed is not None and month not in changed
+        else summarize_month(month_data, schedule_type)
+        for month, month_data in document["month"].items()
+    }
+
+def attach_integrity(document, integrity):
+    """
+    Returns the document as written to a file, with its integrity record and the
+    version the record was built for.
+    """
+    return dict(document, integrity=integrity, integrity_version=document.get("version", 0))
+
+def detach_integrity(document, schedule_type):
+    """
+    Removes the integrity record from a document read from a file.
+
+    Returns:
+        dict: The record. An outdated record keeps only the months that match it.
+    """
+    integrity = document.pop("integrity", {})
+    if document.pop("integrity_version", None) == document.get("version", 0):
+        return integrity
+    return {
+        month: summary for month, summary in integrity.items()
+        if month in document["month"] and get_month_checksum(document["month"][month]) == summary["checksum"]
+    }
+
+def get_unverified_months(document, integrity):
+    """
+    Returns the months of a document that have no integrity record to check them
+    against, e.g. because an older build saved them.
+    """
+    return sorted((month for month in document["month"] if month not in integrity), key=int)
+
+def check_integrity(document, schedule_type, integrity):
+    """
+    Compares a loaded document with the integrity record it was saved with.
+    Months without a record are not checked, see get_unverified_months().
+
+    Returns:
+        list[str]: A description of every mismatch, empty if the document is intact.
+    """
+    mismatches = []
+    for month, expected in integrity.items():
+        if month not in document["month"]:
+            mismatches.append(f"month {month}: missing")
+            continue
+        actual = summarize_month(document["month"][month], schedule_type)
+        if actual["checksum"] == expected["checksum"]:
+            continue
+        changes = [f"{field} {expected[field]} != {actual[field]}" for field in expected if field != "checksum" and expected[field] != actual.get(field)]
+        mismatches.append(f"month {month}: checksum mismatch" + (f" ({', '.join(changes)})" if changes else ""))
+    return mismatches
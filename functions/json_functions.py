@@ -1,16 +1,41 @@
 # PEP8 Compliant Guidance
 # Standard Library Imports
 import os
+import re
+import copy
 import json
+import time
 import logging
+import threading
+from collections import OrderedDict
 
 # Third-Party Library Imports
 
 # Local Application/Library Specific Imports
 from constants import log_file
-from constants import LEGEND_CODES
-from PathConfig import get_shared_path
+from constants import LEGEND_CODES, TRACKING_LOGS_DIR
+from PathConfig import get_paths
 from CrewMemberHours import CrewMemberHours
+from functions.hours_functions import CarryForward, parse_hours, sum_hours
+from functions.merge_functions import merge_month, get_changed_cell_months
+from functions.storage_functions import MONTHS, OT_SLOTS
+from functions.storage_functions import build_month_index
+from functions.storage_functions import get_store, get_layout_store, get_schedule_prefix
+from functions.write_functions import WriteJournal, get_active_journal, outside_journal, write_json, write_file
+from functions.mirror_functions import get_read_path, check_share, read_from_share
+from functions.offline_functions import save_outbox_document, load_outbox_documents, remove_outbox_document
+from functions.offline_functions import replay_file_writes
+from functions.schema_functions import SCHEMA_VERSION, needs_upgrade, upgrade_document
+from functions.sqlite_functions import uses_database, rename_slot_entries_in_db
+from functions.sqlite_functions import load_overtime_slots_from_db
+from functions.sqlite_functions import load_legend_job_codes_from_db, save_legend_job_codes_to_db
+
+# Cache budget for parsed crew-year documents
+CACHE_MAX_ENTRIES = 24
+CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+# Seconds a cached document is trusted before its file is stat()ed again
+CACHE_REVALIDATE_INTERVAL = 5.0
 
 # Logging Format
 logging.basicConfig(level=logging.ERROR, 
@@ -20,314 +45,732 @@ logging.basicConfig(level=logging.ERROR,
 )
 
 class DataCache:
-    def __init__(self):
-        self.cache = {}
+    """
+    Owns the crew-year schedule documents loaded from SaveFiles.
+
+    Readers get month data straight from the cached document. Writers mutate the
+    cached document, mark the months they touched as dirty and then call flush(),
+    which writes every dirty document back with a single write per file. Dirty
+    documents are never reloaded from disk, so unsaved edits survive month switches.
+
+    Documents are read and written through the store returned by get_store(), so
+    the cache works the same for the year-file and the month-sharded layouts. With
+    the sharded layout only the requested months are loaded and only dirty months
+    are written. OT_Slots files are cached the same way under the OT_SLOTS type, and
+    archived years are read from the archive tier without the caller knowing.
+
+    The cache is bounded by an entry count and a byte budget. Each entry is sized by
+    its serialized JSON length; when either budget is exceeded the least recently
+    used clean documents are evicted. Dirty documents stay pinned until flushed.
+
+    The month index of a cached document (roster, totals and Overtime ranking, see
+    build_month_index()) is kept per month until the month is marked dirty, so the
+    ranking pane re-renders without re-sorting. For a document that is not cached
+    the store's persisted index is read instead.
+
+    Freshness is checked with a single stat() per document at most once every
+    revalidate_interval seconds, so repeated reads within one UI operation never
+    touch the shared drive. invalidate() forces the next read to check again.
+
+    Saves use optimistic concurrency. Every document carries a "version" that each
+    save increments, and mark_dirty() snapshots a month before it changes. flush()
+    takes the store's lock file and compares the stored stamp with the one it loaded.
+    If it is unchanged the write goes straight through. Otherwise another user saved
+    in between, and the stored document is reloaded and three-way merged month by
+    month against the snapshots. Edits to different cells are combined; only a cell
+    changed to different values by both users is reported as a MergeConflict.
+
+    While the share cannot be reached, reads are served from the cache and the local
+    mirror, and flush() stores each dirty document with its snapshots in the local
+    outbox instead of writing it. The documents stay dirty, so the flush that runs
+    once the share is back merges and reports conflicts like any other save.
+    restore_outbox() reloads the queued documents after a restart.
+
+    Args:
+        max_entries (int, optional): Maximum number of cached documents.
+        max_bytes (int, optional): Maximum combined size of cached documents.
+        revalidate_interval (float, optional): Seconds between freshness checks.
+    """
+    def __init__(self, max_entries=CACHE_MAX_ENTRIES, max_bytes=CACHE_MAX_BYTES, revalidate_interval=CACHE_REVALIDATE_INTERVAL):
+        self.cache = OrderedDict()
         self.last_load_time = {}
+        self.last_checked = {}
+        self.revalidate_interval = revalidate_interval
+        self.stores = {}
+        self.loaded_months = {}
+        self.dirty_months = {}
+        self.entry_sizes = {}
+        self.base_months = {}
+        self.load_digests = {}
+        self.carry_forward = {}
+        self.month_indexes = {}
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()
 
-    def get_data(self, crew, month, year, schedule_type):
-        if schedule_type == "Overtime":
-            schedule_prefix = "OT"
-        else:
-            schedule_prefix = "WS"
-        
-        cache_key = f"{schedule_prefix}_{crew}_{year}"
-        shared_path = get_shared_path() or os.getcwd()
-        json_filepath = os.path.normpath(os.path.join(shared_path, "SaveFiles", f"{schedule_prefix}_{crew}_{year}.json"))
-        
-        if not os.path.exists(os.path.normpath(json_filepath)):
-            create_hours_data_json(crew, year, "Overtime")
-            create_hours_data_json(crew, year, "work_schedule")
-        
-        if cache_key not in self.cache or self.is_file_modified(json_filepath, cache_key):
-            with open(json_filepath, 'r') as file:
-                self.cache[cache_key] = json.load(file)
-                self.last_load_time[cache_key] = self.get_file_modification_time(json_filepath)
+    @staticmethod
+    def get_cache_key(crew, year, schedule_type):
+        return f"{get_schedule_prefix(schedule_type)}_{crew}_{year}"
+
+    def get_document(self, crew, year, schedule_type, months=None):
+        """
+        Returns the cached crew-year document, loading it from disk when it is not
+        cached yet or its data changed since it was loaded.
+
+        Args:
+            crew (str): The crew identifier.
+            year (int): The schedule year.
+            schedule_type (str): The schedule type ("Overtime" or "work_schedule").
+            months (iterable, optional): Months the caller needs. Defaults to all.
+                Other months may be missing from the returned document.
+        """
+        cache_key = self.get_cache_key(crew, year, schedule_type)
+        months = set(MONTHS) if months is None else {str(month) for month in months}
+
+        with self.lock:
+            if cache_key in self.cache and not self.needs_revalidation(cache_key) and months <= self.loaded_months[cache_key]:
+                self.cache.move_to_end(cache_key)
+                return self.cache[cache_key]
+
+            if cache_key not in self.cache or self.needs_revalidation(cache_key):
+                store = self.stores.get(cache_key) or get_store(crew, year, schedule_type)
+                stamp = store.get_stamp()
+                self.last_checked[cache_key] = time.monotonic()
+                offline = stamp is None and not check_share()
+
+                if offline and cache_key not in self.stores:
+                    # Read from the local mirror until the share is back
+                    store = get_store(crew, year, schedule_type)
+                elif stamp is None and not offline and not self.is_dirty(cache_key):
+                    if schedule_type != OT_SLOTS:
+                        create_hours_data_json(crew, year, "Overtime")
+                        create_hours_data_json(crew, year, "work_schedule")
+                    # Also picks up a year that was moved to another layout or archived
+                    store = get_store(crew, year, schedule_type)
+                    stamp = store.get_stamp()
 
-        month_data = self.cache[cache_key].get("month", {}).get(str(month), {})
+                self.stores[cache_key] = store
+                if cache_key in self.cache and not offline and not self.is_dirty(cache_key) and stamp != self.last_load_time.get(cache_key):
+                    self.remove_entry(cache_key, keep_store=True)
+                if cache_key not in self.cache:
+                    self.cache[cache_key] = {"month": {}}
+                    self.loaded_months[cache_key] = set()
+                    self.entry_sizes[cache_key] = {}
+                    self.last_load_time[cache_key] = stamp
+
+            missing_months = months - self.loaded_months[cache_key]
+            if missing_months:
+                document, sizes = self.stores[cache_key].load(missing_months)
+                # The saved bytes the cached document started from
+                self.load_digests.setdefault(cache_key, self.stores[cache_key].digest)
+                loaded_document = self.cache[cache_key]
+                for key, value in document.items():
+                    if key != "month":
+                        loaded_document.setdefault(key, value)
+                for month, month_data in document["month"].items():
+                    loaded_document["month"].setdefault(month, month_data)
+                self.loaded_months[cache_key] |= set(MONTHS) if "*" in sizes else missing_months
+                self.entry_sizes[cache_key].update(sizes)
+
+            self.cache.move_to_end(cache_key)
+            self.evict(keep=cache_key)
+            return self.cache[cache_key]
+
+    def get_data(self, crew, month, year, schedule_type):
+        document = self.get_document(crew, year, schedule_type, months=[month])
+        month_data = document.get("month", {}).get(str(month), {})
         return month_data
 
-    def is_file_modified(self, json_filepath, cache_key):
-        current_modification_time = self.get_file_modification_time(json_filepath)
-        last_modification_time = self.last_load_time.get(cache_key)
-        return current_modification_time != last_modification_time
+    def mark_dirty(self, cache_key, month, hours_changed=True):
+        """
+        Records that a month of a cached document is about to change.
 
-    @staticmethod
-    def get_file_modification_time(file_path):
-        if os.path.exists(os.path.normpath(file_path)):
-            return os.path.getmtime(os.path.normpath(file_path))
-        return None
+        Args:
+            cache_key (str): The document's cache key.
+            month (int or str): The month being changed.
+            hours_changed (bool, optional): False when only the starting and total
+                fields change, which keeps the month's carry-forward sums valid.
+        """
+        with self.lock:
+            month = str(month)
+            base_months = self.base_months.setdefault(cache_key, {})
+            if month not in base_months and cache_key in self.cache:
+                # The month as loaded, for merging with other users' saves
+                base_months[month] = copy.deepcopy(self.cache[cache_key]["month"].get(month))
+            self.dirty_months.setdefault(cache_key, set()).add(month)
+            self.month_indexes.get(cache_key, {}).pop(month, None)
+            if hours_changed and cache_key in self.carry_forward:
+                self.carry_forward[cache_key].invalidate(month)
 
-data_cache = DataCache()
+    def get_month_index(self, crew, year, schedule_type, month):
+        """
+        Returns the index entry of one month: {"members": [...]} plus, for the
+        Overtime schedule, the "totals" and "ranking" of build_month_index().
+        """
+        cache_key = self.get_cache_key(crew, year, schedule_type)
+        month = str(month)
+        with self.lock:
+            if cache_key not in self.cache:
+                # The sharded and sqlite layouts answer this without loading the month
+                month_index = load_year_index(crew, year, schedule_type)["months"].get(month)
+                return month_index or build_month_index({}, schedule_type)
 
-def create_hours_data_json(crew, year, schedule_type):
-    shared_path = get_shared_path() or os.getcwd()
-    save_folder = os.path.normpath(os.path.join(shared_path, "SaveFiles"))
-    if not os.path.exists(os.path.normpath(save_folder)):
-        os.makedirs(save_folder)
-        
-    if schedule_type == "Overtime":
-        schedule_prefix = "OT"
-    else:
-        schedule_prefix = "WS"
+            document = self.get_document(crew, year, schedule_type, months=[month])
+            month_indexes = self.month_indexes.setdefault(cache_key, {})
+            if month not in month_indexes:
+                month_indexes[month] = build_month_index(document["month"].get(month, {}), schedule_type)
+            return month_indexes[month]
 
-    json_filename = f"{schedule_prefix}_{crew}_{year}.json"
-    json_filepath = os.path.normpath(os.path.join(save_folder, json_filename))
+    def get_carry_forward(self, cache_key):
+        with self.lock:
+            return self.carry_forward.setdefault(cache_key, CarryForward())
 
-    if not os.path.exists(os.path.normpath(json_filepath)):
-        
-        if schedule_prefix == "OT":
-            prev_year = year - 1
-            prev_year_json_filepath = f"{schedule_prefix}_{crew}_{prev_year}.json"
-            prev_year_json_filepath = os.path.normpath(os.path.join(save_folder, prev_year_json_filepath))
-            if os.path.exists(os.path.normpath(prev_year_json_filepath)):
-                prev_year_data = load_hours_data_from_json(crew, 12, prev_year, schedule_type)
-            else:
-                prev_year_data = None
-
-            if prev_year_data:
-                # Previous year's data exists, create new year's data based on rankings
-                ranking_data = [(name, member.monthly_hours['total_working_hours'], member.monthly_hours['total_asking_hours'])
-                                for name, member in prev_year_data.items()]
-                ranking_data.sort(key=lambda x: x[1])
-                working_hours_ranks = {name: rank for rank, (name, _, _) in enumerate(ranking_data)}
-                ranking_data.sort(key=lambda x: x[2])
-                asking_hours_ranks = {name: rank for rank, (name, _, _) in enumerate(ranking_data)}
-
-                new_year_data = {
-                    "month": {
-                        str(month): {
-                            name: {
-                                "monthly_hours": {
-                                    "starting_asking_hours": asking_hours_ranks[name],
-                                    "starting_working_hours": working_hours_ranks[name],
-                                    "total_asking_hours": asking_hours_ranks[name],
-                                    "total_working_hours": working_hours_ranks[name],
-                                    "asking_hours_data": [],
-                                    "working_hours_data": []
-                                }
-                            } for name in prev_year_data.keys()
-                        } for month in range(1, 13)
-                    }
-                }
-            
+    def is_dirty(self, cache_key):
+        return bool(self.dirty_months.get(cache_key))
+
+    def has_pending_writes(self):
+        return any(self.dirty_months.values())
+
+    def flush(self, cache_key=None):
+        """
+        Writes dirty documents back to disk, one write per file (or per dirty month
+        with the sharded layout). All documents of one flush land together through a
+        WriteJournal, and stay dirty if the write fails. While the share is offline
+        the documents are queued in the local outbox instead.
+
+        Args:
+            cache_key (str, optional): Only flush this document. Defaults to every
+            dirty document.
+
+        Returns:
+            list[MergeConflict]: Cells that another user saved with a different value.
+        """
+        conflicts = []
+        with self.lock:
+            cache_keys = [cache_key] if cache_key else sorted(self.dirty_months)
+            if not check_share():
+                self.queue_offline(cache_keys)
+                return []
+            try:
+                with WriteJournal() as journal:
+                    cache_keys = [key for key in cache_keys if self.is_dirty(key)]
+                    for key in cache_keys:
+                        os.makedirs(os.path.dirname(self.stores[key].lock_path), exist_ok=True)
+                    # Every lock of the flush is taken before any document is compared
+                    journal.hold_locks([self.stores[key].lock_path for key in cache_keys])
+
+                    for key in cache_keys:
+                        store = self.stores[key]
+                        conflicts.extend(self.reconcile(key, store))
+                        staged_paths = set(journal.staged) | set(journal.appends)
+                        sizes = store.save(self.cache[key], self.dirty_months[key])
+                        journal.on_commit(lambda key=key, store=store, sizes=sizes: self.mark_written(key, store, sizes))
+                        # If the share drops before the commit the document goes to the
+                        # outbox, so it is merged with the saved data when replayed
+                        journal.on_offline((set(journal.staged) | set(journal.appends)) - staged_paths, lambda key=key: self.queue_offline([key]))
+            except OSError:
+                if check_share():
+                    raise
+                # The share dropped during the save and the journal rolled back
+                self.queue_offline(cache_keys)
+                return []
+
+            self.evict()
+
+        for conflict in conflicts:
+            logging.error(f"Save conflict kept local value: {conflict}")
+        return conflicts
+
+    def reconcile(self, cache_key, store):
+        """
+        Compare-and-swap step of a flush. Bumps the document's version and, if
+        another user saved since it was loaded, merges their changes into it first.
+        Must be called while holding the store's lock file.
+
+        Returns:
+            list[MergeConflict]: The cells both users changed differently.
+        """
+        document = self.cache[cache_key]
+        stamp = store.get_stamp()
+        # The modification time alone misses saves within its resolution or from a
+        # server with a skewed clock, so the saved bytes are compared as well
+        if stamp is None or (stamp == self.last_load_time.get(cache_key) and store.get_digest() == self.load_digests.get(cache_key)):
+            document["version"] = document.get("version", 0) + 1
+            return []
+
+        # The stamp changed, so the saved document is merged even if its version did
+        # not: a hand edit or an older build can change it without bumping it
+        with read_from_share():
+            saved, sizes = store.load()
+        conflicts = []
+        base_months = self.base_months.get(cache_key, {})
+        dirty_months = self.dirty_months[cache_key]
+        changed_by_mine = get_changed_cell_months(base_months, document)
+        changed_by_theirs = get_changed_cell_months(base_months, saved)
+
+        for month, saved_month in saved["month"].items():
+            if month in dirty_months:
+                document["month"][month] = merge_month(base_months.get(month), document["month"].get(month, {}), saved_month, month, conflicts)
             else:
-                # If no previous year's data, create template data
-                new_year_data = {
-                    "month": {
-                        str(month): {
-                            "[placeholder]": {
-                                "monthly_hours": {
-                                    "starting_asking_hours": 0,
-                                    "starting_working_hours": 0,
-                                    "total_asking_hours": 0,
-                                    "total_working_hours": 0,
-                                    "asking_hours_data": [],
-                                    "working_hours_data": []
-                                }
-                            }
-                        } for month in range(1, 13)
-                    }
-                }
-        else:
-            new_year_data = {
-                "month": {
-                    str(month): {
-                        "[placeholder]": {
-                            "monthly_hours": {
-                                "entry_data": []
-                            }
-                        }
-                    } for month in range(1, 13)
-                }
+                document["month"][month] = saved_month
+        self.loaded_months[cache_key] = set(MONTHS)
+        self.entry_sizes[cache_key] = sizes
+
+        self.month_indexes.pop(cache_key, None)
+        carry_forward = self.get_carry_forward(cache_key)
+        carry_forward.invalidate()
+        if store.schedule_type == "Overtime" and changed_by_mine and changed_by_theirs:
+            # Both users edited day entries, so totals are recomputed from the first
+            # edited month rather than combined
+            for month in carry_forward.recalculate(document, min(int(month) for month in changed_by_mine | changed_by_theirs)):
+                dirty_months.add(month)
+
+        document["version"] = max(saved.get("version", 0), document.get("version", 0)) + 1
+        return conflicts
+
+    def mark_written(self, cache_key, store, sizes):
+        """
+        Records that a flushed document reached disk.
+        """
+        with self.lock:
+            self.entry_sizes.setdefault(cache_key, {}).update(sizes)
+            self.last_load_time[cache_key] = store.get_stamp()
+            self.load_digests[cache_key] = store.get_digest()
+            self.last_checked[cache_key] = time.monotonic()
+            self.dirty_months.pop(cache_key, None)
+            self.base_months.pop(cache_key, None)
+            self.month_indexes.pop(cache_key, None)
+            remove_outbox_document(cache_key)
+
+    def queue_offline(self, cache_keys):
+        """
+        Stores dirty documents in the local outbox so their changes survive a restart
+        while the share is offline.
+        """
+        with self.lock:
+            for key in cache_keys:
+                if not self.is_dirty(key):
+                    continue
+                store = self.stores[key]
+                save_outbox_document(key, {
+                    "crew": store.crew,
+                    "year": store.year,
+                    "schedule_type": store.schedule_type,
+                    "layout": store.layout,
+                    "document": self.cache[key],
+                    "dirty_months": sorted(self.dirty_months[key]),
+                    "base_months": self.base_months.get(key, {}),
+                })
+            logging.error(f"Share unavailable, queued {len(cache_keys)} schedules for later")
+
+    def restore_outbox(self):
+        """
+        Loads the documents queued while offline back into the cache as dirty, so
+        the next flush writes them.
+
+        Returns:
+            int: The number of documents restored.
+        """
+        entries = load_outbox_documents()
+        with self.lock:
+            for key, entry in entries.items():
+                if self.is_dirty(key):
+                    continue
+                store = get_layout_store(entry["layout"], entry["crew"], entry["year"], entry["schedule_type"])
+                if needs_upgrade(entry["document"]):
+                    # Queued by an earlier version of the app
+                    upgrade_document(entry["document"], entry["schedule_type"])
+                self.remove_entry(key)
+                self.cache[key] = entry["document"]
+                self.stores[key] = store
+                self.loaded_months[key] = set(entry["document"]["month"])
+                self.entry_sizes[key] = {}
+                # Unknown load stamp, so the flush always compares with what is saved
+                self.last_load_time[key] = None
+                self.last_checked[key] = time.monotonic()
+                self.dirty_months[key] = set(entry["dirty_months"])
+                self.base_months[key] = entry["base_months"]
+        return len(entries)
+
+    def evict(self, keep=None):
+        """
+        Drops least recently used clean documents until the cache is within budget.
+
+        Args:
+            keep (str, optional): Cache key that must stay loaded, usually the
+            document that was just requested.
+        """
+        with self.lock:
+            for key in list(self.cache):
+                if len(self.cache) <= self.max_entries and self.get_total_size() <= self.max_bytes:
+                    break
+                if key == keep or self.is_dirty(key):
+                    continue
+                self.remove_entry(key)
+
+    def remove_entry(self, cache_key, keep_store=False):
+        with self.lock:
+            self.cache.pop(cache_key, None)
+            self.loaded_months.pop(cache_key, None)
+            self.entry_sizes.pop(cache_key, None)
+            self.carry_forward.pop(cache_key, None)
+            self.month_indexes.pop(cache_key, None)
+            self.last_load_time.pop(cache_key, None)
+            self.load_digests.pop(cache_key, None)
+            if not keep_store:
+                self.last_checked.pop(cache_key, None)
+                self.stores.pop(cache_key, None)
+
+    def get_entry_size(self, cache_key):
+        return sum(self.entry_sizes.get(cache_key, {}).values())
+
+    def get_total_size(self):
+        return sum(self.get_entry_size(key) for key in self.cache)
+
+    def get_stats(self):
+        """
+        Returns cache diagnostics: per-entry sizes in least to most recently used
+        order, the totals and the configured budget.
+        """
+        with self.lock:
+            return {
+                "entries": [(key, self.get_entry_size(key), self.is_dirty(key)) for key in self.cache],
+                "entry_count": len(self.cache),
+                "total_bytes": self.get_total_size(),
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
             }
 
-        with open(json_filepath, 'w') as file:
-            json.dump(new_year_data, file, indent=4)
+    def needs_revalidation(self, cache_key):
+        last_checked = self.last_checked.get(cache_key)
+        return last_checked is None or time.monotonic() - last_checked >= self.revalidate_interval
 
-    return json_filepath
+    def invalidate(self, cache_key=None):
+        """
+        Forces the next read of a document to check its file for changes.
 
-def save_new_crew_member(crew_member_name, crew, month, year, schedule_type):
-    #def load_and_save_data():
+        Args:
+            cache_key (str, optional): Document to invalidate. Defaults to all.
+        """
+        with self.lock:
+            if cache_key:
+                self.last_checked.pop(cache_key, None)
+            else:
+                self.last_checked.clear()
+
+data_cache = DataCache()
+
+def invalidate_cache():
+    """
+    Makes the next read of every cached schedule check SaveFiles for changes made
+    by other users.
+    """
+    data_cache.invalidate()
+
+def restore_offline_writes():
+    """
+    Reloads the schedules queued while the share was offline into the cache.
+    """
+    return data_cache.restore_outbox()
+
+def replay_offline_writes():
+    """
+    Writes everything queued while the share was offline: file writes in the order
+    they were made, then the queued schedules, which are merged with the saved data.
+
+    Returns:
+        list[MergeConflict]: Cells and files another user changed in the meantime.
+    """
+    conflicts = replay_file_writes()
+    conflicts.extend(data_cache.flush())
+    return conflicts
+
+def hold_schedule_locks(crew, years, schedule_types):
+    """
+    Takes the save locks of the given crew-year schedules for the rest of the active
+    WriteJournal. An operation that flushes several schedules one after another
+    calls this first, so every lock it needs is taken together in the journal's
+    lock order rather than in the order the schedules are flushed.
+
+    Args:
+        crew (str): The crew identifier.
+        years (iterable): The schedule years.
+        schedule_types (iterable): "Overtime", "work_schedule" and/or OT_SLOTS.
+    """
+    journal = get_active_journal()
+    if journal is None or not check_share():
+        return
+
+    lock_paths = []
+    for year in years:
+        for schedule_type in schedule_types:
+            store = data_cache.stores.get(DataCache.get_cache_key(crew, year, schedule_type)) or get_store(crew, year, schedule_type)
+            os.makedirs(os.path.dirname(store.lock_path), exist_ok=True)
+            lock_paths.append(store.lock_path)
+    journal.hold_locks(lock_paths)
+
+def flush_pending_writes():
+    """
+    Writes every schedule document with unsaved changes back to SaveFiles.
+
+    Returns:
+        list[MergeConflict]: Cells another user saved with a different value.
+    """
+    return data_cache.flush()
+
+def rank_members(totals):
+    """
+    Ranks crew members by their year-end totals, which seeds the next year's
+    starting hours: the lowest working total ranks 0, and likewise for asking.
+    Members with equal asking totals keep their working order.
+
+    Args:
+        totals (dict): {name: {"total_working_hours": int, "total_asking_hours": int}}.
+
+    Returns:
+        tuple: (working_ranks, asking_ranks), each mapping names to ranks.
+    """
+    by_working = sorted(totals, key=lambda name: totals[name]['total_working_hours'])
+    by_asking = sorted(by_working, key=lambda name: totals[name]['total_asking_hours'])
+    return {name: rank for rank, name in enumerate(by_working)}, {name: rank for rank, name in enumerate(by_asking)}
+
+def build_new_year_document(crew, year, schedule_type):
+    """
+    Builds the first document of a crew-year from the previous year. The Overtime
+    schedule gets December's members with their rankings as starting hours, the
+    work schedule gets December's roster with no entries, and OT_Slots keeps
+    December's slot count. Without a previous year every month is empty.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The new schedule year.
+        schedule_type (str): "Overtime", "work_schedule" or OT_SLOTS.
+
+    Returns:
+        dict: The new document.
+    """
+    new_year_data = {"schema_version": SCHEMA_VERSION, "month": {month: {} for month in MONTHS}}
+    if schedule_type == OT_SLOTS:
+        if uses_database(get_paths().get_slots_filepath(crew, year - 1)):
+            december_slots, _ = load_overtime_slots_from_db(crew, 12, year - 1)
+        else:
+            december_slots = get_store(crew, year - 1, OT_SLOTS).load(["12"])[0]["month"].get("12", {})
+        if "count" in december_slots:
+            new_year_data["month"] = {month: {"count": december_slots["count"]} for month in MONTHS}
+        return new_year_data
+
+    # The year-end totals come from the year index, which the sharded and
+    # sqlite layouts answer without reading any day entries
+    december = load_year_index(crew, year - 1, "Overtime")["months"].get("12", {})
     if schedule_type == "Overtime":
-        schedule_prefix = "OT"
+        prev_year_totals = december.get("totals", {})
+        working_hours_ranks, asking_hours_ranks = rank_members(prev_year_totals)
+        new_year_data["month"] = {
+            month: {
+                name: {
+                    "monthly_hours": {
+                        "starting_asking_hours": asking_hours_ranks[name],
+                        "starting_working_hours": working_hours_ranks[name],
+                        "total_asking_hours": asking_hours_ranks[name],
+                        "total_working_hours": working_hours_ranks[name],
+                        "asking_hours_data": [],
+                        "working_hours_data": []
+                    }
+                } for name in prev_year_totals
+            } for month in MONTHS
+        }
     else:
-        schedule_prefix = "WS"
+        members = load_year_index(crew, year - 1, schedule_type)["months"].get("12", {}).get("members") or december.get("members", [])
+        new_year_data["month"] = {month: {name: new_member_entry(schedule_type) for name in members} for month in MONTHS}
+    return new_year_data
 
-    shared_path = get_shared_path() or os.getcwd()
-    json_filepath = os.path.normpath(os.path.join(shared_path, "SaveFiles", f"{schedule_prefix}_{crew}_{year}.json"))
-   
-    # Load the entire JSON data from the file
-    with open(json_filepath, 'r') as file:
-        data = json.load(file)
+def create_hours_data_json(crew, year, schedule_type):
+    store = get_store(crew, year, schedule_type)
 
-    # Get the specific month data from the loaded JSON data
-    month_data = data["month"].get(str(month), {})
+    if not store.exists():
+        new_year_data = build_new_year_document(crew, year, schedule_type)
 
-    # Replace the placeholder entry if it exists
-    if "[placeholder]" in month_data:
-        month_data[crew_member_name] = month_data["[placeholder]"]
-        del month_data["[placeholder]"]
+        # A new year file is created on first read, so it must not wait for the
+        # journal of whatever operation triggered that read
+        with outside_journal():
+            store.save(new_year_data)
 
-    # Create a new entry for the crew member in the month data
-    if schedule_prefix == "OT":
-        month_data[crew_member_name] = {
-            "monthly_hours": {
-                "starting_asking_hours": 0,
-                "starting_working_hours": 0,
-                "total_asking_hours": 0,
-                "total_working_hours": 0,
-                "asking_hours_data": [],
-                "working_hours_data": []
-            }
-        }
-    elif schedule_prefix == "WS":
-        month_data[crew_member_name] = {
-            "monthly_hours": {
-                "entry_data": []
-            }
-        }
+    return store.path
 
-    # Update the month data in the loaded JSON data
-    data["month"][str(month)] = month_data
+def save_new_crew_member(crew_member_name, crew, month, year, schedule_type):
+    cache_key = DataCache.get_cache_key(crew, year, schedule_type)
+    data = data_cache.get_document(crew, year, schedule_type, months=[month])
 
-    # Save the updated JSON data back to the file
-    with open(json_filepath, 'w') as file:
-        json.dump(data, file, indent=4)
-        
-    load_hours_data_from_json(crew, month, year, schedule_type)
+    # Get the specific month data from the cached JSON data
+    month_data = data["month"].setdefault(str(month), {})
+    data_cache.mark_dirty(cache_key, month)
+
+    # Create a new entry for the crew member in the month data
+    month_data[crew_member_name] = new_member_entry(schedule_type)
+
+    data_cache.flush(cache_key)
         
 def remove_crew_member(crew_member_name, crew, month, year, schedule_type):
-    if schedule_type == "Overtime":
-        schedule_prefix = "OT"
-    else:
-        schedule_prefix = "WS"
+    cache_key = DataCache.get_cache_key(crew, year, schedule_type)
+    data = data_cache.get_document(crew, year, schedule_type, months=[month])
 
-    shared_path = get_shared_path() or os.getcwd()
-    json_filepath = os.path.normpath(os.path.join(shared_path, "SaveFiles", f"{schedule_prefix}_{crew}_{year}.json"))
-   
-    # Load the entire JSON data from the file
-    with open(json_filepath, 'r') as file:
-        data = json.load(file)
-
-    # Get the specific month data from the loaded JSON data
-    month_data = data["month"].get(str(month), {})
+    # Get the specific month data from the cached JSON data
+    month_data = data["month"].setdefault(str(month), {})
 
     # Remove the crew member from the month data
     if crew_member_name in month_data:
+        data_cache.mark_dirty(cache_key, month)
         del month_data[crew_member_name]
 
-    # Update the month data in the loaded JSON data
-    data["month"][str(month)] = month_data
-
-    # Save the updated JSON data back to the file
-    with open(json_filepath, 'w') as file:
-        json.dump(data, file, indent=4)
+    data_cache.flush(cache_key)
 
 def adjust_crew_member_starting_hours(crew_member_name, crew, year, new_starting_working_hours, new_starting_asking_hours):
-    schedule_prefix = "OT"
-    shared_path = get_shared_path() or os.getcwd()
-    json_filepath = os.path.normpath(os.path.join(shared_path, "SaveFiles", f"{schedule_prefix}_{crew}_{year}.json"))
-   
-    # Load the entire JSON data from the file
-    with open(json_filepath, 'r') as file:
-        data = json.load(file)
-
-    # Get the crew member's data for January
-    january_data = data["month"]["1"].get(crew_member_name)
-    if january_data:
-        # Calculate the adjustment in starting hours
-        working_hours_adjustment = new_starting_working_hours - january_data["monthly_hours"]["starting_working_hours"]
-        asking_hours_adjustment = new_starting_asking_hours - january_data["monthly_hours"]["starting_asking_hours"]
-
-        # Update the starting hours for January
-        january_data["monthly_hours"]["starting_working_hours"] = new_starting_working_hours
-        january_data["monthly_hours"]["starting_asking_hours"] = new_starting_asking_hours
-
-        # Update the total hours for January
-        january_data["monthly_hours"]["total_working_hours"] = january_data["monthly_hours"]["total_working_hours"] + working_hours_adjustment
-        january_data["monthly_hours"]["total_asking_hours"] = january_data["monthly_hours"]["total_asking_hours"] + working_hours_adjustment + asking_hours_adjustment
-
-        # Update the starting hours and total hours for subsequent months
-        for month in range(2, 13):
-            month_str = str(month)
-            month_data = data["month"][month_str].get(crew_member_name)
-            if month_data:
-                month_data["monthly_hours"]["starting_working_hours"] = month_data["monthly_hours"]["starting_working_hours"] + working_hours_adjustment
-                month_data["monthly_hours"]["starting_asking_hours"] = month_data["monthly_hours"]["starting_asking_hours"] + asking_hours_adjustment
-                month_data["monthly_hours"]["total_working_hours"] = month_data["monthly_hours"]["total_working_hours"] + working_hours_adjustment
-                month_data["monthly_hours"]["total_asking_hours"] = month_data["monthly_hours"]["total_asking_hours"] + asking_hours_adjustment
-
-    # Save the updated JSON data back to the file
-    with open(json_filepath, 'w') as file:
-        json.dump(data, file, indent=4)
+    return adjust_starting_hours(crew, year, {crew_member_name: (new_starting_working_hours, new_starting_asking_hours)})
+
+def adjust_starting_hours(crew, year, starting_hours):
+    """
+    Sets the January starting hours of any number of crew members of an Overtime
+    year with one load and one write. Each change is applied as a delta that the
+    CarryForward engine carries through the member's months, so no day entries
+    are re-summed. The adjusted members are then checked against their day entries
+    and any inconsistency is logged.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        starting_hours (dict): {name: (starting_working_hours, starting_asking_hours)}.
+
+    Returns:
+        dict: The months updated for each member found in January.
+    """
+    schedule_type = "Overtime"
+    cache_key = DataCache.get_cache_key(crew, year, schedule_type)
+    data = data_cache.get_document(crew, year, schedule_type)
+    carry_forward = data_cache.get_carry_forward(cache_key)
+
+    updated = {}
+    for name, (starting_working_hours, starting_asking_hours) in starting_hours.items():
+        january_data = data["month"].get("1", {}).get(name)
+        if january_data is None:
+            continue
+        working_delta = starting_working_hours - january_data["monthly_hours"]["starting_working_hours"]
+        asking_delta = starting_asking_hours - january_data["monthly_hours"]["starting_asking_hours"]
+        if not working_delta and not asking_delta:
+            updated[name] = []
+            continue
+
+        for month in carry_forward.get_carry_months(data, name):
+            data_cache.mark_dirty(cache_key, month, hours_changed=False)
+        updated[name] = carry_forward.shift(data, name, working_delta, asking_delta)
+
+    for month, name, field, stored, expected in carry_forward.check(data, names=updated):
+        logging.error(f"Inconsistent {field} for {name} in {crew} {year} month {month}: stored {stored}, day entries give {expected}")
+
+    data_cache.flush(cache_key)
+    return updated
+
+def check_overtime_totals(crew, year):
+    """
+    Checks the starting and total hours of every member of an Overtime year against
+    the day entries, see CarryForward.check().
+
+    Returns:
+        list[tuple]: (month, name, field, stored, expected) for each mismatch.
+    """
+    cache_key = DataCache.get_cache_key(crew, year, "Overtime")
+    data = data_cache.get_document(crew, year, "Overtime")
+    return data_cache.get_carry_forward(cache_key).check(data)
 
 def load_hours_data_from_json(crew, month, year, schedule_type):
     month_data = data_cache.get_data(crew, month, year, schedule_type)
     if not month_data:
-        logging.error(f"No data found for month {month}")
+        # Months of a new year stay empty until members are added, which is not an error
         return {}
 
-    crew_member_hours = {}
-    for name, member_data in month_data.items():
-        if name != "[placeholder]":
-            crew_member_hours[name] = CrewMemberHours.from_dict({name: member_data})
+    return CrewMemberHours.from_month_data(month_data)
 
-    return crew_member_hours
+def load_year_index(crew, year, schedule_type):
+    """
+    Returns the year-level index of a crew-year: the member order of every month
+    and, for the Overtime schedule, each member's month-end totals.
 
-def change_crew_member_name(old_name, new_name, crew, month, year, schedule_type):
-    if schedule_type == "Overtime":
-        schedule_prefix = "OT"
-    else:
-        schedule_prefix = "WS"
+    Returns:
+        dict: {"months": {"1": {"members": [...], "totals": {...}}, ...}}
+    """
+    store = get_store(crew, year, schedule_type)
+    if not store.exists():
+        return {"months": {}}
+    return store.load_index()
 
-    shared_path = get_shared_path() or os.getcwd()
-    json_filepath = os.path.normpath(os.path.join(shared_path, "SaveFiles", f"{schedule_prefix}_{crew}_{year}.json"))
-   
-    # Load the entire JSON data from the file
-    with open(json_filepath, 'r') as file:
-        data = json.load(file)
+def load_month_ranking(crew, month, year, exclusions=0):
+    """
+    Returns the saved ranking of an Overtime month from the month index, leaving
+    out the first members of the roster as the ranking pane does.
 
-    # Get the specific month data from the loaded JSON data
-    month_data = data["month"].get(str(month), {})
+    Args:
+        crew (str): The crew identifier.
+        month (int): The month.
+        year (int): The schedule year.
+        exclusions (int, optional): Number of members at the top of the roster
+            that are not ranked.
+
+    Returns:
+        dict: The ranked "members" in roster order, their "totals", the
+        "by_working" and "by_asking" orders (highest first) and the
+        "lowest_working" and "lowest_asking" member.
+    """
+    month_index = data_cache.get_month_index(crew, year, "Overtime", month)
+    excluded = set(month_index["members"][:exclusions])
+    ranking = dict(month_index["ranking"])
+    members = [name for name in month_index["members"] if name not in excluded]
+    if excluded:
+        ranking["by_working"] = [name for name in ranking["by_working"] if name not in excluded]
+        ranking["by_asking"] = [name for name in ranking["by_asking"] if name not in excluded]
+        for field, total in (("lowest_working", "total_working_hours"), ("lowest_asking", "total_asking_hours")):
+            if ranking[field] in excluded:
+                ranking[field] = min(members, key=lambda name: month_index["totals"][name][total]) if members else None
+    ranking["members"] = members
+    ranking["totals"] = {name: month_index["totals"][name] for name in members}
+    return ranking
+
+def change_crew_member_name(old_name, new_name, crew, month, year, schedule_type):
+    cache_key = DataCache.get_cache_key(crew, year, schedule_type)
+    data = data_cache.get_document(crew, year, schedule_type, months=[month])
+
+    # Get the specific month data from the cached JSON data
+    month_data = data["month"].setdefault(str(month), {})
 
     # Update the crew member name in the month data
     if old_name in month_data:
+        data_cache.mark_dirty(cache_key, month)
         month_data[new_name] = month_data.pop(old_name)
 
-    # Update the month data in the loaded JSON data
-    data["month"][str(month)] = month_data
-
-    # Save the updated JSON data back to the file
-    with open(json_filepath, 'w') as file:
-        json.dump(data, file, indent=4)
-        
-    load_hours_data_from_json(crew, month, year, schedule_type)
+    data_cache.flush(cache_key)
 
 def save_hours_data_to_json(crew_member_hours, crew, year, schedule_type, month):
+    """
+    Stores a month of crew member hours in the cached schedule document and
+    propagates the totals to the following months.
+
+    The changes are written to SaveFiles by the next flush_pending_writes() call,
+    so several saves before a flush cost a single file write.
+    """
+    cache_key = DataCache.get_cache_key(crew, year, schedule_type)
     if schedule_type == "Overtime":
-        schedule_prefix = "OT"
+        # The following months receive the propagated totals
+        months = range(month, 13)
     else:
-        schedule_prefix = "WS"
-
-    shared_path = get_shared_path() or os.getcwd()
-    json_filepath = os.path.normpath(os.path.join(shared_path, "SaveFiles", f"{schedule_prefix}_{crew}_{year}.json"))
-   
-    # Load existing data from the JSON file
-    with open(json_filepath, 'r') as file:
-        existing_data = json.load(file)
+        months = [month]
+    existing_data = data_cache.get_document(crew, year, schedule_type, months=months)
 
     # Create the month entry in the existing data if it doesn't exist
-    if str(month) not in existing_data['month']:
-        existing_data['month'][str(month)] = {}
-
-    # Remove the placeholder entry if it exists
-    if "[placeholder]" in existing_data['month'][str(month)]:
-        del existing_data['month'][str(month)]["[placeholder]"]
+    month_data = existing_data['month'].setdefault(str(month), {})
+    data_cache.mark_dirty(cache_key, month)
 
     # Update the crew member data for the specific month
     for name, crew_member in crew_member_hours.items():
         if schedule_type == "Overtime":
-            existing_data['month'][str(month)][name] = {
+            month_data[name] = {
                 "monthly_hours": {
                     "starting_asking_hours": crew_member.monthly_hours['starting_asking_hours'],
                     "starting_working_hours": crew_member.monthly_hours['starting_working_hours'],
@@ -338,22 +781,24 @@ def save_hours_data_to_json(crew_member_hours, crew, year, schedule_type, month)
                 }
             }
         else:
-            existing_data['month'][str(month)][name] = {
+            month_data[name] = {
                 "monthly_hours": {
                     "entry_data": crew_member.monthly_hours[str(month)]['entry_data']
                 }
             }
 
-    # Update subsequent months' starting hours and total hours
-    update_subsequent_months(existing_data, crew, year, schedule_type, month)
-    
-    # Save the updated data back to the JSON file
-    with open(json_filepath, 'w') as file:
-        json.dump(existing_data, file, indent=4)
+    # Carry the month's totals into the starting and total hours of subsequent months
+    if schedule_type == "Overtime":
+        for subsequent_month in range(month + 1, 13):
+            data_cache.mark_dirty(cache_key, subsequent_month, hours_changed=False)
+        data_cache.get_carry_forward(cache_key).propagate(existing_data, month)
 
 def update_subsequent_months(existing_data, crew, year, schedule_type, month):
     """
     Propagates the updated hours data from the current month to the subsequent months.
+
+    Reference implementation that re-sums every later month's day arrays. Saves use
+    the cached CarryForward engine instead, which produces the same results.
     
     Parameters:
     - existing_data: The existing JSON data structure containing crew member hours.
@@ -372,57 +817,381 @@ def update_subsequent_months(existing_data, crew, year, schedule_type, month):
                         previous_month_data = existing_data['month'][previous_month_str][name]['monthly_hours']
                         crew_member_data['monthly_hours']['starting_asking_hours'] = previous_month_data['total_asking_hours']
                         crew_member_data['monthly_hours']['starting_working_hours'] = previous_month_data['total_working_hours']
-                        crew_member_data['monthly_hours']['total_asking_hours'] = previous_month_data['total_asking_hours'] + sum(
-                            int(hours) for hours in crew_member_data['monthly_hours']['asking_hours_data'] if hours.isdigit()
+                        crew_member_data['monthly_hours']['total_asking_hours'] = previous_month_data['total_asking_hours'] + sum_hours(
+                            parse_hours(crew_member_data['monthly_hours']['asking_hours_data'])
+                        ) + sum_hours(
+                            parse_hours(crew_member_data['monthly_hours']['working_hours_data'])
                         )
-                        crew_member_data['monthly_hours']['total_working_hours'] = previous_month_data['total_working_hours'] + sum(
-                            int(hours) for hours in crew_member_data['monthly_hours']['working_hours_data'] if hours.isdigit()
+                        crew_member_data['monthly_hours']['total_working_hours'] = previous_month_data['total_working_hours'] + sum_hours(
+                            parse_hours(crew_member_data['monthly_hours']['working_hours_data'])
                         )
 
 def move_person_data(user_selections, moved_personnel, schedule_type):
+    crew = user_selections['selected_crew']
+    year = user_selections['selected_year'].year
+    cache_key = DataCache.get_cache_key(crew, year, schedule_type)
+    data = data_cache.get_document(crew, year, schedule_type)
+
+    # Reorder the personnel of every month in the cached JSON data
+    for month in data["month"]:
+        data_cache.mark_dirty(cache_key, month)
+        data["month"][month] = reorder_month_data(data["month"][month], moves=moved_personnel)
+
+    data_cache.flush(cache_key)
+        
+class RosterTransaction:
+    """
+    Collects roster changes (adds, removes, renames and reorders) for a single
+    crew-year and applies them to both the Overtime and work schedule files in
+    memory, writing each file exactly once on commit.
+
+    Changes are applied in the order renames, removes, adds, reorder so that a
+    renamed member keeps their data and position, and a final ordering can refer
+    to newly added names. All renames apply to the names as they were before the
+    transaction, so A to B and B to C do not chain, and a rename to a name already
+    on the roster is rejected. Renames also carry over to OT_Slots entries holding
+    the old name and to the entry tracking logs of the year. Removals leave both
+    alone, so the member's history stays on record.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        start_month (int, optional): First month the adds, removes and renames
+            apply to. Reorders apply to every month. Defaults to 1.
+    """
+    schedule_types = ("Overtime", "work_schedule")
+
+    def __init__(self, crew, year, start_month=1):
+        self.crew = crew
+        self.year = year
+        self.start_month = start_month
+        self.added = []
+        self.removed = []
+        self.renamed = {}
+        self.moves = []
+        self.order = None
+
+    def add_member(self, name):
+        if name not in self.added:
+            self.added.append(name)
+
+    def remove_member(self, name):
+        if name not in self.removed:
+            self.removed.append(name)
+
+    def rename_member(self, old_name, new_name):
+        if old_name == new_name:
+            return
+        if any(other != old_name and renamed_to == new_name for other, renamed_to in self.renamed.items()):
+            raise ValueError(f"Cannot rename {old_name} to {new_name}: another member is already being renamed to {new_name}")
+        self.renamed[old_name] = new_name
+
+    def check_changes(self):
+        """
+        Raises ValueError if the collected changes cannot be applied to the crew-year,
+        see check_renames(). Nothing is changed.
+        """
+        if self.renamed:
+            for schedule_type in self.schedule_types:
+                self.check_renames(data_cache.get_document(self.crew, self.year, schedule_type, months=range(self.start_month, 13)))
+
+    def check_renames(self, document):
+        """
+        Raises ValueError if a rename would replace a member already called the new
+        name in any month it applies to. A member who is renamed away frees their name.
+        """
+        for month, month_data in document["month"].items():
+            if int(month) < self.start_month:
+                continue
+            for old_name, new_name in self.renamed.items():
+                if old_name in month_data and new_name in month_data and new_name not in self.renamed:
+                    raise ValueError(f"Cannot rename {old_name} to {new_name}: {new_name} is already on the {self.crew} {self.year} roster in month {month}")
+
+    def move_member(self, name, new_position):
+        self.moves.append((name, new_position))
+
+    def set_order(self, names):
+        self.order = list(names)
+
+    def get_schedule_types(self):
+        """
+        Returns the schedule types a commit writes, OT_Slots only for renames.
+        """
+        return self.schedule_types + (OT_SLOTS,) if self.renamed else self.schedule_types
+
+    def has_changes(self):
+        return bool(self.added or self.removed or self.renamed or self.moves or self.order)
+
+    def apply_to_month(self, month_data, schedule_type, month):
+        """
+        Applies the collected changes to one month of loaded JSON data and returns
+        the updated month dictionary.
+        """
+        if month >= self.start_month:
+            if any(old_name in month_data for old_name in self.renamed):
+                # Every name is looked up once, so renames neither chain nor collide
+                month_data = {self.renamed.get(name, name): data for name, data in month_data.items()}
+
+            for name in self.removed:
+                month_data.pop(name, None)
+
+            for name in self.added:
+                if name in month_data:
+                    continue
+                month_data[name] = new_member_entry(schedule_type)
+
+        if self.moves or self.order:
+            month_data = reorder_month_data(month_data, moves=self.moves, order=self.order)
+
+        return month_data
+
+    def commit(self):
+        """
+        Applies the collected changes to every month of both schedule types and
+        writes each schedule file once.
+
+        Returns:
+            dict: The months that changed for each of "Overtime", "work_schedule"
+            and OT_SLOTS, and the "tracking_logs" that were rewritten.
+        """
+        if not self.has_changes():
+            return {}
+
+        with WriteJournal():
+            hold_schedule_locks(self.crew, [self.year], self.get_schedule_types())
+            summary = self.apply_to_schedules()
+            summary[OT_SLOTS] = self.apply_to_slots()
+            summary["tracking_logs"] = self.apply_to_tracking_logs()
+
+        self.added, self.removed, self.renamed, self.moves, self.order = [], [], {}, [], None
+        return summary
+
+    def apply_to_schedules(self):
+        """
+        Applies the collected changes to both schedule types through the cache.
+        Only months that actually change are marked dirty.
+
+        Returns:
+            dict: The changed months of each schedule type.
+        """
+        # Checked for both schedule types before either is changed
+        self.check_changes()
+
+        summary = {}
+        for schedule_type in self.schedule_types:
+            cache_key = DataCache.get_cache_key(self.crew, self.year, schedule_type)
+            if self.moves or self.order:
+                data = data_cache.get_document(self.crew, self.year, schedule_type)
+            else:
+                data = data_cache.get_document(self.crew, self.year, schedule_type, months=range(self.start_month, 13))
+
+            changed = []
+            for month in data["month"]:
+                if int(month) < self.start_month and not (self.moves or self.order):
+                    continue
+                month_data = data["month"][month]
+                updated = self.apply_to_month(dict(month_data), schedule_type, int(month))
+                if list(updated.items()) != list(month_data.items()):
+                    data_cache.mark_dirty(cache_key, month)
+                    data["month"][month] = updated
+                    changed.append(month)
+
+            data_cache.flush(cache_key)
+            summary[schedule_type] = sorted(changed, key=int)
+        return summary
+
+    def apply_to_slots(self):
+        """
+        Replaces the renamed members' names in the year's OT_Slots entries.
+
+        Returns:
+            list[str]: The changed months.
+        """
+        if not self.renamed:
+            return []
+        if uses_database(get_paths().get_slots_filepath(self.crew, self.year)):
+            return rename_slot_entries_in_db(self.crew, self.year, self.renamed, self.start_month)
+
+        cache_key = DataCache.get_cache_key(self.crew, self.year, OT_SLOTS)
+        document = data_cache.get_document(self.crew, self.year, OT_SLOTS, months=range(self.start_month, 13))
+        changed = []
+        for month, month_slots in document["month"].items():
+            if int(month) < self.start_month:
+                continue
+            updated = {
+                slot: [self.renamed.get(entry, entry) for entry in entries] if slot != "count" else entries
+                for slot, entries in month_slots.items()
+            }
+            if updated != month_slots:
+                data_cache.mark_dirty(cache_key, month)
+                document["month"][month] = updated
+                changed.append(month)
+
+        if changed:
+            data_cache.flush(cache_key)
+        return sorted(changed, key=int)
+
+    def apply_to_tracking_logs(self):
+        """
+        Replaces the renamed members' names in the entry tracking logs of the year,
+        where each entry is recorded as "<type>_<name> <date> - Entered: <value>".
+
+        Returns:
+            list[str]: The rewritten log files.
+        """
+        crew_folder = os.path.normpath(os.path.join(TRACKING_LOGS_DIR, self.crew))
+        if not self.renamed or not os.path.isdir(crew_folder):
+            return []
+
+        pattern = re.compile(r" - ([war])_(" + "|".join(re.escape(name) for name in self.renamed) + r") (\d{8})? - Entered:")
+        rewritten = []
+        for month in range(self.start_month, 13):
+            log_path = os.path.normpath(os.path.join(crew_folder, f"{self.crew}_{self.year}_{month:02d}.log"))
+            if not os.path.exists(log_path):
+                continue
+            with open(log_path, 'r') as file:
+                contents = file.read()
+            updated = pattern.sub(lambda match: f" - {match.group(1)}_{self.renamed[match.group(2)]} {match.group(3) or ''} - Entered:", contents)
+            if updated != contents:
+                write_file(log_path, updated)
+                rewritten.append(log_path)
+        return rewritten
+
+def apply_roster_change(crew, years, start_month, change):
+    """
+    Runs one roster change through a RosterTransaction for each year, all landing
+    together through a single WriteJournal.
+
+    Args:
+        crew (str): The crew identifier.
+        years (int or iterable): The year or years to change.
+        start_month (int): First month of the earliest year; later years change
+            from January.
+        change (callable): Called with each year's RosterTransaction.
+
+    Returns:
+        dict: Each year's RosterTransaction.commit() summary, keyed by year.
+    """
+    years = [years] if isinstance(years, int) else sorted(years)
+    transactions = {}
+    for year in years:
+        transactions[year] = RosterTransaction(crew, year, start_month if year == years[0] else 1)
+        change(transactions[year])
+        # Every year is checked before any of them is changed
+        transactions[year].check_changes()
+
+    summary = {}
+    with WriteJournal():
+        hold_schedule_locks(crew, years, {schedule_type for transaction in transactions.values() for schedule_type in transaction.get_schedule_types()})
+        for year, transaction in transactions.items():
+            summary[year] = transaction.commit()
+    return summary
+
+def rename_crew_member_in_years(old_name, new_name, crew, years, start_month=1):
+    """
+    Renames a crew member in every month of one or more years: both schedule
+    types, the OT_Slots entries and the entry tracking logs, with each file loaded
+    and written once.
+
+    Returns:
+        dict: What changed in each year, keyed by year.
+    """
+    return apply_roster_change(crew, years, start_month, lambda transaction: transaction.rename_member(old_name, new_name))
+
+def remove_crew_member_from_years(name, crew, years, start_month=1):
+    """
+    Removes a crew member from every month of one or more years of both schedule
+    types, with each file loaded and written once.
+
+    Returns:
+        dict: What changed in each year, keyed by year.
+    """
+    return apply_roster_change(crew, years, start_month, lambda transaction: transaction.remove_member(name))
+
+def new_member_entry(schedule_type):
     if schedule_type == "Overtime":
-        schedule_prefix = "OT"
-    else:
-        schedule_prefix = "WS"
+        return {
+            "monthly_hours": {
+                "starting_asking_hours": 0,
+                "starting_working_hours": 0,
+                "total_asking_hours": 0,
+                "total_working_hours": 0,
+                "asking_hours_data": [],
+                "working_hours_data": []
+            }
+        }
+    return {
+        "monthly_hours": {
+            "entry_data": []
+        }
+    }
 
-    shared_path = get_shared_path() or os.getcwd()
-    json_filepath = os.path.normpath(
-        os.path.join(
-            shared_path, "SaveFiles", f"{schedule_prefix}_{user_selections['selected_crew']}_{user_selections['selected_year'].year}.json"
-            )
-        )
+def reorder_month_data(month_data, moves=None, order=None):
+    """
+    Reorders the crew members of one month in a single pass.
 
-    # Load the entire JSON data from the file
-    with open(json_filepath, 'r') as file:
-        data = json.load(file)
+    Args:
+        month_data (dict): Crew member data for the month, keyed by name.
+        moves (list[tuple], optional): (name, new_position) moves applied in sequence.
+        order (list, optional): Final ordering of names. Names not listed keep their
+            relative order after the listed ones.
 
-    # Iterate over all the months in the JSON data
-    for month in data["month"]:
-        # Get the specific month data from the loaded JSON data
-        month_data = data["month"][month]
+    Returns:
+        dict: The reordered month data.
+    """
+    names = [name for name in month_data if "Overtime" not in name]
+    others = [name for name in month_data if "Overtime" in name]
 
-        # Create a list of crew member names and their data, excluding names containing "Overtime"
-        crew_member_list = [(name, month_data[name]) for name in month_data if "Overtime" not in name]
+    if order is not None:
+        rank = {name: i for i, name in enumerate(order)}
+        names.sort(key=lambda name: rank.get(name, len(rank)))
 
-        # Adjust the order of personnel based on the moved personnel list
-        for moved_name, new_position in moved_personnel:
-            # Find the current position of the moved personnel
-            current_position = next((i for i, (name, _) in enumerate(crew_member_list) if name == moved_name), None)
+    for moved_name, new_position in moves or []:
+        if moved_name in names:
+            names.remove(moved_name)
+            names.insert(new_position, moved_name)
 
-            # Move the personnel to the new position if found
-            if current_position is not None:
-                crew_member_list.insert(new_position, crew_member_list.pop(current_position))
+    return {name: month_data[name] for name in names + others}
 
-        # Update the month data with the reordered personnel
-        month_data = {name: data for name, data in crew_member_list}
+def load_overtime_slots_data(crew, month, year):
+    """
+    Returns a month of overtime slot assignments from the cached OT_Slots document.
 
-        # Update the month data in the loaded JSON data
-        data["month"][month] = month_data
+    Returns:
+        tuple: (slots, count) where slots maps each slot name to its day entries
+        (plus the "count" key as stored) and count is the number of slots shown.
+    """
+    month_slots = dict(data_cache.get_data(crew, month, year, OT_SLOTS))
+    return month_slots, month_slots.get('count', 3)
+
+def save_overtime_slots_data(data, crew, month, year, num_slots):
+    """
+    Stores a month of overtime slot assignments in the cached OT_Slots document and
+    flushes it. Inside a WriteJournal the write lands with the rest of the save.
+
+    Returns:
+        list[MergeConflict]: Slot entries another user saved with a different value.
+    """
+    cache_key = DataCache.get_cache_key(crew, year, OT_SLOTS)
+    document = data_cache.get_document(crew, year, OT_SLOTS, months=[month])
+    data_cache.mark_dirty(cache_key, month)
+
+    month_slots = document['month'].setdefault(str(month), {})
+    month_slots['count'] = num_slots
+    month_slots.update(data)
+    return data_cache.flush(cache_key)
+
+def load_legend_job_codes():
+    if uses_database(LEGEND_CODES):
+        return load_legend_job_codes_from_db()
+    try:
+        with open(get_read_path(LEGEND_CODES), 'r') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
 
-    # Save the updated JSON data back to the file
-    with open(json_filepath, 'w') as file:
-        json.dump(data, file, indent=4)
-        
 def save_legend_job_codes(job_codes):
-    with open(LEGEND_CODES, 'w') as file:
-        json.dump(job_codes, file, indent=4)
\ No newline at end of file
+    if uses_database(LEGEND_CODES):
+        save_legend_job_codes_to_db(job_codes)
+    else:
+        write_json(LEGEND_CODES, job_codes)
\ No newline at end of file
@@ -0,0 +1,149 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+
+
+class MergeConflict:
+    """
+    A cell changed to different values by both sides of a merge. The merged
+    document keeps this user's value.
+
+    Args:
+        month (str): The month of the cell.
+        member (str): The crew member the cell belongs to.
+        field (str): The field path, e.g. "working_hours_data[4]".
+        mine: This user's value.
+        theirs: The value saved by another user.
+    """
+    def __init__(self, month, member, field, mine, theirs):
+        self.month = month
+        self.member = member
+        self.field = field
+        self.mine = mine
+        self.theirs = theirs
+
+    def __repr__(self):
+        return f"MergeConflict(month={self.month}, member={self.member}, field={self.field}, mine={self.mine!r}, theirs={self.theirs!r})"
+
+
+def merge_value(base, mine, theirs, path, conflicts):
+    """
+    Three-way merges one value of a member record.
+
+    Dictionaries are merged key by key and lists cell by cell. Whole numbers are the
+    starting and total hour fields, which are derived from the cells; their changes
+    are added together so both sides' edits carry into the totals. Any other value
+    takes the side that changed it, and a value changed to different things on both
+    sides is recorded as a conflict and keeps this user's value.
+    """
+    if mine == theirs:
+        return mine
+    if mine == base:
+        return theirs
+    if theirs == base:
+        return mine
+
+    if isinstance(mine, dict) and isinstance(theirs, dict):
+        base = base if isinstance(base, dict) else {}
+        merged = {}
+        for key in list(theirs) + [key for key in mine if key not in theirs]:
+            field = f"{path}.{key}" if path else key
+            merged[key] = merge_value(base.get(key), mine.get(key), theirs.get(key), field, conflicts)
+        return merged
+
+    if isinstance(mine, list) and isinstance(theirs, list):
+        base = base if isinstance(base, list) else []
+        length = max(len(base), len(mine), len(theirs))
+        pad = lambda values: values + [""] * (length - len(values))
+        return [
+            merge_value(base_cell, mine_cell, theirs_cell, f"{path}[{index}]", conflicts)
+            for index, (base_cell, mine_cell, theirs_cell) in enumerate(zip(pad(base), pad(mine), pad(theirs)))
+        ]
+
+    if isinstance(mine, int) and isinstance(theirs, int):
+        return mine + theirs - base if isinstance(base, int) else mine
+
+    conflicts.append((path, mine, theirs))
+    return mine
+
+def merge_member_order(base_names, mine_names, theirs_names, merged_names):
+    """
+    Orders the merged roster of a month: this user's order if they moved members,
+    otherwise the saved order, with members added on the other side kept next to
+    the member they followed.
+    """
+    common_mine = [name for name in mine_names if name in base_names]
+    moved_by_mine = common_mine != [name for name in base_names if name in mine_names]
+    primary, secondary = (mine_names, theirs_names) if moved_by_mine else (theirs_names, mine_names)
+
+    order = [name for name in primary if name in merged_names]
+    for position, name in enumerate(secondary):
+        if name not in merged_names or name in order:
+            continue
+        previous = next((secondary[index] for index in range(position - 1, -1, -1) if secondary[index] in order), None)
+        order.insert(order.index(previous) + 1 if previous else 0, name)
+
+    # Overtime slot rows stay at the end of the roster
+    return [name for name in order if "Overtime" not in name] + [name for name in order if "Overtime" in name]
+
+def merge_month(base, mine, theirs, month, conflicts):
+    """
+    Three-way merges one month of a schedule document: the roster first, then every
+    member present on both sides cell by cell.
+
+    Args:
+        base (dict): The month as this user loaded it.
+        mine (dict): The month with this user's unsaved changes.
+        theirs (dict): The month as currently saved by another user.
+        month (str): The month number, for conflict reporting.
+        conflicts (list): MergeConflict records are appended here.
+
+    Returns:
+        dict: The merged month.
+    """
+    base = base or {}
+    merged = {}
+    for name in set(mine) | set(theirs):
+        in_base, in_mine, in_theirs = name in base, name in mine, name in theirs
+        if in_mine and in_theirs and not isinstance(mine[name], (dict, list)):
+            # A plain month setting such as an OT_Slots slot count takes the side that changed it
+            merged[name] = theirs[name] if mine[name] == base.get(name) else mine[name]
+            if mine[name] != theirs[name] and base.get(name) not in (mine[name], theirs[name]):
+                conflicts.append(MergeConflict(month, name, "value", mine[name], theirs[name]))
+        elif in_mine and in_theirs:
+            value_conflicts = []
+            merged[name] = merge_value(base.get(name), mine[name], theirs[name], "", value_conflicts)
+            conflicts.extend(MergeConflict(month, name, *conflict) for conflict in value_conflicts)
+        elif in_mine and not in_base:
+            merged[name] = mine[name]
+        elif in_theirs and not in_base:
+            merged[name] = theirs[name]
+        elif in_mine and mine[name] != base[name]:
+            # Removed by the other user after this user edited them; the removal wins
+            conflicts.append(MergeConflict(month, name, "removed", mine[name], None))
+        elif in_theirs and theirs[name] != base[name]:
+            # Removed by this user after the other user edited them; the removal wins
+            conflicts.append(MergeConflict(month, name, "removed", None, theirs[name]))
+
+    order = merge_member_order(list(base), list(mine), list(theirs), merged)
+    return {name: merged[name] for name in order}
+
+def get_changed_cell_months(base_months, document):
+    """
+    Returns the months whose day entries differ from the base snapshot.
+    """
+    changed = set()
+    for month, base in base_months.items():
+        month_data = document["month"].get(month, {})
+        for name, member_data in month_data.items():
+            if not isinstance(member_data, dict):
+                continue
+            base_hours = (base or {}).get(name, {}).get("monthly_hours", {})
+            monthly_hours = member_data.get("monthly_hours", {})
+            for field, value in monthly_hours.items():
+                if isinstance(value, list) and base_hours.get(field) != value:
+                    changed.add(month)
+    return changed
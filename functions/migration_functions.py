@@ -0,0 +1,176 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import sys
+import json
+import logging
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import log_file
+from constants import LEGEND_CODES
+from PathConfig import get_schedule_prefix
+from functions.storage_functions import get_store, list_schedules
+from functions.write_functions import atomic_write, acquire_lock, release_lock
+from functions.hours_functions import CarryForward
+from functions.schema_functions import SCHEMA_VERSION, upgrade_legend_codes
+from functions.sqlite_functions import uses_database, list_database_schedules
+
+# Logging Format
+logging.basicConfig(level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    filename=log_file,
+                    filemode='a'
+)
+
+def recompute_overtime_totals(document):
+    """
+    Recomputes the starting and total hours of every member of an Overtime year
+    from the day entries, so every month follows the carry rule of CarryForward.
+    Years saved before worked hours were carried into the asking totals of later
+    months are brought in line once; a consistent year is left unchanged.
+
+    Returns:
+        list[str]: A description of every value that changed.
+    """
+    carry_forward = CarryForward()
+    if not carry_forward.check(document):
+        return []
+
+    before = {
+        month: {name: dict(member_data["monthly_hours"]) for name, member_data in month_data.items()}
+        for month, month_data in document["month"].items()
+    }
+    # Each month is recomputed from its starting hours, so members who joined during the year are as well
+    for month in range(1, 13):
+        carry_forward.recalculate(document, month)
+
+    changes = []
+    for month, month_data in document["month"].items():
+        for name, member_data in month_data.items():
+            for field, value in member_data["monthly_hours"].items():
+                if before[month][name][field] != value:
+                    changes.append(f"month {month} {name}.{field}: {before[month][name][field]} recomputed as {value}")
+    return changes
+
+def migrate_schedule(schedule, dry_run=False):
+    """
+    Upgrades one stored schedule to the current schema. The store upgrades the
+    document as it loads it; if the stored data was behind, it is rewritten in
+    place under the schedule's lock. Overtime totals are recomputed as well, see
+    recompute_overtime_totals(). Runs in a worker process of migrate_savefiles().
+
+    The document version is left as it is after a schema upgrade: the data means
+    the same, so other users' unsaved edits still apply to it without a merge. A
+    recompute changes the totals and so bumps the version.
+
+    Args:
+        schedule (tuple): (crew, year, schedule_type) as returned by list_schedules().
+        dry_run (bool, optional): Only report the anomalies, change no files.
+
+    Returns:
+        tuple: (schedule, anomalies, upgraded, error) where error is None on success.
+    """
+    crew, year, schedule_type = schedule
+    try:
+        store = get_store(crew, year, schedule_type)
+        if not store.exists():
+            return schedule, [], False, None
+
+        acquire_lock(store.lock_path)
+        try:
+            document, _ = store.load()
+            # Schedules kept in the database are upgraded as they are loaded and only have their totals recomputed
+            behind = store.schema_anomalies is not None and hasattr(store, "rewrite")
+            anomalies = list(store.schema_anomalies or []) if behind else []
+            recomputed = recompute_overtime_totals(document) if schedule_type == "Overtime" else []
+            anomalies.extend(recomputed)
+            upgraded = (behind or bool(recomputed)) and not dry_run
+            if upgraded:
+                if recomputed:
+                    document["version"] = document.get("version", 0) + 1
+                if hasattr(store, "rewrite"):
+                    store.rewrite(document)
+                else:
+                    store.save(document)
+        finally:
+            release_lock(store.lock_path)
+        return schedule, anomalies, upgraded, None
+    except Exception as e:
+        return schedule, [], False, str(e)
+
+def migrate_legend(dry_run=False):
+    """
+    Validates the work schedule legend file and rewrites it if anything was fixed.
+    A legend kept in the database is left to the database.
+
+    Returns:
+        list[str]: The anomalies found.
+    """
+    if uses_database(LEGEND_CODES) or not os.path.exists(LEGEND_CODES):
+        return []
+
+    with open(LEGEND_CODES, 'r') as file:
+        job_codes, anomalies = upgrade_legend_codes(json.load(file))
+    if anomalies and not dry_run:
+        atomic_write(LEGEND_CODES, json.dumps(job_codes, indent=4))
+    return anomalies
+
+def migrate_savefiles(dry_run=False, workers=None):
+    """
+    Scans every OT, WS and OT_Slots file in SaveFiles plus the legend, reports what
+    does not match the current schema and upgrades it. Schedules are checked in
+    parallel by a process pool, since parsing the files is CPU bound; each one is
+    rewritten atomically under its own lock, so the app can stay open.
+
+    Schedules kept in the database are upgraded as they are loaded; only their
+    Overtime totals are scanned.
+
+    Args:
+        dry_run (bool, optional): Only report, change no files.
+        workers (int, optional): Worker processes. Defaults to the CPU count.
+
+    Returns:
+        dict: "schedules" scanned, "upgraded" schedule names, "anomalies" and
+        "errors" keyed by schedule name (the legend is listed as "legend").
+    """
+    schedules = sorted(set(list_schedules(include_slots=True)).union(list_database_schedules("Overtime")))
+    report = {"schedules": len(schedules), "upgraded": [], "anomalies": {}, "errors": {}}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for (crew, year, schedule_type), anomalies, upgraded, error in executor.map(migrate_schedule, schedules, repeat(dry_run)):
+            name = f"{get_schedule_prefix(schedule_type)}_{crew}_{year}"
+            if anomalies:
+                report["anomalies"][name] = anomalies
+            if upgraded:
+                report["upgraded"].append(name)
+            if error:
+                report["errors"][name] = error
+                logging.error(f"Failed to migrate {name}: {error}")
+
+    try:
+        legend_anomalies = migrate_legend(dry_run)
+        if legend_anomalies:
+            report["anomalies"]["legend"] = legend_anomalies
+    except Exception as e:
+        report["errors"]["legend"] = str(e)
+        logging.error(f"Failed to migrate the legend: {str(e)}")
+
+    logging.info(f"Schema {SCHEMA_VERSION}: scanned {len(schedules)} schedules, upgraded {len(report['upgraded'])}, {len(report['errors'])} errors")
+    return report
+
+if __name__ == "__main__":
+    # Usage: python -m functions.migration_functions migrate|validate
+    if sys.argv[1:] in (["migrate"], ["validate"]):
+        report = migrate_savefiles(dry_run=sys.argv[1] == "validate")
+        for name, anomalies in sorted(report["anomalies"].items()):
+            for anomaly in anomalies:
+                print(f"{name}: {anomaly}")
+        for name, error in sorted(report["errors"].items()):
+            print(f"{name}: failed: {error}")
+        print(f"Scanned {report['schedules']} schedules, {len(report['anomalies'])} with anomalies, {len(report['upgraded'])} upgraded to schema {SCHEMA_VERSION}")
+    else:
+        print("Usage: python -m functions.migration_functions migrate|validate")
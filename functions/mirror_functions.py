@@ -0,0 +1,258 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import time
+import uuid
+import shutil
+import hashlib
+import logging
+import threading
+from functools import lru_cache
+from contextlib import contextmanager
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import log_file
+from constants import LOCAL_MIRROR_DIR
+from PathConfig import get_paths, get_shared_path
+from functions.write_functions import get_temp_path
+
+# Logging Format
+logging.basicConfig(level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    filename=log_file,
+                    filemode='a'
+)
+
+# Seconds between background passes that bring the whole mirror up to date
+MIRROR_SYNC_INTERVAL = 30.0
+
+# Only data files are mirrored; logs, locks, temp files, the journal and the database are not
+MIRRORED_EXTENSIONS = (".json", ".jsonl")
+UNMIRRORED_FOLDERS = ("TrackingLogs",)
+
+_sync_started = threading.Event()
+_share_available = threading.Event()
+_share_available.set()
+_reading_share = threading.local()
+
+def get_share_folder():
+    """
+    Returns the SaveFiles folder on the share, or None when no shared path is set
+    and SaveFiles is already local.
+    """
+    paths = get_paths()
+    if not paths.shared_path:
+        return None
+    return paths.save_folder
+
+def check_share():
+    """
+    Checks whether the shared path can be reached and records the result for
+    is_share_available().
+
+    Returns:
+        bool: True if the share is reachable or SaveFiles is local.
+    """
+    shared_path = get_shared_path()
+    if not shared_path or os.path.isdir(shared_path):
+        _share_available.set()
+        return True
+    _share_available.clear()
+    return False
+
+def is_share_available():
+    """
+    Returns the result of the last share check without touching the network.
+    """
+    return _share_available.is_set()
+
+@lru_cache(maxsize=None)
+def get_mirror_folder(share_folder):
+    """
+    Returns the local mirror of a share's SaveFiles folder. Each share gets its own
+    folder so changing the shared path never serves another share's files.
+    """
+    key = hashlib.sha1(os.path.normcase(share_folder).encode("utf-8")).hexdigest()[:12]
+    return os.path.normpath(os.path.join(LOCAL_MIRROR_DIR, key))
+
+def is_mirrored(relative_path):
+    parts = os.path.normpath(relative_path).split(os.sep)
+    if parts[0] in UNMIRRORED_FOLDERS or any(part.startswith(".") for part in parts):
+        return False
+    return parts[-1].endswith(MIRRORED_EXTENSIONS)
+
+def get_mirror_path(path):
+    """
+    Returns the local mirror path of a file in the shared SaveFiles folder, or None
+    if the file is not mirrored.
+    """
+    share_folder = get_share_folder()
+    if share_folder is None:
+        return None
+    try:
+        relative_path = os.path.relpath(os.path.abspath(path), share_folder)
+    except ValueError:
+        # On another drive
+        return None
+    if relative_path.startswith(os.pardir) or not is_mirrored(relative_path):
+        return None
+    return os.path.normpath(os.path.join(get_mirror_folder(share_folder), relative_path))
+
+def is_current(mirror_path, share_stat):
+    """
+    Returns True if the mirror copy matches a share file's size and modification time.
+    """
+    try:
+        local_stat = os.stat(mirror_path)
+    except FileNotFoundError:
+        return False
+    return local_stat.st_size == share_stat.st_size and local_stat.st_mtime_ns == share_stat.st_mtime_ns
+
+def refresh_mirror_file(path, mirror_path, share_stat):
+    """
+    Copies a share file into the mirror and stamps the copy with the share file's
+    modification time, which is what later revalidation compares against.
+    """
+    os.makedirs(os.path.dirname(mirror_path), exist_ok=True)
+    temp_path = get_temp_path(mirror_path, uuid.uuid4().hex)
+    try:
+        shutil.copyfile(path, temp_path)
+        os.utime(temp_path, ns=(share_stat.st_atime_ns, share_stat.st_mtime_ns))
+        os.replace(temp_path, mirror_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def get_read_path(path):
+    """
+    Returns the path to read a SaveFiles file from: the local mirror copy when it
+    matches the share, refreshed first if it does not. The share stays authoritative;
+    only a stat of the share file is paid when the copy is current. Files that are
+    not mirrored, or that cannot be copied, are read from the share. While the share
+    cannot be reached the last mirrored copy is served as it is.
+
+    Raises:
+        FileNotFoundError: If the file does not exist on the share, or the share is
+            unreachable and the file was never mirrored.
+    """
+    mirror_path = get_mirror_path(path)
+    if mirror_path is None or getattr(_reading_share, "active", False):
+        return path
+
+    try:
+        share_stat = os.stat(path)
+    except OSError:
+        if not check_share() and os.path.exists(mirror_path):
+            return mirror_path
+        raise
+    if is_current(mirror_path, share_stat):
+        return mirror_path
+    try:
+        refresh_mirror_file(path, mirror_path, share_stat)
+    except OSError as e:
+        logging.error(f"Failed to mirror {path}: {str(e)}")
+        return path
+    return mirror_path
+
+@contextmanager
+def read_from_share():
+    """
+    Makes get_read_path() return the share files themselves on this thread while
+    active. The mirror only compares sizes and modification times, so a save that
+    left both unchanged is missed; the compare-and-swap step of a save reads through
+    this to merge what was actually saved.
+    """
+    reading_share = getattr(_reading_share, "active", False)
+    _reading_share.active = True
+    try:
+        yield
+    finally:
+        _reading_share.active = reading_share
+
+def is_readable(path):
+    """
+    Returns True if a SaveFiles file exists, or while the share is offline, if its
+    mirror copy does.
+    """
+    if os.path.exists(path):
+        return True
+    if is_share_available():
+        return False
+    mirror_path = get_mirror_path(path)
+    return bool(mirror_path) and os.path.exists(mirror_path)
+
+def scan_share(folder, relative_folder=""):
+    """
+    Yields (relative_path, stat) for every mirrored file under folder. Directory
+    listings carry the file stats, so a pass costs one listing per folder.
+    """
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            relative_path = os.path.join(relative_folder, entry.name)
+            if entry.is_dir():
+                if entry.name not in UNMIRRORED_FOLDERS and not entry.name.startswith("."):
+                    yield from scan_share(entry.path, relative_path)
+            elif is_mirrored(relative_path):
+                yield relative_path, entry.stat()
+
+def sync_mirror():
+    """
+    Brings the whole mirror up to date with the share: copies new and changed files
+    and removes copies of files that no longer exist on the share, along with the
+    folders they leave empty (e.g. years moved to the archive).
+
+    Returns:
+        int: The number of files copied.
+    """
+    share_folder = get_share_folder()
+    if share_folder is None or not os.path.isdir(share_folder):
+        return 0
+    mirror_folder = get_mirror_folder(share_folder)
+
+    copied = 0
+    share_files = set()
+    for relative_path, share_stat in scan_share(share_folder):
+        share_files.add(os.path.normcase(relative_path))
+        mirror_path = os.path.normpath(os.path.join(mirror_folder, relative_path))
+        if is_current(mirror_path, share_stat):
+            continue
+        try:
+            refresh_mirror_file(os.path.join(share_folder, relative_path), mirror_path, share_stat)
+            copied += 1
+        except FileNotFoundError:
+            # Replaced or removed since the listing; the next pass picks it up
+            continue
+
+    for directory, _, filenames in os.walk(mirror_folder, topdown=False):
+        for filename in filenames:
+            if filename.startswith("."):
+                continue
+            mirror_path = os.path.join(directory, filename)
+            relative_path = os.path.relpath(mirror_path, mirror_folder)
+            if os.path.normcase(relative_path) not in share_files:
+                os.remove(mirror_path)
+        if directory != mirror_folder and not os.listdir(directory):
+            os.rmdir(directory)
+    return copied
+
+def start_mirror_sync(interval=MIRROR_SYNC_INTERVAL):
+    """
+    Starts the background thread that keeps the mirror in sync with the share.
+    Only the first call starts a thread.
+    """
+    if _sync_started.is_set() or get_share_folder() is None:
+        return
+    _sync_started.set()
+
+    def run():
+        while True:
+            try:
+                sync_mirror()
+            except Exception as e:
+                logging.error(f"Failed to sync the local SaveFiles mirror: {str(e)}")
+            time.sleep(interval)
+
+    threading.Thread(target=run, daemon=True).start()
@@ -0,0 +1,210 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import json
+import time
+import uuid
+import base64
+import logging
+import threading
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import log_file
+from constants import LOCAL_OUTBOX_DIR
+from functions.merge_functions import MergeConflict
+from functions.write_functions import atomic_write, append_now, write_temp_file, get_temp_path, set_offline_handler
+from functions.mirror_functions import check_share, get_mirror_path
+
+# Logging Format
+logging.basicConfig(level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    filename=log_file,
+                    filemode='a'
+)
+
+# Seconds between checks of whether the share can be reached
+SHARE_CHECK_INTERVAL = 5.0
+
+_monitor_started = threading.Event()
+
+def get_outbox_folder(kind):
+    """
+    Returns the outbox folder for queued schedule documents ("documents") or
+    queued file writes ("files").
+    """
+    return os.path.normpath(os.path.join(LOCAL_OUTBOX_DIR, kind))
+
+def get_file_stamp(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+def save_outbox_document(cache_key, entry):
+    """
+    Durably stores a schedule document with unsaved changes until the share is back.
+
+    Args:
+        cache_key (str): The document's cache key.
+        entry (dict): The document, its dirty months and their merge bases.
+    """
+    folder = get_outbox_folder("documents")
+    os.makedirs(folder, exist_ok=True)
+    atomic_write(os.path.normpath(os.path.join(folder, f"{cache_key}.json")), json.dumps(entry))
+
+def load_outbox_documents():
+    """
+    Returns {cache_key: entry} for every queued schedule document.
+    """
+    folder = get_outbox_folder("documents")
+    if not os.path.isdir(folder):
+        return {}
+
+    entries = {}
+    for filename in sorted(os.listdir(folder)):
+        if filename.startswith(".") or not filename.endswith(".json"):
+            continue
+        try:
+            with open(os.path.join(folder, filename), 'r') as file:
+                entries[filename[:-len(".json")]] = json.load(file)
+        except (OSError, ValueError) as e:
+            logging.error(f"Failed to read queued offline save {filename}: {str(e)}")
+    return entries
+
+def remove_outbox_document(cache_key):
+    try:
+        os.remove(os.path.normpath(os.path.join(get_outbox_folder("documents"), f"{cache_key}.json")))
+    except FileNotFoundError:
+        pass
+
+def queue_file_write(target, contents, append=False):
+    """
+    Durably queues one file write or append. The target's stamp as this user last
+    saw it is recorded so replaying can tell whether another user changed the file
+    in the meantime. The local mirror copy is updated so offline reads see the write.
+    """
+    folder = get_outbox_folder("files")
+    os.makedirs(folder, exist_ok=True)
+
+    mirror_path = get_mirror_path(target)
+    expected = get_file_stamp(mirror_path) if mirror_path else None
+    binary = isinstance(contents, bytes)
+    record = {
+        "target": target,
+        "append": append,
+        "binary": binary,
+        "contents": base64.b64encode(contents).decode("ascii") if binary else contents,
+        "expected": expected,
+        "checked": mirror_path is not None,
+    }
+    atomic_write(os.path.normpath(os.path.join(folder, f"{time.time_ns()}_{uuid.uuid4().hex}.json")), json.dumps(record))
+
+    if mirror_path and expected is not None:
+        if append:
+            append_now(mirror_path, contents)
+        else:
+            # Keeps the copy's stamp, so it is served until the share changes or the write is replayed
+            temp_path = get_temp_path(mirror_path, uuid.uuid4().hex)
+            write_temp_file(temp_path, contents)
+            os.utime(temp_path, ns=(expected[1], expected[1]))
+            os.replace(temp_path, mirror_path)
+
+def queue_file_writes(staged, appends):
+    """
+    WriteJournal offline handler: queues a commit's writes if the share cannot be
+    reached. Schedule documents are not among them, DataCache.flush() queues those
+    in the document outbox.
+
+    Returns:
+        bool: True if the writes were queued.
+    """
+    if check_share():
+        return False
+    for target, contents in staged.items():
+        queue_file_write(target, contents)
+    for target, contents in appends.items():
+        queue_file_write(target, contents, append=True)
+    if staged or appends:
+        logging.error(f"Share unavailable, queued {len(staged) + len(appends)} file writes for later")
+    return True
+
+set_offline_handler(queue_file_writes)
+
+def replay_file_writes():
+    """
+    Writes the queued file writes to the share in the order they were made. A file
+    that another user changed since it was queued is not replaced: the queued write
+    is dropped and reported as a conflict. Appends are always made, and so are
+    writes to files outside the mirror, whose stamp was not known when queued.
+
+    Returns:
+        list[MergeConflict]: Files another user changed while this user was offline.
+    """
+    folder = get_outbox_folder("files")
+    if not os.path.isdir(folder):
+        return []
+
+    conflicts = []
+    written = set()
+    skipped = set()
+    for filename in sorted(os.listdir(folder)):
+        if filename.startswith(".") or not filename.endswith(".json"):
+            continue
+        record_path = os.path.normpath(os.path.join(folder, filename))
+        with open(record_path, 'r') as file:
+            record = json.load(file)
+
+        target = record["target"]
+        contents = base64.b64decode(record["contents"]) if record["binary"] else record["contents"]
+        # Records queued before "checked" was kept only know the stamp of mirrored files
+        checked = record.get("checked", record["expected"] is not None)
+        if not record["append"] and (target in skipped or (target not in written and checked and get_file_stamp(target) != record["expected"])):
+            if target not in skipped:
+                conflicts.append(MergeConflict("-", os.path.basename(target), "file", "saved offline", "changed by another user"))
+                logging.error(f"Dropped the offline write of {target}, another user changed it meanwhile")
+            skipped.add(target)
+            os.remove(record_path)
+            continue
+
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        if record["append"]:
+            append_now(target, contents)
+        else:
+            atomic_write(target, contents)
+        written.add(target)
+        os.remove(record_path)
+    return conflicts
+
+def count_queued_writes():
+    """
+    Returns the number of schedule documents and file writes waiting for the share.
+    """
+    count = 0
+    for kind in ("documents", "files"):
+        folder = get_outbox_folder(kind)
+        if os.path.isdir(folder):
+            count += sum(1 for filename in os.listdir(folder) if filename.endswith(".json") and not filename.startswith("."))
+    return count
+
+def start_share_monitor(interval=SHARE_CHECK_INTERVAL):
+    """
+    Starts the background thread that rechecks whether the share can be reached,
+    so the UI can read is_share_available() without touching the network. Only the
+    first call starts a thread.
+    """
+    if _monitor_started.is_set():
+        return
+    _monitor_started.set()
+
+    def run():
+        while True:
+            try:
+                check_share()
+            except Exception as e:
+                logging.error(f"Failed to check the shared SaveFiles folder: {str(e)}")
+            time.sleep(interval)
+
+    threading.Thread(target=run, daemon=True).start()
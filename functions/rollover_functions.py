@@ -0,0 +1,154 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import sys
+import json
+import logging
+import datetime
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import log_file
+from constants import TRACKING_LOGS_DIR
+from PathConfig import get_paths
+from functions.json_functions import build_new_year_document
+from functions.storage_functions import OT_SLOTS
+from functions.storage_functions import get_store, list_schedules
+from functions.sqlite_functions import list_database_crews, uses_database
+from functions.sqlite_functions import has_overtime_slots_in_db, save_overtime_slots_to_db
+from functions.write_functions import atomic_write, acquire_lock, release_lock
+
+# Logging Format
+logging.basicConfig(level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    filename=log_file,
+                    filemode='a'
+)
+
+ROLLOVER_SCHEDULE_TYPES = ("Overtime", "work_schedule", OT_SLOTS)
+
+def get_rollover_report_path(year):
+    return os.path.join(TRACKING_LOGS_DIR, f"rollover_{year}.json")
+
+def rollover_crew(crew, year):
+    """
+    Creates a crew's Overtime, work schedule and OT_Slots files for a new year from
+    the previous year, the same documents the app would create when the year is
+    first opened. A file that already exists is left alone, so the rollover can be
+    run again safely. Runs in a worker process of rollover_all_crews().
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The new schedule year.
+
+    Returns:
+        tuple: (crew, record, error) where record lists the schedule types
+        "created" and "skipped", the "members" seeded per schedule type, the
+        Overtime "seeds" as {name: [starting_working_hours, starting_asking_hours]}
+        and the seeded "slot_count", and error is None on success.
+    """
+    record = {"created": [], "skipped": [], "members": {}, "seeds": {}, "slot_count": None}
+    try:
+        for schedule_type in ROLLOVER_SCHEDULE_TYPES:
+            store = get_store(crew, year, schedule_type)
+            # OT slots moved to the schedule database are seeded there, the way
+            # OvertimeSlots.save_overtime_slots() saves them
+            in_database = schedule_type == OT_SLOTS and uses_database(get_paths().get_slots_filepath(crew, year))
+            os.makedirs(os.path.dirname(store.lock_path), exist_ok=True)
+            acquire_lock(store.lock_path)
+            try:
+                # Checked under the lock so a user opening the year meanwhile
+                # cannot have their file replaced
+                if has_overtime_slots_in_db(crew, year) if in_database else store.exists():
+                    record["skipped"].append(schedule_type)
+                    continue
+                document = build_new_year_document(crew, year, schedule_type)
+                if in_database:
+                    for month, month_slots in document["month"].items():
+                        if "count" in month_slots:
+                            save_overtime_slots_to_db({}, crew, month, year, month_slots["count"])
+                else:
+                    store.save(document)
+            finally:
+                release_lock(store.lock_path)
+
+            record["created"].append(schedule_type)
+            january = document["month"]["1"]
+            if schedule_type == OT_SLOTS:
+                record["slot_count"] = january.get("count")
+                continue
+            record["members"][schedule_type] = len(january)
+            if schedule_type == "Overtime":
+                record["seeds"] = {
+                    name: [member_data["monthly_hours"]["starting_working_hours"], member_data["monthly_hours"]["starting_asking_hours"]]
+                    for name, member_data in january.items()
+                }
+        return crew, record, None
+    except Exception as e:
+        return crew, record, str(e)
+
+def write_rollover_report(year, run):
+    """
+    Appends a rollover run to the year's audit report in TrackingLogs, a JSON file
+    holding {"runs": [...]} oldest first.
+
+    Returns:
+        str: The path of the report.
+    """
+    report_path = get_rollover_report_path(year)
+    report = {"runs": []}
+    if os.path.exists(report_path):
+        with open(report_path, 'r') as file:
+            report = json.load(file)
+    report["runs"].append(run)
+
+    os.makedirs(os.path.dirname(report_path), exist_ok=True)
+    atomic_write(report_path, json.dumps(report, indent=4))
+    return report_path
+
+def rollover_all_crews(year=None, workers=None):
+    """
+    Rolls every crew with a schedule in the previous year over to a new year, see
+    rollover_crew(). Crews are processed in parallel by a process pool and the
+    outcome is appended to the year's audit report.
+
+    Args:
+        year (int, optional): The new schedule year. Defaults to the current year.
+        workers (int, optional): Worker processes. Defaults to the CPU count.
+
+    Returns:
+        dict: The run as written to the report: "year", "started", "finished",
+        "crews" keyed by crew and "errors" keyed by crew.
+    """
+    year = datetime.date.today().year if year is None else year
+    crews = {crew for crew, schedule_year, _ in list_schedules(include_archive=True) if schedule_year == year - 1}
+    crews = sorted(crews.union(list_database_crews(year - 1)))
+    run = {"year": year, "started": datetime.datetime.now().isoformat(timespec="seconds"), "crews": {}, "errors": {}}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for crew, record, error in executor.map(rollover_crew, crews, repeat(year)):
+            run["crews"][crew] = record
+            if error:
+                run["errors"][crew] = error
+                logging.error(f"Failed to roll crew {crew} over to {year}: {error}")
+
+    run["finished"] = datetime.datetime.now().isoformat(timespec="seconds")
+    write_rollover_report(year, run)
+    created = sum(len(record["created"]) for record in run["crews"].values())
+    logging.info(f"Rollover to {year}: {len(crews)} crews, {created} files created, {len(run['errors'])} errors")
+    return run
+
+if __name__ == "__main__":
+    # Usage: python -m functions.rollover_functions [year]
+    if len(sys.argv) <= 2 and all(arg.isdigit() for arg in sys.argv[1:]):
+        run = rollover_all_crews(int(sys.argv[1]) if len(sys.argv) == 2 else None)
+        for crew, record in sorted(run["crews"].items()):
+            print(f"{crew}: created {', '.join(record['created']) or 'nothing'}; skipped {', '.join(record['skipped']) or 'nothing'}")
+        for crew, error in sorted(run["errors"].items()):
+            print(f"{crew}: failed: {error}")
+        print(f"Rolled {len(run['crews'])} crews over to {run['year']}, report in {get_rollover_report_path(run['year'])}")
+    else:
+        print("Usage: python -m functions.rollover_functions [year]")
@@ -0,0 +1,167 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+
+
+# Version of the schedule document layout described below. Documents carry it in
+# "schema_version"; files written before it existed count as version 0.
+#
+#   Overtime:       {"month": {"1": {name: {"monthly_hours": {
+#                       "starting_asking_hours": int, "starting_working_hours": int,
+#                       "total_asking_hours": int, "total_working_hours": int,
+#                       "asking_hours_data": [str], "working_hours_data": [str]}}}}}
+#   work_schedule:  {"month": {"1": {name: {"monthly_hours": {"entry_data": [str]}}}}}
+#   OT_Slots:       {"month": {"1": {"count": int, slot: [str]}}}
+#
+# Month keys are "1" to "12" and no month holds a "[placeholder]" member.
+SCHEMA_VERSION = 2
+
+OVERTIME_HOURS_FIELDS = ("starting_asking_hours", "starting_working_hours", "total_asking_hours", "total_working_hours")
+OVERTIME_DAY_FIELDS = ("asking_hours_data", "working_hours_data")
+
+DEFAULT_SLOT_COUNT = 3
+
+def needs_upgrade(document):
+    return document.get("schema_version", 0) < SCHEMA_VERSION
+
+def get_month_key(month):
+    """
+    Returns the canonical key of a month ("1" to "12"), or None if it is not a month.
+    """
+    try:
+        month = int(month)
+    except (TypeError, ValueError):
+        return None
+    return str(month) if 1 <= month <= 12 else None
+
+def to_int(value, default, anomalies, where):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if value is None:
+        anomalies.append(f"{where}: missing, stored {default}")
+        return default
+    try:
+        converted = int(value)
+    except (TypeError, ValueError):
+        converted = default
+    anomalies.append(f"{where}: {value!r} is not a whole number, stored {converted}")
+    return converted
+
+def to_entries(value, anomalies, where):
+    if not isinstance(value, list):
+        anomalies.append(f"{where}: {type(value).__name__} is not a list of day entries, stored []")
+        return []
+    if all(isinstance(entry, str) for entry in value):
+        return value
+    anomalies.append(f"{where}: day entries converted to text")
+    return ["" if entry is None else str(entry) for entry in value]
+
+def upgrade_overtime_member(monthly_hours, anomalies, where):
+    upgraded = {}
+    for field in OVERTIME_HOURS_FIELDS:
+        upgraded[field] = to_int(monthly_hours.get(field), 0, anomalies, f"{where}.{field}")
+    for field in OVERTIME_DAY_FIELDS:
+        upgraded[field] = to_entries(monthly_hours.get(field, []), anomalies, f"{where}.{field}")
+    return upgraded
+
+def upgrade_work_schedule_member(monthly_hours, month, anomalies, where):
+    if "entry_data" not in monthly_hours and isinstance(monthly_hours.get(month), dict):
+        # Older versions kept the entries under the month number
+        anomalies.append(f"{where}: entries keyed by month {month}")
+        monthly_hours = monthly_hours[month]
+    if "entry_data" not in monthly_hours and "role_data" in monthly_hours:
+        anomalies.append(f"{where}: role_data renamed to entry_data")
+        monthly_hours = {"entry_data": monthly_hours["role_data"]}
+    return {"entry_data": to_entries(monthly_hours.get("entry_data", []), anomalies, f"{where}.entry_data")}
+
+def upgrade_month(month_data, schedule_type, month, anomalies):
+    """
+    Returns one month of a schedule document in the current schema.
+    """
+    upgraded = {}
+    for name, member_data in month_data.items():
+        where = f"month {month} {name}"
+        if name == "[placeholder]":
+            anomalies.append(f"month {month}: removed [placeholder] entry")
+            continue
+
+        if schedule_type == "OT_Slots":
+            if name == "count":
+                upgraded[name] = to_int(member_data, DEFAULT_SLOT_COUNT, anomalies, where)
+            else:
+                upgraded[name] = to_entries(member_data, anomalies, where)
+            continue
+
+        monthly_hours = member_data.get("monthly_hours") if isinstance(member_data, dict) else None
+        if not isinstance(monthly_hours, dict):
+            anomalies.append(f"{where}: missing monthly_hours")
+            monthly_hours = {}
+        if schedule_type == "Overtime":
+            upgraded[name] = {"monthly_hours": upgrade_overtime_member(monthly_hours, anomalies, where)}
+        else:
+            upgraded[name] = {"monthly_hours": upgrade_work_schedule_member(monthly_hours, month, anomalies, where)}
+    return upgraded
+
+def upgrade_document(document, schedule_type):
+    """
+    Brings a loaded schedule document up to SCHEMA_VERSION in place: month keys are
+    made canonical, "[placeholder]" entries are removed, missing or mistyped fields
+    get their defaults and legacy work schedule entries are moved to entry_data.
+    Upgrading a current document changes nothing.
+
+    Args:
+        document (dict): The document as loaded, with a "month" mapping.
+        schedule_type (str): "Overtime", "work_schedule" or "OT_Slots".
+
+    Returns:
+        list[str]: A description of every anomaly that was fixed.
+    """
+    anomalies = []
+    months = document.get("month")
+    if not isinstance(months, dict):
+        anomalies.append("missing month mapping")
+        months = {}
+
+    upgraded = {}
+    for month, month_data in months.items():
+        key = get_month_key(month)
+        if key is None or key in upgraded:
+            anomalies.append(f"dropped month {month!r}")
+            continue
+        if key != month:
+            anomalies.append(f"month {month!r} renamed to {key!r}")
+        if not isinstance(month_data, dict):
+            anomalies.append(f"month {key}: {type(month_data).__name__} is not a month, stored {{}}")
+            month_data = {}
+        upgraded[key] = upgrade_month(month_data, schedule_type, key, anomalies)
+
+    document["month"] = upgraded
+    document["schema_version"] = SCHEMA_VERSION
+    return anomalies
+
+def upgrade_legend_codes(job_codes):
+    """
+    Validates the work schedule legend, a mapping of job code numbers to names.
+    The legend carries no schema_version since older versions read every key as a
+    job code.
+
+    Returns:
+        tuple: (job_codes, anomalies) with the legend as text keys and values, empty
+        names removed.
+    """
+    if not isinstance(job_codes, dict):
+        return {}, [f"legend: {type(job_codes).__name__} is not a mapping, stored {{}}"]
+
+    anomalies = []
+    upgraded = {}
+    for code, name in job_codes.items():
+        if name in (None, ""):
+            anomalies.append(f"legend {code}: removed empty name")
+            continue
+        if not isinstance(code, str) or not isinstance(name, str):
+            anomalies.append(f"legend {code}: converted to text")
+        upgraded[str(code)] = str(name)
+    return upgraded, anomalies
@@ -0,0 +1,109 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import json
+import lzma
+import zlib
+import hashlib
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import STORAGE_FORMAT
+from functions.mirror_functions import get_read_path
+
+# Binary files start with this header so they can be told apart from JSON on read
+BINARY_MAGIC = b"PMB1"
+
+# zlib level of the binary format; day arrays repeat so much that higher levels gain little
+BINARY_LEVEL = 6
+
+SERIALIZATION_FORMATS = ("pretty", "compact", "binary")
+
+# Format of the archive tier: compact JSON in an xz container, which every xz tool
+# can open. Slower to write than zlib but much smaller, which suits years that are
+# rarely read
+ARCHIVE_FORMAT = "archive"
+ARCHIVE_MAGIC = b"\xfd7zXZ\x00"
+ARCHIVE_PRESET = 9
+
+def serialize(data, serialization_format=None):
+    """
+    Serializes a schedule document (or a month or index of one) for storage.
+
+    "pretty" is the indented JSON older versions wrote, "compact" is JSON without
+    whitespace, and "binary" is compact JSON compressed with zlib behind the
+    BINARY_MAGIC header. ARCHIVE_FORMAT is compact JSON compressed with xz. The JSON
+    formats return text, the compressed formats bytes.
+
+    Args:
+        data (dict): The data to serialize.
+        serialization_format (str, optional): One of SERIALIZATION_FORMATS or
+            ARCHIVE_FORMAT. Defaults to the configured STORAGE_FORMAT.
+
+    Returns:
+        str or bytes: The serialized data.
+    """
+    serialization_format = serialization_format or STORAGE_FORMAT
+    if serialization_format == "pretty":
+        return json.dumps(data, indent=4)
+    if serialization_format == "compact":
+        return json.dumps(data, separators=(",", ":"))
+    if serialization_format == "binary":
+        contents = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        return BINARY_MAGIC + zlib.compress(contents, BINARY_LEVEL)
+    if serialization_format == ARCHIVE_FORMAT:
+        contents = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        return lzma.compress(contents, preset=ARCHIVE_PRESET)
+    raise ValueError(f"Unknown serialization format: {serialization_format}")
+
+def detect_format(contents):
+    """
+    Returns the format of serialized contents read as bytes.
+    """
+    if contents.startswith(BINARY_MAGIC):
+        return "binary"
+    if contents.startswith(ARCHIVE_MAGIC):
+        return ARCHIVE_FORMAT
+    if contents[1:2] in (b"\n", b"\r"):
+        return "pretty"
+    return "compact"
+
+def deserialize(contents):
+    """
+    Parses contents read as bytes in any of the SERIALIZATION_FORMATS or the
+    ARCHIVE_FORMAT.
+    """
+    if contents.startswith(BINARY_MAGIC):
+        contents = zlib.decompress(contents[len(BINARY_MAGIC):])
+    elif contents.startswith(ARCHIVE_MAGIC):
+        contents = lzma.decompress(contents)
+    return json.loads(contents)
+
+def read_contents(path):
+    """
+    Reads a file's bytes, through the local mirror when it is current.
+    """
+    with open(get_read_path(path), 'rb') as file:
+        return file.read()
+
+def read_serialized(path):
+    """
+    Reads and parses a serialized file, through the local mirror when it is current.
+
+    Returns:
+        tuple: (data, size) where size is the number of bytes read.
+    """
+    contents = read_contents(path)
+    return deserialize(contents), len(contents)
+
+def get_content_digest(*contents):
+    """
+    Returns the sha256 digest of one or more files' bytes. Unlike a modification
+    time it tells apart two saves made within the file system's time resolution.
+    """
+    digest = hashlib.sha256()
+    for part in contents:
+        part = part.encode("utf-8") if isinstance(part, str) else part
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
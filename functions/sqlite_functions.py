@@ -0,0 +1,445 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import re
+import sys
+import json
+import sqlite3
+import logging
+import threading
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import log_file
+from constants import LEGEND_CODES
+from constants import STORAGE_LAYOUT
+from PathConfig import get_paths
+from functions.storage_functions import MONTHS, STORE_LAYOUTS
+from functions.storage_functions import convert_storage_layout, list_schedules, rank_month, upgrade_loaded
+from functions.write_functions import get_active_journal
+from functions.serializer_functions import read_serialized
+
+# Logging Format
+logging.basicConfig(level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    filename=log_file,
+                    filemode='a'
+)
+
+HOURS_FIELDS = ("starting_asking_hours", "starting_working_hours", "total_asking_hours", "total_working_hours")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    crew TEXT NOT NULL, year INTEGER NOT NULL, schedule_type TEXT NOT NULL,
+    version INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (crew, year, schedule_type)
+);
+CREATE TABLE IF NOT EXISTS members (
+    crew TEXT NOT NULL, year INTEGER NOT NULL, schedule_type TEXT NOT NULL,
+    month INTEGER NOT NULL, position INTEGER NOT NULL, name TEXT NOT NULL,
+    starting_asking_hours INTEGER, starting_working_hours INTEGER,
+    total_asking_hours INTEGER, total_working_hours INTEGER,
+    day_fields TEXT NOT NULL,
+    PRIMARY KEY (crew, year, schedule_type, month, name)
+);
+CREATE INDEX IF NOT EXISTS members_by_name ON members (name, crew, year, schedule_type, month);
+CREATE TABLE IF NOT EXISTS days (
+    crew TEXT NOT NULL, year INTEGER NOT NULL, schedule_type TEXT NOT NULL,
+    month INTEGER NOT NULL, name TEXT NOT NULL, field TEXT NOT NULL,
+    day INTEGER NOT NULL, value TEXT NOT NULL,
+    PRIMARY KEY (crew, year, schedule_type, month, name, field, day)
+);
+CREATE TABLE IF NOT EXISTS ot_slots (
+    crew TEXT NOT NULL, year INTEGER NOT NULL, month INTEGER NOT NULL,
+    slot TEXT NOT NULL, position INTEGER NOT NULL, day INTEGER NOT NULL, value TEXT NOT NULL,
+    PRIMARY KEY (crew, year, month, slot, day)
+);
+CREATE TABLE IF NOT EXISTS ot_slot_counts (
+    crew TEXT NOT NULL, year INTEGER NOT NULL, month INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (crew, year, month)
+);
+CREATE TABLE IF NOT EXISTS legend_codes (
+    position INTEGER PRIMARY KEY, title TEXT NOT NULL, code TEXT NOT NULL
+);
+"""
+
+_connections = threading.local()
+
+def get_database_path():
+    return get_paths().database_path
+
+def uses_database(json_path):
+    """
+    Whether data that used to live in json_path is kept in the schedule database:
+    the JSON file is gone and the sqlite layout is configured or migrated to.
+    """
+    return not os.path.exists(json_path) and (STORAGE_LAYOUT == SqliteStore.layout or os.path.exists(get_database_path()))
+
+def get_connection():
+    """
+    Returns this thread's connection to the schedule database, creating the schema
+    on first use.
+    """
+    database_path = get_database_path()
+    connection = getattr(_connections, "connections", {}).get(database_path)
+    if connection is None:
+        os.makedirs(os.path.dirname(database_path), exist_ok=True)
+        connection = sqlite3.connect(database_path, timeout=10.0)
+        connection.executescript(SCHEMA)
+        connection.commit()
+        if not hasattr(_connections, "connections"):
+            _connections.connections = {}
+        _connections.connections[database_path] = connection
+    return connection
+
+def commit_with_journal(connection):
+    """
+    Commits a write transaction, or defers it to the active WriteJournal so the
+    database lands together with the journal's files.
+    """
+    journal = get_active_journal()
+    if journal is None:
+        connection.commit()
+    else:
+        journal.on_commit(connection.commit)
+        journal.on_exit(connection.rollback)
+
+
+class SqliteStore:
+    """
+    SQLite storage layout: every crew-year lives in indexed tables of one database
+    file, SaveFiles/plan_matrix.db, with a row per member-month and a row per day
+    entry. Loading or saving a month is an indexed query on (crew, year, schedule
+    type, month) and the year index is read from the member rows alone, without
+    touching the day entries.
+
+    The stamp is the document version kept in the documents table, so checking for
+    other users' saves is a single-row lookup. Inside a WriteJournal the database
+    transaction commits together with the journal's files.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        schedule_type (str): The schedule type ("Overtime" or "work_schedule").
+    """
+    layout = "sqlite"
+
+    def __init__(self, crew, year, schedule_type):
+        self.crew = crew
+        self.year = int(year)
+        self.schedule_type = schedule_type
+        self.path = get_database_path()
+        self.lock_path = f"{get_paths().get_schedule_dirpath(crew, year, schedule_type)}.db.lock"
+        self.key = (crew, self.year, schedule_type)
+        self.schema_anomalies = None
+        self.integrity = {}
+        self.digest = None
+
+    def get_stamp(self):
+        if not os.path.exists(self.path):
+            return None
+        row = get_connection().execute(
+            "SELECT version FROM documents WHERE crew = ? AND year = ? AND schedule_type = ?", self.key
+        ).fetchone()
+        return None if row is None else row[0]
+
+    def get_digest(self):
+        # Every save bumps the version in the same transaction, so it already tells saves apart
+        return self.get_stamp()
+
+    def exists(self):
+        return self.get_stamp() is not None
+
+    def load(self, months=None):
+        """
+        Loads the requested months.
+
+        Returns:
+            tuple: (document, sizes) where sizes maps each loaded month to its row count.
+        """
+        months = MONTHS if months is None else [str(month) for month in months]
+        connection = get_connection()
+        # A month without member rows is an empty month
+        self.digest = self.get_stamp()
+        document = {"version": self.digest or 0, "month": {month: {} for month in months}}
+        sizes = {}
+        placeholders = ", ".join("?" * len(months))
+        month_numbers = [int(month) for month in months]
+
+        members = connection.execute(
+            f"SELECT month, name, starting_asking_hours, starting_working_hours, total_asking_hours, total_working_hours, day_fields "
+            f"FROM members WHERE crew = ? AND year = ? AND schedule_type = ? AND month IN ({placeholders}) ORDER BY month, position",
+            (*self.key, *month_numbers)
+        )
+        for month, name, *hours, day_fields in members:
+            monthly_hours = {field: value for field, value in zip(HOURS_FIELDS, hours) if value is not None}
+            monthly_hours.update({field: [] for field in json.loads(day_fields)})
+            document["month"].setdefault(str(month), {})[name] = {"monthly_hours": monthly_hours}
+
+        days = connection.execute(
+            f"SELECT month, name, field, value FROM days "
+            f"WHERE crew = ? AND year = ? AND schedule_type = ? AND month IN ({placeholders}) ORDER BY month, name, field, day",
+            (*self.key, *month_numbers)
+        )
+        for month, name, field, value in days:
+            document["month"][str(month)][name]["monthly_hours"][field].append(value)
+            sizes[str(month)] = sizes.get(str(month), 0) + len(value) + 4
+
+        for month, month_data in document["month"].items():
+            sizes[month] = sizes.get(month, 0) + 128 * len(month_data)
+        return upgrade_loaded(self, document), sizes
+
+    def load_index(self):
+        """
+        Builds the year-level index from the member rows only.
+        """
+        index = {"version": self.get_stamp() or 0, "months": {}}
+        rows = get_connection().execute(
+            "SELECT month, name, total_asking_hours, total_working_hours FROM members "
+            "WHERE crew = ? AND year = ? AND schedule_type = ? AND name != '[placeholder]' ORDER BY month, position",
+            self.key
+        )
+        for month, name, total_asking_hours, total_working_hours in rows:
+            month_index = index["months"].setdefault(str(month), {"members": []})
+            month_index["members"].append(name)
+            if self.schedule_type == "Overtime":
+                month_index.setdefault("totals", {})[name] = {
+                    "total_asking_hours": total_asking_hours or 0,
+                    "total_working_hours": total_working_hours or 0,
+                }
+        if self.schedule_type == "Overtime":
+            for month_index in index["months"].values():
+                month_index["ranking"] = rank_month(month_index["members"], month_index["totals"])
+        return index
+
+    def save(self, document, months=None):
+        """
+        Replaces the rows of the given months and records the document version.
+
+        Returns:
+            dict: Approximate size of each written month.
+        """
+        months = MONTHS if months is None else [str(month) for month in months]
+        connection = get_connection()
+        sizes = {}
+        try:
+            for month in months:
+                if month not in document["month"]:
+                    continue
+                connection.execute("DELETE FROM members WHERE crew = ? AND year = ? AND schedule_type = ? AND month = ?", (*self.key, int(month)))
+                connection.execute("DELETE FROM days WHERE crew = ? AND year = ? AND schedule_type = ? AND month = ?", (*self.key, int(month)))
+
+                member_rows, day_rows = [], []
+                for position, (name, member_data) in enumerate(document["month"][month].items()):
+                    monthly_hours = member_data.get("monthly_hours", {})
+                    day_fields = [field for field, value in monthly_hours.items() if isinstance(value, list)]
+                    member_rows.append((*self.key, int(month), position, name, *(monthly_hours.get(field) for field in HOURS_FIELDS), json.dumps(day_fields)))
+                    for field in day_fields:
+                        day_rows.extend((*self.key, int(month), name, field, day, value) for day, value in enumerate(monthly_hours[field]))
+
+                connection.executemany("INSERT INTO members VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", member_rows)
+                connection.executemany("INSERT INTO days VALUES (?, ?, ?, ?, ?, ?, ?, ?)", day_rows)
+                sizes[month] = sum(len(row[-1]) + 4 for row in day_rows) + 128 * len(member_rows)
+
+            connection.execute(
+                "INSERT INTO documents VALUES (?, ?, ?, ?) ON CONFLICT (crew, year, schedule_type) DO UPDATE SET version = excluded.version",
+                (*self.key, document.get("version", 0))
+            )
+        except Exception:
+            connection.rollback()
+            raise
+        commit_with_journal(connection)
+        return sizes
+
+    def delete(self):
+        connection = get_connection()
+        for table in ("documents", "members", "days"):
+            connection.execute(f"DELETE FROM {table} WHERE crew = ? AND year = ? AND schedule_type = ?", self.key)
+        connection.commit()
+
+# Register the layout so get_store() finds schedules kept in the database
+STORE_LAYOUTS[SqliteStore.layout] = SqliteStore
+
+
+def load_overtime_slots_from_db(crew, month, year):
+    """
+    Database counterpart of OvertimeSlots.load_overtime_slots().
+
+    Returns:
+        tuple: (slots, count) where slots maps each slot name to its day entries.
+    """
+    connection = get_connection()
+    slots = {}
+    for slot, value in connection.execute(
+        "SELECT slot, value FROM ot_slots WHERE crew = ? AND year = ? AND month = ? ORDER BY position, day",
+        (crew, int(year), int(month))
+    ):
+        slots.setdefault(slot, []).append(value)
+
+    row = connection.execute(
+        "SELECT count FROM ot_slot_counts WHERE crew = ? AND year = ? AND month = ?", (crew, int(year), int(month))
+    ).fetchone()
+    if row is None and not slots:
+        return {}, 3
+    slots['count'] = row[0] if row else 3
+    return slots, slots['count']
+
+def save_overtime_slots_to_db(data, crew, month, year, num_slots):
+    """
+    Database counterpart of OvertimeSlots.save_overtime_slots().
+    """
+    connection = get_connection()
+    key = (crew, int(year), int(month))
+    try:
+        existing = connection.execute(
+            "SELECT slot, MIN(position) FROM ot_slots WHERE crew = ? AND year = ? AND month = ? GROUP BY slot", key
+        ).fetchall()
+        positions = {slot: position for slot, position in existing}
+        for slot, hours in data.items():
+            position = positions.setdefault(slot, len(positions))
+            connection.execute("DELETE FROM ot_slots WHERE crew = ? AND year = ? AND month = ? AND slot = ?", (*key, slot))
+            connection.executemany(
+                "INSERT INTO ot_slots VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(*key, slot, position, day, value) for day, value in enumerate(hours)]
+            )
+        connection.execute(
+            "INSERT INTO ot_slot_counts VALUES (?, ?, ?, ?) ON CONFLICT (crew, year, month) DO UPDATE SET count = excluded.count",
+            (*key, num_slots)
+        )
+    except Exception:
+        connection.rollback()
+        raise
+    commit_with_journal(connection)
+
+def has_overtime_slots_in_db(crew, year):
+    """
+    Whether the database holds any slot entries or slot counts for a crew-year.
+    """
+    if not os.path.exists(get_database_path()):
+        return False
+    key = (crew, int(year))
+    return get_connection().execute(
+        "SELECT 1 FROM ot_slot_counts WHERE crew = ? AND year = ? UNION ALL SELECT 1 FROM ot_slots WHERE crew = ? AND year = ? LIMIT 1",
+        (*key, *key)
+    ).fetchone() is not None
+
+def rename_slot_entries_in_db(crew, year, renamed, start_month=1):
+    """
+    Database counterpart of RosterTransaction.apply_to_slots(): replaces the old
+    names in a crew-year's slot entries from start_month on.
+
+    Args:
+        renamed (dict): {old_name: new_name}.
+
+    Returns:
+        list[str]: The changed months.
+    """
+    connection = get_connection()
+    rows = connection.execute(
+        f"SELECT month, slot, day, value FROM ot_slots WHERE crew = ? AND year = ? AND month >= ? AND value IN ({', '.join('?' * len(renamed))})",
+        (crew, int(year), int(start_month), *renamed)
+    ).fetchall()
+    try:
+        connection.executemany(
+            "UPDATE ot_slots SET value = ? WHERE crew = ? AND year = ? AND month = ? AND slot = ? AND day = ?",
+            [(renamed[value], crew, int(year), month, slot, day) for month, slot, day, value in rows]
+        )
+    except Exception:
+        connection.rollback()
+        raise
+    commit_with_journal(connection)
+    return sorted({str(month) for month, _, _, _ in rows}, key=int)
+
+def load_legend_job_codes_from_db():
+    rows = get_connection().execute("SELECT title, code FROM legend_codes ORDER BY position")
+    return {title: code for title, code in rows}
+
+def save_legend_job_codes_to_db(job_codes):
+    connection = get_connection()
+    try:
+        connection.execute("DELETE FROM legend_codes")
+        connection.executemany(
+            "INSERT INTO legend_codes VALUES (?, ?, ?)",
+            [(position, title, code) for position, (title, code) in enumerate(job_codes.items())]
+        )
+    except Exception:
+        connection.rollback()
+        raise
+    commit_with_journal(connection)
+
+def find_member_history(name):
+    """
+    Cross-year lookup of a crew member's month-end totals from the name index.
+
+    Returns:
+        list[tuple]: (crew, year, month, total_asking_hours, total_working_hours) rows.
+    """
+    return get_connection().execute(
+        "SELECT crew, year, month, total_asking_hours, total_working_hours FROM members "
+        "WHERE name = ? AND schedule_type = 'Overtime' ORDER BY year, month",
+        (name,)
+    ).fetchall()
+
+def list_database_crews(year):
+    """
+    Returns the crews with a schedule of the given year in the database.
+    """
+    if not os.path.exists(get_database_path()):
+        return []
+    return [crew for crew, in get_connection().execute(
+        "SELECT DISTINCT crew FROM documents WHERE year = ? ORDER BY crew", (int(year),)
+    )]
+
+def list_database_schedules(schedule_type):
+    """
+    Returns (crew, year, schedule_type) for every schedule of a type kept in the
+    database.
+    """
+    if not os.path.exists(get_database_path()):
+        return []
+    return [(crew, year, schedule_type) for crew, year in get_connection().execute(
+        "SELECT crew, year FROM documents WHERE schedule_type = ? ORDER BY crew, year", (schedule_type,)
+    )]
+
+def migrate_to_sqlite():
+    """
+    Moves every schedule in SaveFiles, the OT_Slots files and the legend codes into
+    the SQLite database. JSON files are removed once their data is in the database.
+
+    Returns:
+        int: The number of crew-year schedules migrated.
+    """
+    schedules = list_schedules()
+    for crew, year, schedule_type in schedules:
+        convert_storage_layout(crew, year, schedule_type, SqliteStore.layout)
+
+    slots_folder = get_paths().slots_folder
+    if os.path.isdir(slots_folder):
+        for entry in os.listdir(slots_folder):
+            match = re.match(r"^OT_(.+)_(\d{4})\.json$", entry)
+            if not match:
+                continue
+            slots_path = os.path.normpath(os.path.join(slots_folder, entry))
+            slots, _ = read_serialized(slots_path)
+            for month, month_slots in slots.get("month", {}).items():
+                month_slots = dict(month_slots)
+                count = month_slots.pop("count", 3)
+                save_overtime_slots_to_db(month_slots, match.group(1), month, match.group(2), count)
+            os.remove(slots_path)
+
+    if os.path.exists(LEGEND_CODES):
+        with open(LEGEND_CODES, 'r') as file:
+            save_legend_job_codes_to_db(json.load(file))
+        os.remove(LEGEND_CODES)
+
+    logging.info(f"Migrated {len(schedules)} schedules to {get_database_path()}")
+    return len(schedules)
+
+if __name__ == "__main__":
+    # Usage: python -m functions.sqlite_functions migrate
+    if sys.argv[1:] == ["migrate"]:
+        print(f"Migrated {migrate_to_sqlite()} schedules to {get_database_path()}")
+    else:
+        print("Usage: python -m functions.sqlite_functions migrate")
@@ -0,0 +1,875 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import re
+import sys
+import json
+import logging
+import shutil
+import datetime
+import threading
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import log_file
+from constants import STORAGE_LAYOUT, STORAGE_FORMAT
+from PathConfig import get_paths, get_schedule_prefix
+from functions.write_functions import WriteJournal, write_file, append_file
+from functions.write_functions import atomic_write, acquire_lock, release_lock, get_active_journal, get_file_size
+from functions.serializer_functions import SERIALIZATION_FORMATS, ARCHIVE_FORMAT, serialize, deserialize, read_serialized
+from functions.serializer_functions import read_contents, get_content_digest
+from functions.mirror_functions import get_mirror_path, is_readable, is_share_available
+from functions.schema_functions import SCHEMA_VERSION, needs_upgrade, upgrade_document
+from functions.integrity_functions import summarize_month, build_integrity, attach_integrity, detach_integrity
+
+# Logging Format
+logging.basicConfig(level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    filename=log_file,
+                    filemode='a'
+)
+
+MONTHS = [str(month) for month in range(1, 13)]
+
+# Schedule type of the overtime slot assignments kept under SaveFiles/OT_Slots
+OT_SLOTS = "OT_Slots"
+
+# A delta log is compacted into its snapshot once it grows past this many bytes
+LOG_COMPACT_BYTES = 256 * 1024
+
+def get_save_folder():
+    return get_paths().save_folder
+
+def get_schedule_filepath(crew, year, schedule_type):
+    return get_paths().get_schedule_filepath(crew, year, schedule_type)
+
+def get_schedule_dirpath(crew, year, schedule_type):
+    return get_paths().get_schedule_dirpath(crew, year, schedule_type)
+
+def upgrade_loaded(store, document):
+    """
+    Brings a document read by a store up to the current schema, so readers never
+    see older layouts. What was fixed is kept in store.schema_anomalies, which is
+    None when the stored data was already current.
+    """
+    store.schema_anomalies = upgrade_document(document, store.schedule_type) if needs_upgrade(document) else None
+    return document
+
+def get_file_stamp(path):
+    """
+    Returns a file's modification time and size, or None if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+def read_digest(*paths):
+    """
+    Returns the content digest of the files holding a schedule, read from the share
+    itself. Missing files count as empty.
+    """
+    contents = []
+    for path in paths:
+        try:
+            with open(path, 'rb') as file:
+                contents.append(file.read())
+        except FileNotFoundError:
+            contents.append(b"")
+    return get_content_digest(*contents)
+
+
+class YearFileStore:
+    """
+    The original storage layout: one file per crew, schedule type and year holding
+    all twelve months, serialized in the store's format.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        schedule_type (str): The schedule type ("Overtime" or "work_schedule").
+    """
+    layout = "year"
+
+    def __init__(self, crew, year, schedule_type):
+        self.crew = crew
+        self.year = year
+        self.schedule_type = schedule_type
+        self.path = get_schedule_filepath(crew, year, schedule_type)
+        self.stamp_path = self.path
+        self.lock_path = f"{self.path}.lock"
+        self.serialization_format = STORAGE_FORMAT
+        self.schema_anomalies = None
+        self.integrity = {}
+        self.digest = None
+
+    def get_stamp(self):
+        """
+        Returns the modification time and size of the stored data, or None if it
+        does not exist. Cheap enough to check on every read.
+        """
+        return get_file_stamp(self.stamp_path)
+
+    def get_digest(self):
+        """
+        Returns the content digest of the stored data, which a save compares with
+        self.digest under the lock to tell whether anyone else wrote the file.
+        """
+        return read_digest(self.stamp_path)
+
+    def exists(self):
+        return self.get_stamp() is not None
+
+    def delete(self):
+        os.remove(self.path)
+
+    def load(self, months=None):
+        """
+        Loads the stored document. The whole year is always returned. The file's
+        integrity record is kept in self.integrity rather than in the document, and
+        the digest of the bytes read in self.digest.
+
+        Returns:
+            tuple: (document, sizes) where sizes maps "*" to the size of the file.
+        """
+        contents = read_contents(self.path)
+        self.digest = get_content_digest(contents)
+        document = deserialize(contents)
+        self.integrity = detach_integrity(document, self.schedule_type)
+        return upgrade_loaded(self, document), {"*": len(contents)}
+
+    def load_index(self):
+        """
+        Builds the year-level index from the year file. The year layout keeps no
+        separate index, so this parses the whole file.
+        """
+        document, _ = self.load()
+        return {
+            "version": document.get("version", 0),
+            "months": {
+                month: build_month_index(month_data, self.schedule_type)
+                for month, month_data in document["month"].items()
+            }
+        }
+
+    def save(self, document, months=None):
+        """
+        Writes the whole document, whichever months changed. Only the changed
+        months are hashed for the integrity record.
+
+        Returns:
+            dict: {"*": bytes written}.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self.integrity = build_integrity(document, self.schedule_type, self.integrity, months)
+        contents = serialize(attach_integrity(document, self.integrity), self.serialization_format)
+        write_file(self.path, contents)
+        return {"*": len(contents)}
+
+    def rewrite(self, document=None):
+        """
+        Rewrites the stored document, or replaces it with the given one, in the
+        store's serialization format. The caller holds the lock.
+        """
+        if document is None:
+            # The months keep the integrity record they were saved with
+            self.save(self.load()[0], months=())
+        else:
+            self.save(document)
+
+
+class SlotsFileStore(YearFileStore):
+    """
+    The overtime slot assignments of a crew-year: one file under SaveFiles/OT_Slots
+    holding {"month": {month: {"count": slots, slot: [day entries]}}}. Slot files
+    always use this layout; a missing file reads as an empty document.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        schedule_type (str, optional): Always OT_SLOTS.
+    """
+    layout = "slots"
+
+    def __init__(self, crew, year, schedule_type=OT_SLOTS):
+        self.crew = crew
+        self.year = year
+        self.schedule_type = OT_SLOTS
+        self.path = get_paths().get_slots_filepath(crew, year)
+        self.stamp_path = self.path
+        self.lock_path = f"{self.path}.lock"
+        self.serialization_format = STORAGE_FORMAT
+        self.schema_anomalies = None
+        self.integrity = {}
+        self.digest = None
+
+    def load(self, months=None):
+        if not is_readable(self.path):
+            return {"schema_version": SCHEMA_VERSION, "month": {}}, {"*": 0}
+        return super().load(months)
+
+
+class ArchiveStore(YearFileStore):
+    """
+    The archive tier for completed years: one xz-compressed file per crew, schedule
+    type and year under SaveFiles/Archive. get_store() falls back to it when no live
+    data exists, so archived years are read (and, rarely, saved) like any other.
+    Archive files are not mirrored locally.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        schedule_type (str): "Overtime", "work_schedule" or OT_SLOTS.
+    """
+    layout = "archive"
+
+    def __init__(self, crew, year, schedule_type):
+        self.crew = crew
+        self.year = year
+        self.schedule_type = schedule_type
+        self.path = get_paths().get_archive_filepath(crew, year, schedule_type)
+        self.stamp_path = self.path
+        self.lock_path = f"{self.path}.lock"
+        self.serialization_format = ARCHIVE_FORMAT
+        self.schema_anomalies = None
+        self.integrity = {}
+        self.digest = None
+
+
+class MonthShardStore:
+    """
+    Sharded storage layout: one directory per crew, schedule type and year holding
+    one JSON file per month plus an index.json with the member names, month-end
+    totals, ranking and integrity record of every month. The index records the
+    schema version of the last save that wrote every month.
+
+    Reading or writing a month only touches that month's file and the small index,
+    so month-level operations cost O(month) instead of O(year). The index is written
+    last on every save, so its modification time stamps the whole directory.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        schedule_type (str): The schedule type ("Overtime" or "work_schedule").
+    """
+    layout = "month"
+
+    def __init__(self, crew, year, schedule_type):
+        self.crew = crew
+        self.year = year
+        self.schedule_type = schedule_type
+        self.path = get_schedule_dirpath(crew, year, schedule_type)
+        self.index_path = os.path.normpath(os.path.join(self.path, "index.json"))
+        self.stamp_path = self.index_path
+        self.lock_path = f"{self.path}.lock"
+        self.serialization_format = STORAGE_FORMAT
+        self.schema_anomalies = None
+        self.integrity = {}
+        self.digest = None
+
+    def get_month_path(self, month):
+        return os.path.normpath(os.path.join(self.path, f"{int(month):02d}.json"))
+
+    def delete(self):
+        shutil.rmtree(self.path)
+
+    def get_stamp(self):
+        return get_file_stamp(self.stamp_path)
+
+    def get_digest(self):
+        return read_digest(self.index_path)
+
+    def exists(self):
+        return self.get_stamp() is not None
+
+    def load(self, months=None):
+        """
+        Loads the requested months.
+
+        Args:
+            months (iterable, optional): Month numbers to load. Defaults to all twelve.
+
+        Returns:
+            tuple: (document, sizes) where sizes maps each loaded month to its file size.
+        """
+        index = self.load_index()
+        document = {"version": index.get("version", 0), "schema_version": index.get("schema_version", 0), "month": {}}
+        self.integrity = {month: month_index["integrity"] for month, month_index in index["months"].items() if "integrity" in month_index}
+        sizes = {}
+        for month in (MONTHS if months is None else [str(month) for month in months]):
+            month_path = self.get_month_path(month)
+            if not is_readable(month_path):
+                continue
+            document["month"][month], sizes[month] = read_serialized(month_path)
+        return upgrade_loaded(self, document), sizes
+
+    def load_index(self):
+        if not is_readable(self.index_path):
+            return {"months": {}}
+        # Every save rewrites the index with a new version, so its bytes tell saves apart
+        contents = read_contents(self.index_path)
+        self.digest = get_content_digest(contents)
+        index = deserialize(contents)
+        if self.schedule_type == "Overtime":
+            for month_index in index["months"].values():
+                if "ranking" not in month_index:
+                    # Written before the index carried rankings
+                    month_index["ranking"] = rank_month(month_index["members"], month_index["totals"])
+        return index
+
+    def save(self, document, months=None):
+        """
+        Writes the given months of the document and refreshes their index entries.
+        The month files and the index land together through one WriteJournal.
+
+        Returns:
+            dict: Bytes written for each month.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        months = MONTHS if months is None else [str(month) for month in months]
+        index = self.load_index()
+        sizes = {}
+
+        with WriteJournal():
+            for month in months:
+                if month not in document["month"]:
+                    continue
+                month_data = document["month"][month]
+                contents = serialize(month_data, self.serialization_format)
+                write_file(self.get_month_path(month), contents)
+                sizes[month] = len(contents)
+                index["months"][month] = build_month_index(month_data, self.schedule_type)
+                index["months"][month]["integrity"] = summarize_month(month_data, self.schedule_type)
+
+            index["version"] = document.get("version", 0)
+            if set(months) == set(MONTHS):
+                index["schema_version"] = document.get("schema_version", 0)
+            write_file(self.index_path, serialize(index, self.serialization_format))
+
+        return sizes
+
+    def rewrite(self, document=None):
+        """
+        Rewrites every month file and the index, or replaces them with the given
+        document, in the store's serialization format. The caller holds the lock.
+        """
+        self.save(self.load()[0] if document is None else document)
+
+
+class DeltaLogStore:
+    """
+    Append-only storage layout: one directory per crew, schedule type and year holding
+    a snapshot.json of the whole year, serialized in the store's format, plus a
+    deltas.jsonl log of compact JSON lines. Every save appends one
+    line with the changes since the previous save, so a save costs a small append
+    instead of rewriting the year. Reads replay the log on top of the snapshot.
+
+    Each log line carries the document version it produced and the integrity record
+    of the months it changed. Once the log grows past LOG_COMPACT_BYTES a background
+    thread folds it into a new snapshot and empties it; lines at or below the
+    snapshot's version are skipped, so a compaction interrupted between the two
+    writes loses nothing.
+
+    Delta records are lists:
+        ["cell", month, member, field, day, value]
+        ["field", month, member, field, value]
+        ["member", month, member, record]
+        ["remove", month, member]
+        ["order", month, [members]]
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        schedule_type (str): The schedule type ("Overtime" or "work_schedule").
+    """
+    layout = "log"
+
+    def __init__(self, crew, year, schedule_type):
+        self.crew = crew
+        self.year = year
+        self.schedule_type = schedule_type
+        self.path = f"{get_schedule_dirpath(crew, year, schedule_type)}_deltas"
+        self.snapshot_path = os.path.normpath(os.path.join(self.path, "snapshot.json"))
+        self.log_path = os.path.normpath(os.path.join(self.path, "deltas.jsonl"))
+        self.stamp_path = self.snapshot_path
+        self.lock_path = f"{self.path}.lock"
+        self.serialization_format = STORAGE_FORMAT
+        self.schema_anomalies = None
+        self.integrity = {}
+        self.digest = None
+        self.saved_months = None  # The months as last read or written, for diffing
+
+    def get_stamp(self):
+        stamps = tuple(get_file_stamp(path) for path in (self.snapshot_path, self.log_path))
+        return None if stamps[0] is None else stamps
+
+    def get_digest(self):
+        return read_digest(self.snapshot_path, self.log_path)
+
+    def exists(self):
+        return self.get_stamp() is not None
+
+    def delete(self):
+        shutil.rmtree(self.path)
+
+    def get_size(self):
+        size = 0
+        for path in (self.snapshot_path, self.log_path):
+            if os.path.exists(path):
+                size += os.path.getsize(path)
+        return size
+
+    def load(self, months=None):
+        """
+        Loads the snapshot and replays the delta log. The whole year is always returned.
+
+        Returns:
+            tuple: (document, sizes) where sizes maps "*" to the snapshot and log size.
+        """
+        snapshot = read_contents(self.snapshot_path)
+        log = read_contents(self.log_path) if is_readable(self.log_path) else b""
+        self.digest = get_content_digest(snapshot, log)
+        document = deserialize(snapshot)
+        snapshot_version = document.get("version", 0)
+        self.integrity = detach_integrity(document, self.schedule_type)
+
+        for line in log.decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            try:
+                batch = json.loads(line)
+            except ValueError:
+                # A save that was cut off mid-append never completed
+                logging.error(f"Skipped incomplete delta record in {self.log_path}")
+                continue
+            if batch["version"] <= snapshot_version:
+                continue
+            apply_deltas(document, batch["deltas"])
+            document["version"] = batch["version"]
+            if "integrity" in batch:
+                self.integrity.update(batch["integrity"])
+            else:
+                # Appended by an older build, so the months it changed are unverified
+                for delta in batch["deltas"]:
+                    self.integrity.pop(delta[1], None)
+
+        upgrade_loaded(self, document)
+        self.saved_months = json.loads(json.dumps(document["month"]))
+        return document, {"*": self.get_size()}
+
+    def load_index(self):
+        document, _ = self.load()
+        return {
+            "version": document.get("version", 0),
+            "months": {
+                month: build_month_index(month_data, self.schedule_type)
+                for month, month_data in document["month"].items()
+            }
+        }
+
+    def save(self, document, months=None):
+        """
+        Appends the changes of the given months since the last read or write. A new
+        schedule is written as its first snapshot.
+
+        Returns:
+            dict: {"*": size of the snapshot and log}.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        if self.saved_months is None and self.exists():
+            self.load()
+        if self.saved_months is None:
+            self.integrity = build_integrity(document, self.schedule_type)
+            write_file(self.snapshot_path, serialize(attach_integrity(document, self.integrity), self.serialization_format))
+            self.set_saved_months(document, MONTHS)
+            return {"*": self.get_size()}
+
+        months = MONTHS if months is None else [str(month) for month in months]
+        deltas = []
+        integrity = {}
+        for month in months:
+            if month in document["month"]:
+                month_deltas = diff_month(self.saved_months.get(month, {}), document["month"][month], month)
+                if month_deltas:
+                    deltas.extend(month_deltas)
+                    integrity[month] = summarize_month(document["month"][month], self.schedule_type)
+
+        if deltas:
+            record = json.dumps({"version": document.get("version", 0), "deltas": deltas, "integrity": integrity}, separators=(",", ":"))
+            append_file(self.log_path, self.get_line_prefix() + record + "\n")
+            self.set_saved_months(document, months)
+            if get_file_size(self.log_path) + len(record) > LOG_COMPACT_BYTES:
+                schedule_compaction(self.crew, self.year, self.schedule_type)
+
+        return {"*": self.get_size()}
+
+    def get_line_prefix(self):
+        """
+        Returns a newline if the log ends in a record cut off by a crash, so the next
+        record starts on its own line.
+        """
+        if not os.path.exists(self.log_path) or os.path.getsize(self.log_path) == 0:
+            return ""
+        with open(self.log_path, 'rb') as file:
+            file.seek(-1, os.SEEK_END)
+            return "" if file.read(1) == b"\n" else "\n"
+
+    def set_saved_months(self, document, months):
+        """
+        Records the saved state of some months once the write has landed.
+        """
+        saved = {month: json.loads(json.dumps(document["month"][month])) for month in months if month in document["month"]}
+
+        def update():
+            if self.saved_months is None:
+                self.saved_months = {}
+            self.saved_months.update(saved)
+
+        journal = get_active_journal()
+        if journal is not None:
+            journal.on_commit(update)
+        else:
+            update()
+
+    def compact(self):
+        """
+        Folds the delta log into a new snapshot and empties the log.
+        """
+        acquire_lock(self.lock_path)
+        try:
+            self.rewrite()
+        finally:
+            release_lock(self.lock_path)
+
+    def rewrite(self, document=None):
+        """
+        Writes the replayed log, or the given document, as a new snapshot in the
+        store's serialization format and empties the log. The caller holds the lock.
+        """
+        if document is None:
+            document, _ = self.load()
+            # The replayed months keep the integrity record they were saved with
+            self.integrity = build_integrity(document, self.schedule_type, self.integrity, months=())
+        else:
+            self.integrity = build_integrity(document, self.schedule_type)
+        os.makedirs(self.path, exist_ok=True)
+        atomic_write(self.snapshot_path, serialize(attach_integrity(document, self.integrity), self.serialization_format))
+        atomic_write(self.log_path, "")
+        self.saved_months = json.loads(json.dumps(document["month"]))
+
+
+def diff_month(saved, month_data, month):
+    """
+    Returns the delta records that turn the saved month into month_data.
+    """
+    deltas = []
+    for name in saved:
+        if name not in month_data:
+            deltas.append(["remove", month, name])
+
+    for name, member_data in month_data.items():
+        saved_hours = saved.get(name, {}).get("monthly_hours")
+        monthly_hours = member_data.get("monthly_hours", {})
+        if saved_hours is None or set(saved_hours) != set(monthly_hours):
+            deltas.append(["member", month, name, member_data])
+            continue
+
+        for field, value in monthly_hours.items():
+            saved_value = saved_hours[field]
+            if value == saved_value:
+                continue
+            if isinstance(value, list) and isinstance(saved_value, list) and len(value) == len(saved_value):
+                for day, (saved_cell, cell) in enumerate(zip(saved_value, value)):
+                    if saved_cell != cell:
+                        deltas.append(["cell", month, name, field, day, cell])
+            else:
+                deltas.append(["field", month, name, field, value])
+
+    replayed_order = [name for name in saved if name in month_data] + [name for name in month_data if name not in saved]
+    if list(month_data) != replayed_order:
+        deltas.append(["order", month, list(month_data)])
+    return deltas
+
+def apply_deltas(document, deltas):
+    """
+    Replays delta records onto a document in place.
+    """
+    for delta in deltas:
+        operation, month = delta[0], delta[1]
+        month_data = document["month"].setdefault(month, {})
+        if operation == "cell":
+            _, _, name, field, day, value = delta
+            month_data[name]["monthly_hours"][field][day] = value
+        elif operation == "field":
+            _, _, name, field, value = delta
+            month_data[name]["monthly_hours"][field] = value
+        elif operation == "member":
+            month_data[delta[2]] = delta[3]
+        elif operation == "remove":
+            month_data.pop(delta[2], None)
+        elif operation == "order":
+            document["month"][month] = {name: month_data[name] for name in delta[2] if name in month_data}
+
+_compactions = set()
+_compactions_lock = threading.Lock()
+
+def schedule_compaction(crew, year, schedule_type):
+    """
+    Compacts a crew-year delta log on a background thread, once at a time.
+    """
+    key = (crew, year, schedule_type)
+    with _compactions_lock:
+        if key in _compactions:
+            return
+        _compactions.add(key)
+
+    def run():
+        try:
+            DeltaLogStore(crew, year, schedule_type).compact()
+        except Exception as e:
+            logging.error(f"Failed to compact delta log for {crew} {year} {schedule_type}: {str(e)}")
+        finally:
+            with _compactions_lock:
+                _compactions.discard(key)
+
+    threading.Thread(target=run, daemon=True).start()
+
+def rank_month(members, totals):
+    """
+    Ranks the members of an Overtime month the way the ranking pane shows them:
+    highest total first, members with equal totals in roster order.
+
+    Args:
+        members (list): Member names in roster order.
+        totals (dict): {name: {"total_asking_hours": int, "total_working_hours": int}}.
+
+    Returns:
+        dict: "by_working" and "by_asking" name lists, and the "lowest_working"
+        and "lowest_asking" member (the first in roster order on a tie), None for
+        an empty month.
+    """
+    working = lambda name: totals[name]["total_working_hours"]
+    asking = lambda name: totals[name]["total_asking_hours"]
+    return {
+        "by_working": sorted(members, key=working, reverse=True),
+        "by_asking": sorted(members, key=asking, reverse=True),
+        "lowest_working": min(members, key=working) if members else None,
+        "lowest_asking": min(members, key=asking) if members else None,
+    }
+
+def build_month_index(month_data, schedule_type):
+    """
+    Summarises one month for the year-level index: the member order and, for the
+    Overtime schedule, each member's month-end totals and the month's ranking.
+    """
+    members = list(month_data)
+    if schedule_type != "Overtime":
+        return {"members": members}
+
+    totals = {
+        name: {
+            "total_asking_hours": month_data[name]["monthly_hours"]["total_asking_hours"],
+            "total_working_hours": month_data[name]["monthly_hours"]["total_working_hours"],
+        } for name in members
+    }
+    return {"members": members, "totals": totals, "ranking": rank_month(members, totals)}
+
+STORE_LAYOUTS = {
+    YearFileStore.layout: YearFileStore,
+    MonthShardStore.layout: MonthShardStore,
+    DeltaLogStore.layout: DeltaLogStore,
+    ArchiveStore.layout: ArchiveStore,
+}
+
+def get_store(crew, year, schedule_type):
+    """
+    Returns the store holding a crew-year schedule. Existing data is read in
+    whichever layout it was saved, archived years from the archive tier; new data
+    uses the configured STORAGE_LAYOUT. While the share is offline the layout is
+    taken from the local mirror.
+    """
+    if schedule_type == OT_SLOTS:
+        store = SlotsFileStore(crew, year)
+        if not store.exists():
+            archive = ArchiveStore(crew, year, OT_SLOTS)
+            if archive.exists():
+                return archive
+        return store
+    for store_class in STORE_LAYOUTS.values():
+        store = store_class(crew, year, schedule_type)
+        if store.exists():
+            return store
+    if not is_share_available():
+        for store_class in STORE_LAYOUTS.values():
+            store = store_class(crew, year, schedule_type)
+            mirror_path = get_mirror_path(getattr(store, "stamp_path", store.path))
+            if mirror_path and os.path.exists(mirror_path):
+                return store
+    return STORE_LAYOUTS.get(STORAGE_LAYOUT, YearFileStore)(crew, year, schedule_type)
+
+def get_layout_store(layout, crew, year, schedule_type):
+    """
+    Returns the store of a given layout, e.g. one recorded before the share went offline.
+    """
+    if layout == SlotsFileStore.layout:
+        return SlotsFileStore(crew, year)
+    return STORE_LAYOUTS[layout](crew, year, schedule_type)
+
+def convert_storage_layout(crew, year, schedule_type, layout):
+    """
+    Moves a crew-year schedule to another storage layout.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        schedule_type (str): The schedule type ("Overtime" or "work_schedule").
+        layout (str): Target layout, "year", "month", "log" or "sqlite".
+    """
+    source = get_store(crew, year, schedule_type)
+    if source.layout == layout or not source.exists():
+        return
+
+    document, _ = source.load()
+    target = STORE_LAYOUTS[layout](crew, year, schedule_type)
+    target.save(document)
+
+    source.delete()
+    logging.info(f"Converted {source.path} to the {layout} layout")
+
+def convert_storage_format(crew, year, schedule_type, serialization_format):
+    """
+    Rewrites a crew-year schedule in another serialization format, keeping its
+    layout. Schedules kept in the database have no files and are left as they are.
+
+    Args:
+        crew (str): The crew identifier.
+        year (int): The schedule year.
+        schedule_type (str): The schedule type ("Overtime" or "work_schedule").
+        serialization_format (str): Target format, "pretty", "compact" or "binary".
+    """
+    store = get_store(crew, year, schedule_type)
+    if not store.exists() or not hasattr(store, "rewrite"):
+        return
+
+    store.serialization_format = serialization_format
+    acquire_lock(store.lock_path)
+    try:
+        store.rewrite()
+    finally:
+        release_lock(store.lock_path)
+    logging.info(f"Converted {store.path} to the {serialization_format} format")
+
+def list_schedules(include_slots=False, include_archive=False):
+    """
+    Returns (crew, year, schedule_type) for every schedule stored as files in
+    SaveFiles, whatever its layout.
+
+    Args:
+        include_slots (bool, optional): Also list the OT_Slots files.
+        include_archive (bool, optional): Also list the archived years.
+    """
+    save_folder = get_save_folder()
+    if not os.path.isdir(save_folder):
+        return []
+
+    pattern = re.compile(r"^(OT|WS)_(.+)_(\d{4})(\.json|_deltas)?$")
+    schedules = set()
+    for entry in os.listdir(save_folder):
+        match = pattern.match(entry)
+        if match:
+            schedule_type = "Overtime" if match.group(1) == "OT" else "work_schedule"
+            schedules.add((match.group(2), int(match.group(3)), schedule_type))
+
+    slots_folder = get_paths().slots_folder
+    if include_slots and os.path.isdir(slots_folder):
+        for entry in os.listdir(slots_folder):
+            match = re.match(r"^OT_(.+)_(\d{4})\.json$", entry)
+            if match:
+                schedules.add((match.group(1), int(match.group(2)), OT_SLOTS))
+
+    archive_folder = get_paths().archive_folder
+    if include_archive and os.path.isdir(archive_folder):
+        for entry in os.listdir(archive_folder):
+            match = re.match(r"^(OT_Slots|OT|WS)_(.+)_(\d{4})\.json\.xz$", entry)
+            if match and (include_slots or match.group(1) != OT_SLOTS):
+                schedule_type = {"OT": "Overtime", "WS": "work_schedule"}.get(match.group(1), OT_SLOTS)
+                schedules.add((match.group(2), int(match.group(3)), schedule_type))
+    return sorted(schedules)
+
+def convert_all_storage_formats(serialization_format):
+    """
+    Rewrites every schedule and OT_Slots file in SaveFiles in another serialization
+    format.
+
+    Returns:
+        int: The number of files converted.
+    """
+    schedules = list_schedules(include_slots=True)
+    for crew, year, schedule_type in schedules:
+        convert_storage_format(crew, year, schedule_type, serialization_format)
+    return len(schedules)
+
+def archive_schedule(crew, year, schedule_type):
+    """
+    Moves a crew-year schedule or OT_Slots file into the archive tier. The archive
+    file is written and read back before the live data is deleted, all under the
+    live data's lock so no save lands in between.
+
+    Returns:
+        bool: True if the schedule was archived, False if it has no live data.
+    """
+    source = get_store(crew, year, schedule_type)
+    if source.layout == ArchiveStore.layout or not source.exists():
+        return False
+
+    acquire_lock(source.lock_path)
+    try:
+        document, _ = source.load()
+        target = ArchiveStore(crew, year, schedule_type)
+        os.makedirs(os.path.dirname(target.path), exist_ok=True)
+        atomic_write(target.path, serialize(attach_integrity(document, build_integrity(document, schedule_type, source.integrity, months=())), ARCHIVE_FORMAT))
+        if target.load()[0] != document:
+            target.delete()
+            raise ValueError(f"Archive of {source.path} does not match the live data")
+        source.delete()
+    finally:
+        release_lock(source.lock_path)
+    logging.info(f"Archived {source.path} to {target.path}")
+    return True
+
+def archive_old_schedules(years_to_keep):
+    """
+    Archives every schedule and OT_Slots file of a year more than years_to_keep
+    years before the current one. Years already archived are skipped, so the
+    command can run as often as needed.
+
+    Args:
+        years_to_keep (int): Number of past years kept live besides the current year.
+
+    Returns:
+        int: The number of files archived.
+    """
+    cutoff = datetime.date.today().year - years_to_keep
+    archived = 0
+    for crew, year, schedule_type in list_schedules(include_slots=True):
+        if year >= cutoff:
+            continue
+        try:
+            if archive_schedule(crew, year, schedule_type):
+                archived += 1
+        except Exception as e:
+            logging.error(f"Failed to archive {crew} {year} {schedule_type}: {str(e)}")
+    return archived
+
+if __name__ == "__main__":
+    # Usage: python -m functions.storage_functions convert pretty|compact|binary
+    #        python -m functions.storage_functions archive <years to keep>
+    if len(sys.argv) == 3 and sys.argv[1] == "convert" and sys.argv[2] in SERIALIZATION_FORMATS:
+        print(f"Converted {convert_all_storage_formats(sys.argv[2])} schedules to the {sys.argv[2]} format")
+    elif len(sys.argv) == 3 and sys.argv[1] == "archive" and sys.argv[2].isdigit():
+        print(f"Archived {archive_old_schedules(int(sys.argv[2]))} schedules older than {sys.argv[2]} years")
+    else:
+        print("Usage: python -m functions.storage_functions convert pretty|compact|binary")
+        print("       python -m functions.storage_functions archive <years to keep>")
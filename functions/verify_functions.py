@@ -0,0 +1,158 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import json
+import time
+import logging
+import threading
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import log_file
+from constants import LOCAL_VERIFY_STATE
+from PathConfig import get_schedule_prefix
+from functions.storage_functions import get_store, list_schedules
+from functions.write_functions import atomic_write, acquire_lock, release_lock
+from functions.mirror_functions import is_share_available
+from functions.integrity_functions import check_integrity, get_unverified_months
+
+# Logging Format
+logging.basicConfig(level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    filename=log_file,
+                    filemode='a'
+)
+
+# Seconds between background sweeps of SaveFiles
+VERIFY_INTERVAL = 600.0
+
+# Seconds a sweep waits for a schedule that is being saved before checking it on the next sweep
+VERIFY_LOCK_TIMEOUT = 2.0
+
+_verifier_started = threading.Event()
+_flagged: dict[str, list[str]] = {}
+_flagged_lock = threading.Lock()
+
+def get_file_stamps(store):
+    """
+    Returns the modification time of every file holding a schedule, keyed by file
+    name. A folder layout lists all of its files, so a hand-edited month file is
+    noticed even though the store's own stamp only covers the index.
+    """
+    if not os.path.isdir(store.path):
+        return {os.path.basename(store.path): os.stat(store.path).st_mtime}
+    with os.scandir(store.path) as entries:
+        return {entry.name: entry.stat().st_mtime for entry in entries if entry.is_file()}
+
+def load_verify_state():
+    try:
+        with open(LOCAL_VERIFY_STATE, 'r') as file:
+            return json.load(file)
+    except (FileNotFoundError, ValueError):
+        return {"schedules": {}}
+
+def verify_schedule(store):
+    """
+    Loads a schedule under its lock and compares it with its integrity record.
+    Months without a current record, e.g. saved by an older build, are reported as
+    unverified rather than as mismatches.
+
+    Returns:
+        tuple: (mismatches, unverified) where mismatches lists the mismatches found,
+        see check_integrity(), and unverified the months that could not be checked.
+
+    Raises:
+        TimeoutError: If the schedule is being saved.
+    """
+    acquire_lock(store.lock_path, timeout=VERIFY_LOCK_TIMEOUT)
+    try:
+        document, _ = store.load()
+    except Exception as e:
+        return [f"unreadable: {str(e)}"], []
+    finally:
+        release_lock(store.lock_path)
+    return check_integrity(document, store.schedule_type, store.integrity), get_unverified_months(document, store.integrity)
+
+def verify_savefiles():
+    """
+    Checks the schedule, OT_Slots and archive files in SaveFiles against their
+    integrity records. Only schedules with a file changed since the last sweep are
+    loaded; the stamps and results are kept in LOCAL_VERIFY_STATE, so this is
+    cheap enough to run every session. Newly found mismatches are logged. Months
+    that could not be checked are recorded as "unverified" but not flagged.
+
+    Returns:
+        dict: The mismatches of every schedule that failed, keyed by schedule name.
+    """
+    state = load_verify_state()
+    verified = {}
+    for crew, year, schedule_type in list_schedules(include_slots=True, include_archive=True):
+        store = get_store(crew, year, schedule_type)
+        name = f"{get_schedule_prefix(schedule_type)}_{crew}_{year}"
+        key = f"{store.layout}:{store.path}"
+        try:
+            stamps = get_file_stamps(store)
+        except FileNotFoundError:
+            # Moved or removed since the listing
+            continue
+
+        previous = state["schedules"].get(key)
+        if previous is not None and previous["stamps"] == stamps:
+            verified[key] = previous
+            continue
+        try:
+            mismatches, unverified = verify_schedule(store)
+        except TimeoutError:
+            continue
+
+        verified[key] = {"name": name, "stamps": stamps, "mismatches": mismatches, "unverified": unverified}
+        for mismatch in mismatches:
+            logging.error(f"Integrity check failed for {name} ({store.path}): {mismatch}")
+
+    os.makedirs(os.path.dirname(LOCAL_VERIFY_STATE), exist_ok=True)
+    atomic_write(LOCAL_VERIFY_STATE, json.dumps({"schedules": verified}))
+
+    flagged = {entry["name"]: entry["mismatches"] for entry in verified.values() if entry["mismatches"]}
+    with _flagged_lock:
+        _flagged.clear()
+        _flagged.update(flagged)
+    return flagged
+
+def get_flagged_schedules():
+    """
+    Returns the schedules that failed the last integrity sweep, for the UI, as
+    {name: mismatches}.
+    """
+    with _flagged_lock:
+        return dict(_flagged)
+
+def start_integrity_verifier(interval=VERIFY_INTERVAL):
+    """
+    Starts the background thread that sweeps SaveFiles with verify_savefiles() at
+    startup and every interval seconds while the share can be reached. Only the
+    first call starts a thread.
+    """
+    if _verifier_started.is_set():
+        return
+    _verifier_started.set()
+
+    def run():
+        while True:
+            try:
+                if is_share_available():
+                    verify_savefiles()
+            except Exception as e:
+                logging.error(f"Failed to verify the SaveFiles schedules: {str(e)}")
+            time.sleep(interval)
+
+    threading.Thread(target=run, daemon=True).start()
+
+if __name__ == "__main__":
+    # Usage: python -m functions.verify_functions
+    flagged = verify_savefiles()
+    for name, mismatches in sorted(flagged.items()):
+        for mismatch in mismatches:
+            print(f"{name}: {mismatch}")
+    unverified = [entry["name"] for entry in load_verify_state()["schedules"].values() if entry.get("unverified")]
+    print(f"{len(flagged)} schedules failed the integrity check, {len(unverified)} have months that could not be verified")
@@ -0,0 +1,421 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+from contextlib import contextmanager
+
+# Third-Party Library Imports
+
+# Local Application/Library Specific Imports
+from constants import log_file
+from PathConfig import get_paths
+
+# Logging Format
+logging.basicConfig(level=logging.ERROR,
+                    format='%(asctime)s - %(levelname)s - %(message)s',
+                    filename=log_file,
+                    filemode='a'
+)
+
+# Journals younger than this may belong to a save still in progress on another machine
+JOURNAL_RECOVERY_AGE = 60.0
+
+# Seconds to wait for another user's save lock, and the age after which a lock is stale
+LOCK_TIMEOUT = 10.0
+LOCK_STALE_AGE = 30.0
+
+_active = threading.local()
+
+# Called with a commit's writes before they land; queues them and returns True while the share is offline
+_offline_handler = None
+
+def get_journal_folder():
+    return get_paths().journal_folder
+
+def get_file_size(path):
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
+
+def get_temp_path(path, tag):
+    directory, filename = os.path.split(path)
+    return os.path.normpath(os.path.join(directory, f".{filename}.{tag}.tmp"))
+
+def write_temp_file(path, contents):
+    """
+    Writes contents to path and forces it to disk before returning. Bytes are
+    written in binary mode.
+    """
+    with open(path, 'wb' if isinstance(contents, bytes) else 'w') as file:
+        file.write(contents)
+        file.flush()
+        os.fsync(file.fileno())
+
+def atomic_write(path, contents):
+    """
+    Replaces a file in one step: the contents go to a temp file next to the target,
+    which is synced to disk and then renamed over the target. A crash or dropped
+    connection leaves either the old file or the new one, never a truncated file.
+
+    Args:
+        path (str): The file to write.
+        contents (str or bytes): The new file contents.
+    """
+    temp_path = get_temp_path(path, uuid.uuid4().hex)
+    try:
+        write_temp_file(temp_path, contents)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def append_now(path, contents):
+    """
+    Appends contents to path and forces it to disk before returning.
+    """
+    with open(path, 'a') as file:
+        file.write(contents)
+        file.flush()
+        os.fsync(file.fileno())
+
+def write_file(path, contents):
+    """
+    Durably writes a file. Inside a WriteJournal the write joins the journal and
+    lands when the journal commits; otherwise the file is replaced atomically.
+    """
+    journal = getattr(_active, "journal", None)
+    if journal is not None:
+        journal.stage(path, contents)
+    else:
+        atomic_write(path, contents)
+
+def append_file(path, contents):
+    """
+    Durably appends to a file. Inside a WriteJournal the append joins the journal
+    and lands when the journal commits.
+    """
+    journal = getattr(_active, "journal", None)
+    if journal is not None:
+        journal.stage_append(path, contents)
+    else:
+        append_now(path, contents)
+
+def write_json(path, data):
+    write_file(path, json.dumps(data, indent=4))
+
+def acquire_lock(lock_path, timeout=LOCK_TIMEOUT, stale_after=LOCK_STALE_AGE):
+    """
+    Takes an exclusive lock file so that only one user at a time can compare and
+    replace a schedule. A lock left behind by a crashed save is broken once it is
+    older than stale_after seconds.
+
+    Raises:
+        TimeoutError: If the lock is still held after timeout seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            return
+        except FileExistsError:
+            try:
+                if time.time() - os.stat(lock_path).st_mtime > stale_after:
+                    os.remove(lock_path)
+                    logging.error(f"Removed stale save lock {lock_path}")
+                    continue
+            except FileNotFoundError:
+                continue
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"Timed out waiting for save lock {lock_path}")
+            time.sleep(0.05)
+
+def release_lock(lock_path):
+    try:
+        os.remove(lock_path)
+    except FileNotFoundError:
+        pass
+
+def set_offline_handler(handler):
+    """
+    Registers the callable that takes over a WriteJournal's writes while the share
+    cannot be reached. It receives the staged files and appends, and returns True if
+    it queued them.
+    """
+    global _offline_handler
+    _offline_handler = handler
+
+def get_active_journal():
+    """
+    Returns the WriteJournal active on this thread, or None.
+    """
+    return getattr(_active, "journal", None)
+
+@contextmanager
+def outside_journal():
+    """
+    Suspends the active WriteJournal so the writes inside the block land at once.
+    """
+    journal = getattr(_active, "journal", None)
+    _active.journal = None
+    try:
+        yield
+    finally:
+        _active.journal = journal
+
+
+class WriteJournal:
+    """
+    Groups the writes of one operation (e.g. OT, WS and OT_Slots files) so they
+    either all land or none do.
+
+    Writes made through write_file() and append_file() while the journal is active
+    are held until the with-block ends. On commit every new file (or appended tail)
+    is written to a synced temp file, the journal under SaveFiles/.journal is marked
+    committed, and the temp files are renamed over (or appended to) their targets.
+    If the process dies before the journal is marked committed the temp files are
+    discarded; if it dies afterwards recover_journals() finishes the job. Appends
+    record the target's original size so finishing them twice is harmless. Nested
+    journals join the outermost one.
+
+    Usage:
+        with WriteJournal():
+            save_overtime_slots(...)
+            flush_pending_writes()
+    """
+    def __init__(self):
+        self.journal_id = uuid.uuid4().hex
+        self.path = os.path.normpath(os.path.join(get_journal_folder(), f"{self.journal_id}.json"))
+        self.staged = {}
+        self.appends = {}
+        self.callbacks = []
+        self.exit_callbacks = []
+        self.locks = set()
+        self.offline_paths = set()
+        self.offline_callbacks = []
+        self.outer = None
+
+    def __enter__(self):
+        self.outer = getattr(_active, "journal", None)
+        if self.outer is None:
+            _active.journal = self
+        return self.outer or self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.outer is not None:
+            return False
+
+        _active.journal = None
+        try:
+            if exc_type is None:
+                self.commit()
+            else:
+                self.rollback()
+        finally:
+            exit_callbacks, self.exit_callbacks = self.exit_callbacks, []
+            for callback in exit_callbacks:
+                callback()
+        return False
+
+    def stage(self, path, contents):
+        """
+        Holds a file write until commit. A later write to the same path replaces it.
+        """
+        path = os.path.abspath(path)
+        self.appends.pop(path, None)
+        self.staged[path] = contents
+
+    def stage_append(self, path, contents):
+        """
+        Holds an append until commit. Appends to a path that is also being written
+        are added to the new contents.
+        """
+        path = os.path.abspath(path)
+        if path in self.staged:
+            self.staged[path] += contents
+        else:
+            self.appends[path] = self.appends.get(path, "") + contents
+
+    def on_commit(self, callback):
+        """
+        Registers a callable to run once every staged file has been written.
+        """
+        self.callbacks.append(callback)
+
+    def on_exit(self, callback):
+        """
+        Registers a callable to run when the journal ends, whether it committed or not.
+        """
+        self.exit_callbacks.append(callback)
+
+    def on_offline(self, paths, callback):
+        """
+        Registers writes that are not handed to the offline handler as plain file
+        writes. If the share is offline at commit, callback is run instead so it can
+        queue them another way, e.g. as a schedule document that is merged when
+        replayed.
+        """
+        self.offline_paths.update(os.path.abspath(path) for path in paths)
+        self.offline_callbacks.append(callback)
+
+    def hold_lock(self, lock_path):
+        """
+        Takes a lock file until the journal ends, see hold_locks().
+        """
+        self.hold_locks([lock_path])
+
+    def hold_locks(self, lock_paths):
+        """
+        Takes lock files until the journal ends, in sorted path order. A lock the
+        journal already holds is not taken again, so saving the same file twice in
+        one operation does not wait on itself.
+
+        Every journal takes its locks in this one order, so an operation that saves
+        several files should pass all of their locks up front. A lock that sorts
+        before one the journal already holds is only taken if it is free: waiting
+        for it could deadlock with a journal that holds it and waits for ours.
+
+        Raises:
+            TimeoutError: If a lock is held by another user for too long, or at all
+            when it is taken out of order.
+        """
+        for lock_path in sorted({os.path.abspath(lock_path) for lock_path in lock_paths} - self.locks):
+            if any(held > lock_path for held in self.locks):
+                acquire_lock(lock_path, timeout=0)
+            else:
+                acquire_lock(lock_path)
+            self.locks.add(lock_path)
+            self.on_exit(lambda lock_path=lock_path: self.release(lock_path))
+
+    def release(self, lock_path):
+        self.locks.discard(lock_path)
+        release_lock(lock_path)
+
+    def write_journal(self, state, entries):
+        atomic_write(self.path, json.dumps({"state": state, "files": entries}))
+
+    def commit(self):
+        if self.staged or self.appends:
+            staged = {target: contents for target, contents in self.staged.items() if target not in self.offline_paths}
+            appends = {target: contents for target, contents in self.appends.items() if target not in self.offline_paths}
+            if _offline_handler is not None and _offline_handler(staged, appends):
+                # Queued until the share is back; on_commit callbacks describe writes that have not landed
+                offline_callbacks = self.offline_callbacks
+                self.rollback()
+                for callback in offline_callbacks:
+                    callback()
+                return
+
+        contents = dict(self.staged, **self.appends)
+        entries = [
+            {"target": target, "temp": get_temp_path(target, self.journal_id)}
+            for target in self.staged
+        ] + [
+            {"target": target, "temp": get_temp_path(target, self.journal_id), "offset": get_file_size(target)}
+            for target in self.appends
+        ]
+
+        if len(entries) == 1 and "offset" in entries[0]:
+            # A single append goes straight to the file
+            append_now(entries[0]["target"], contents[entries[0]["target"]])
+        elif len(entries) == 1:
+            # A single file needs no journal, the rename is already atomic
+            atomic_write(entries[0]["target"], contents[entries[0]["target"]])
+        elif entries:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            self.write_journal("pending", entries)
+            try:
+                for entry in entries:
+                    write_temp_file(entry["temp"], contents[entry["target"]])
+                self.write_journal("committed", entries)
+            except Exception:
+                discard_journal(self.path, entries)
+                raise
+
+            replay_journal(self.path, entries)
+
+        self.staged = {}
+        self.appends = {}
+        self.offline_paths = set()
+        self.offline_callbacks = []
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+    def rollback(self):
+        self.staged = {}
+        self.appends = {}
+        self.callbacks = []
+        self.offline_paths = set()
+        self.offline_callbacks = []
+
+
+def replay_journal(journal_path, entries):
+    """
+    Renames the temp files of a committed journal over their targets (or appends
+    them at the recorded offset), then removes the journal. Safe to repeat: targets
+    already finished are skipped.
+    """
+    for entry in entries:
+        if not os.path.exists(entry["temp"]):
+            continue
+        if "offset" in entry:
+            with open(entry["temp"], 'r') as file:
+                tail = file.read()
+            with open(entry["target"], 'a') as file:
+                file.truncate(entry["offset"])
+            append_now(entry["target"], tail)
+            os.remove(entry["temp"])
+        else:
+            os.replace(entry["temp"], entry["target"])
+    os.remove(journal_path)
+
+def discard_journal(journal_path, entries):
+    """
+    Removes the temp files and the journal of an operation that never committed.
+    """
+    for entry in entries:
+        if os.path.exists(entry["temp"]):
+            os.remove(entry["temp"])
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+def recover_journals(min_age=JOURNAL_RECOVERY_AGE):
+    """
+    Completes or rolls back the journals of interrupted saves. Committed journals
+    are replayed, pending ones are discarded. Journals younger than min_age are left
+    alone since another user's save may still be running.
+
+    Returns:
+        int: The number of journals recovered.
+    """
+    journal_folder = get_journal_folder()
+    if not os.path.isdir(journal_folder):
+        return 0
+
+    recovered = 0
+    for filename in os.listdir(journal_folder):
+        journal_path = os.path.normpath(os.path.join(journal_folder, filename))
+        if not filename.endswith(".json"):
+            continue
+        try:
+            if time.time() - os.stat(journal_path).st_mtime < min_age:
+                continue
+            with open(journal_path, 'r') as file:
+                journal = json.load(file)
+
+            if journal["state"] == "committed":
+                replay_journal(journal_path, journal["files"])
+                logging.error(f"Completed interrupted save from journal {filename}")
+            else:
+                discard_journal(journal_path, journal["files"])
+                logging.error(f"Rolled back interrupted save from journal {filename}")
+            recovered += 1
+        except Exception as e:
+            logging.error(f"Failed to recover journal {filename}: {str(e)}")
+    return recovered
@@ -0,0 +1,65 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import tempfile
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+import PathConfig
+
+# constants.py asks for the shared path on import and keeps the local mirror,
+# outbox and verification state under LOCALAPPDATA, so both point into a scratch
+# folder before any test module imports it
+_session_folder = tempfile.mkdtemp(prefix="plan_matrix_tests_")
+os.environ["LOCALAPPDATA"] = os.path.join(_session_folder, "local")
+PathConfig.CONFIG_DIR = os.path.join(_session_folder, "UserRegistry")
+PathConfig.CONFIG_FILE = os.path.join(PathConfig.CONFIG_DIR, "shared_path.txt")
+PathConfig.save_shared_path(os.path.join(_session_folder, "share"))
+
+STORAGE_LAYOUTS = ("year", "month", "log", "sqlite")
+
+@pytest.fixture
+def share(tmp_path, monkeypatch):
+    """
+    An empty shared path for one test. SaveFiles, the tracking logs, the legend and
+    the local mirror, outbox and verification state all live under tmp_path, and
+    the test gets a schedule cache of its own.
+
+    Returns:
+        str: The shared path.
+    """
+    from functions import json_functions, migration_functions, mirror_functions, offline_functions
+    from functions import rollover_functions, sqlite_functions, verify_functions
+
+    shared_path = os.path.join(str(tmp_path), "share")
+    os.makedirs(shared_path)
+    PathConfig.save_shared_path(shared_path)
+    mirror_functions.check_share()
+
+    tracking_logs_dir = os.path.join(shared_path, "SaveFiles", "TrackingLogs")
+    legend_codes = os.path.join(shared_path, "SaveFiles", "UserRegistry", "ws_legend_codes.json")
+    for module in (json_functions, rollover_functions):
+        monkeypatch.setattr(module, "TRACKING_LOGS_DIR", tracking_logs_dir)
+    for module in (json_functions, migration_functions, sqlite_functions):
+        monkeypatch.setattr(module, "LEGEND_CODES", legend_codes)
+    monkeypatch.setattr(mirror_functions, "LOCAL_MIRROR_DIR", os.path.join(str(tmp_path), "mirror"))
+    mirror_functions.get_mirror_folder.cache_clear()
+    monkeypatch.setattr(offline_functions, "LOCAL_OUTBOX_DIR", os.path.join(str(tmp_path), "outbox"))
+    monkeypatch.setattr(verify_functions, "LOCAL_VERIFY_STATE", os.path.join(str(tmp_path), "verified.json"))
+    monkeypatch.setattr(verify_functions, "_flagged", {})
+    monkeypatch.setattr(json_functions, "data_cache", json_functions.DataCache())
+    return shared_path
+
+@pytest.fixture(params=STORAGE_LAYOUTS)
+def layout(request, share, monkeypatch):
+    """
+    Runs a test once for each storage layout, as if it were the configured
+    STORAGE_LAYOUT.
+    """
+    from functions import sqlite_functions, storage_functions
+
+    monkeypatch.setattr(storage_functions, "STORAGE_LAYOUT", request.param)
+    monkeypatch.setattr(sqlite_functions, "STORAGE_LAYOUT", request.param)
+    return request.param
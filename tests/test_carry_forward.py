@@ -0,0 +1,123 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import copy
+import random
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from functions.hours_functions import CarryForward
+from functions.json_functions import update_subsequent_months
+
+SEEDS = range(50)
+MEMBERS = ("Adams", "Baker", "Clark", "Davis", "Evans", "Foster")
+
+# Day entries as users type them: hours, blanks and anything else the grid lets through
+DAY_ENTRIES = ("", "", "0", "1", "4", "8", "12", "x", "-3", "1.5", " 4", "OT")
+
+def reference_carry_forward(document, month):
+    """
+    Carries a month's totals into the following months straight from the rule in
+    the CarryForward docstring, re-summing every later month's day entries. It is
+    kept apart from the code under test, so changing the rule means changing it too.
+    """
+    for subsequent_month in range(month + 1, 13):
+        previous_month_data = document["month"].get(str(subsequent_month - 1), {})
+        for name, member_data in document["month"].get(str(subsequent_month), {}).items():
+            if name not in previous_month_data:
+                continue
+            previous_hours = previous_month_data[name]["monthly_hours"]
+            monthly_hours = member_data["monthly_hours"]
+            asking = sum(int(entry) for entry in monthly_hours["asking_hours_data"] if entry.isdigit())
+            working = sum(int(entry) for entry in monthly_hours["working_hours_data"] if entry.isdigit())
+            monthly_hours["starting_asking_hours"] = previous_hours["total_asking_hours"]
+            monthly_hours["starting_working_hours"] = previous_hours["total_working_hours"]
+            monthly_hours["total_asking_hours"] = previous_hours["total_asking_hours"] + asking + working
+            monthly_hours["total_working_hours"] = previous_hours["total_working_hours"] + working
+
+def random_hours_data(rng):
+    return [rng.choice(DAY_ENTRIES) for _ in range(rng.randint(0, 31))]
+
+def random_document(rng):
+    """
+    Builds an Overtime crew-year with random day entries and stored totals. Members
+    join and leave during the year, so some months miss some members.
+    """
+    document = {"month": {}}
+    roster = list(MEMBERS)
+    for month in range(1, 13):
+        if rng.random() < 0.2:
+            roster.remove(rng.choice(roster))
+        if rng.random() < 0.2:
+            roster.append(f"New {month}")
+        document["month"][str(month)] = {
+            name: {
+                "monthly_hours": {
+                    "starting_asking_hours": rng.randint(0, 200),
+                    "starting_working_hours": rng.randint(0, 200),
+                    "total_asking_hours": rng.randint(0, 400),
+                    "total_working_hours": rng.randint(0, 400),
+                    "asking_hours_data": random_hours_data(rng),
+                    "working_hours_data": random_hours_data(rng)
+                }
+            } for name in rng.sample(roster, len(roster))
+        }
+    return document
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_propagate_matches_reference(seed):
+    rng = random.Random(seed)
+    document = random_document(rng)
+    for month in range(1, 13):
+        expected = copy.deepcopy(document)
+        reference_carry_forward(expected, month)
+
+        actual = copy.deepcopy(document)
+        updated_months = CarryForward().propagate(actual, month)
+
+        assert actual == expected, f"seed {seed}, month {month}"
+        assert updated_months == [str(subsequent_month) for subsequent_month in range(month + 1, 13)]
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_update_subsequent_months_matches_reference(seed):
+    document = random_document(random.Random(seed))
+    for month in range(1, 13):
+        expected = copy.deepcopy(document)
+        reference_carry_forward(expected, month)
+
+        actual = copy.deepcopy(document)
+        update_subsequent_months(actual, "A", 2024, "Overtime", month)
+        assert actual == expected, f"seed {seed}, month {month}"
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_propagate_with_cached_sums_matches_reference(seed):
+    rng = random.Random(seed)
+    expected = random_document(rng)
+    actual = copy.deepcopy(expected)
+    carry_forward = CarryForward()
+    for _ in range(12):
+        # Edit a member's day entries the way a save does, then carry the month forward
+        month = rng.randint(1, 12)
+        month_str = str(month)
+        if expected["month"][month_str]:
+            name = rng.choice(list(expected["month"][month_str]))
+            field = rng.choice(("asking_hours_data", "working_hours_data"))
+            hours_data = random_hours_data(rng)
+            expected["month"][month_str][name]["monthly_hours"][field] = hours_data
+            actual["month"][month_str][name]["monthly_hours"][field] = list(hours_data)
+            carry_forward.invalidate(month)
+
+        reference_carry_forward(expected, month)
+        carry_forward.propagate(actual, month)
+        assert actual == expected, f"seed {seed}, month {month}"
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_recalculated_document_passes_check(seed):
+    document = random_document(random.Random(seed))
+    carry_forward = CarryForward()
+    # Every month is recomputed, so members who joined during the year are as well
+    for month in range(1, 13):
+        carry_forward.recalculate(document, month)
+
+    assert carry_forward.check(document) == []
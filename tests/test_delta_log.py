@@ -0,0 +1,127 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import copy
+import os
+import time
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from functions import storage_functions
+from functions.storage_functions import MONTHS, DeltaLogStore, apply_deltas, diff_month
+from functions.write_functions import atomic_write, acquire_lock, release_lock
+
+def member(entry_data):
+    return {"monthly_hours": {"entry_data": list(entry_data)}}
+
+def new_document():
+    return {"version": 1, "month": {month: {"a": member(["", "", ""]), "b": member(["", "", ""])} for month in MONTHS}}
+
+def read_lines(path):
+    with open(path, 'r') as file:
+        return file.read().splitlines()
+
+def save(store, document, month, change):
+    """
+    Changes one month of the document and appends it under the schedule lock, the
+    way a save does.
+    """
+    change(document["month"][str(month)])
+    document["version"] += 1
+    acquire_lock(store.lock_path)
+    try:
+        store.save(document, months=[month])
+    finally:
+        release_lock(store.lock_path)
+
+@pytest.mark.parametrize("change", [
+    lambda month_data: month_data["a"]["monthly_hours"]["entry_data"].__setitem__(1, "D"),
+    lambda month_data: month_data["a"]["monthly_hours"].__setitem__("entry_data", ["D"]),
+    lambda month_data: month_data.__setitem__("c", member(["N"])),
+    lambda month_data: month_data.pop("a"),
+    lambda month_data: month_data.update({"b": month_data.pop("a"), "a": month_data.pop("b")}),
+    lambda month_data: month_data["b"].__setitem__("monthly_hours", {"role_data": []}),
+], ids=["cell", "field", "added", "removed", "reordered", "replaced"])
+def test_deltas_replay_a_change(change):
+    saved = new_document()["month"]["3"]
+    month_data = copy.deepcopy(saved)
+    change(month_data)
+    document = {"month": {"3": copy.deepcopy(saved)}}
+
+    apply_deltas(document, diff_month(saved, month_data, "3"))
+
+    assert document["month"]["3"] == month_data
+    assert list(document["month"]["3"]) == list(month_data)
+
+@pytest.fixture
+def store(share):
+    store = DeltaLogStore("A", 2024, "work_schedule")
+    store.save(new_document())
+    return store
+
+def test_each_save_appends_one_line(store):
+    document = new_document()
+    save(store, document, 3, lambda month_data: month_data["a"]["monthly_hours"]["entry_data"].__setitem__(0, "D"))
+    save(store, document, 4, lambda month_data: month_data.pop("b"))
+
+    assert len(read_lines(store.log_path)) == 2
+    loaded, _ = DeltaLogStore("A", 2024, "work_schedule").load()
+    assert loaded["month"] == document["month"]
+    assert loaded["version"] == 3
+
+def test_an_incomplete_line_is_skipped(store):
+    document = new_document()
+    save(store, document, 3, lambda month_data: month_data["a"]["monthly_hours"]["entry_data"].__setitem__(0, "D"))
+    # A save cut off mid-append
+    with open(store.log_path, 'a') as file:
+        file.write('{"version": 9, "del')
+
+    reader = DeltaLogStore("A", 2024, "work_schedule")
+    loaded, _ = reader.load()
+    assert loaded["month"] == document["month"]
+
+    # The next record starts on its own line
+    save(reader, document, 5, lambda month_data: month_data["b"]["monthly_hours"]["entry_data"].__setitem__(2, "N"))
+    loaded, _ = DeltaLogStore("A", 2024, "work_schedule").load()
+    assert loaded["month"] == document["month"]
+
+def test_compaction_folds_the_log_into_the_snapshot(store):
+    document = new_document()
+    for day in range(3):
+        save(store, document, 3, lambda month_data: month_data["a"]["monthly_hours"]["entry_data"].__setitem__(day, "D"))
+
+    DeltaLogStore("A", 2024, "work_schedule").compact()
+
+    assert read_lines(store.log_path) == []
+    loaded, _ = DeltaLogStore("A", 2024, "work_schedule").load()
+    assert loaded["month"] == document["month"]
+    assert loaded["version"] == 4
+
+def test_interrupted_compaction_replays_nothing_twice(store):
+    document = new_document()
+    save(store, document, 3, lambda month_data: month_data["a"]["monthly_hours"]["entry_data"].__setitem__(0, "D"))
+    save(store, document, 3, lambda month_data: month_data.pop("b"))
+    log = read_lines(store.log_path)
+
+    # The new snapshot was written but the log was not emptied yet
+    DeltaLogStore("A", 2024, "work_schedule").compact()
+    atomic_write(store.log_path, "\n".join(log) + "\n")
+
+    loaded, _ = DeltaLogStore("A", 2024, "work_schedule").load()
+    assert loaded["month"] == document["month"]
+
+def test_a_long_log_is_compacted_in_the_background(store, monkeypatch):
+    document = new_document()
+    for month in range(1, 4):
+        if month == 3:
+            # The last save takes the log past the limit
+            monkeypatch.setattr(storage_functions, "LOG_COMPACT_BYTES", os.path.getsize(store.log_path))
+        save(store, document, month, lambda month_data: month_data["a"]["monthly_hours"]["entry_data"].__setitem__(0, "D"))
+
+    deadline = time.monotonic() + 5
+    while read_lines(store.log_path) and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert read_lines(store.log_path) == []
+    loaded, _ = DeltaLogStore("A", 2024, "work_schedule").load()
+    assert loaded["month"] == document["month"]
@@ -0,0 +1,146 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from functions import storage_functions
+from functions.json_functions import DataCache, RosterTransaction
+from functions.merge_functions import MergeConflict, merge_month
+from functions.storage_functions import get_store
+
+def member(entry_data):
+    return {"monthly_hours": {"entry_data": list(entry_data)}}
+
+def overtime_member(total_working_hours, working_hours_data):
+    return {"monthly_hours": {"total_working_hours": total_working_hours, "working_hours_data": list(working_hours_data)}}
+
+def test_merge_month_keeps_both_sides_edits():
+    base = {"a": member(["D", "", ""]), "b": member(["", "", ""])}
+    mine = {"a": member(["D", "N", ""]), "b": member(["", "", ""])}
+    theirs = {"a": member(["D", "", "R"]), "b": member(["V", "", ""])}
+    conflicts = []
+
+    merged = merge_month(base, mine, theirs, "3", conflicts)
+
+    assert merged == {"a": member(["D", "N", "R"]), "b": member(["V", "", ""])}
+    assert conflicts == []
+
+def test_merge_month_adds_up_both_sides_totals():
+    base = {"a": overtime_member(10, ["", ""])}
+    mine = {"a": overtime_member(14, ["4", ""])}
+    theirs = {"a": overtime_member(18, ["", "8"])}
+
+    merged = merge_month(base, mine, theirs, "3", [])
+
+    assert merged["a"] == overtime_member(22, ["4", "8"])
+
+def test_merge_month_reports_a_cell_both_sides_changed():
+    base = {"a": member(["", ""])}
+    mine = {"a": member(["D", ""])}
+    theirs = {"a": member(["N", ""])}
+    conflicts = []
+
+    merged = merge_month(base, mine, theirs, "3", conflicts)
+
+    assert merged == mine
+    assert len(conflicts) == 1
+    conflict = conflicts[0]
+    assert isinstance(conflict, MergeConflict)
+    assert (conflict.month, conflict.member, conflict.field, conflict.mine, conflict.theirs) == ("3", "a", "monthly_hours.entry_data[0]", "D", "N")
+
+def test_merge_month_keeps_members_added_on_either_side():
+    base = {"a": member([]), "b": member([])}
+    mine = {"a": member([]), "c": member([]), "b": member([])}
+    theirs = {"a": member([]), "b": member([]), "d": member([])}
+
+    merged = merge_month(base, mine, theirs, "3", [])
+
+    assert list(merged) == ["a", "c", "b", "d"]
+
+def test_merge_month_reports_an_edit_to_a_removed_member():
+    base = {"a": member([""]), "b": member([""])}
+    mine = {"a": member(["D"]), "b": member([""])}
+    theirs = {"b": member([""])}
+    conflicts = []
+
+    merged = merge_month(base, mine, theirs, "3", conflicts)
+
+    assert list(merged) == ["b"]
+    assert [(conflict.member, conflict.field) for conflict in conflicts] == [("a", "removed")]
+
+@pytest.fixture
+def roster(share):
+    transaction = RosterTransaction("A", 2024)
+    for name in ("a", "b"):
+        transaction.add_member(name)
+    transaction.commit()
+
+def edit_entries(cache, name, month, entry_data):
+    cache_key = DataCache.get_cache_key("A", 2024, "work_schedule")
+    document = cache.get_document("A", 2024, "work_schedule", months=[month])
+    cache.mark_dirty(cache_key, month)
+    document["month"][str(month)][name]["monthly_hours"]["entry_data"] = list(entry_data)
+
+def load_month(month):
+    return get_store("A", 2024, "work_schedule").load()[0]["month"][str(month)]
+
+def test_concurrent_saves_of_different_members_are_merged(layout, roster):
+    first_user, second_user = DataCache(revalidate_interval=0), DataCache(revalidate_interval=0)
+    for cache in (first_user, second_user):
+        cache.get_document("A", 2024, "work_schedule")
+
+    edit_entries(first_user, "a", 3, ["D", "D"])
+    edit_entries(second_user, "b", 3, ["N", "N"])
+    assert first_user.flush() == []
+    assert second_user.flush() == []
+
+    month_data = load_month(3)
+    assert month_data["a"] == member(["D", "D"])
+    assert month_data["b"] == member(["N", "N"])
+
+def test_concurrent_saves_of_one_cell_keep_the_later_value(layout, roster):
+    first_user, second_user = DataCache(revalidate_interval=0), DataCache(revalidate_interval=0)
+    for cache in (first_user, second_user):
+        cache.get_document("A", 2024, "work_schedule")
+
+    edit_entries(first_user, "a", 3, ["D", ""])
+    edit_entries(second_user, "a", 3, ["N", "R"])
+    assert first_user.flush() == []
+    conflicts = second_user.flush()
+
+    assert [(conflict.month, conflict.member, conflict.field, conflict.mine, conflict.theirs) for conflict in conflicts] == [
+        ("3", "a", "monthly_hours.entry_data[0]", "N", "D")
+    ]
+    assert load_month(3)["a"] == member(["N", "R"])
+
+def test_save_within_the_same_modification_time_is_merged(share, monkeypatch):
+    monkeypatch.setattr(storage_functions, "STORAGE_LAYOUT", "year")
+    transaction = RosterTransaction("A", 2024)
+    for name in ("a", "b"):
+        transaction.add_member(name)
+    transaction.commit()
+    setup_user = DataCache()
+    for name in ("a", "b"):
+        edit_entries(setup_user, name, 3, ["X"])
+    setup_user.flush()
+
+    store = get_store("A", 2024, "work_schedule")
+    first_user, second_user = DataCache(revalidate_interval=0), DataCache(revalidate_interval=0)
+    for cache in (first_user, second_user):
+        cache.get_document("A", 2024, "work_schedule")
+    loaded_stat = os.stat(store.path)
+
+    edit_entries(first_user, "a", 3, ["D"])
+    assert first_user.flush() == []
+    # Saved within the file system's time resolution and just as long, so only the contents differ
+    assert os.stat(store.path).st_size == loaded_stat.st_size
+    os.utime(store.path, ns=(loaded_stat.st_atime_ns, loaded_stat.st_mtime_ns))
+    edit_entries(second_user, "b", 3, ["N"])
+    assert second_user.flush() == []
+
+    month_data = load_month(3)
+    assert month_data["a"] == member(["D"])
+    assert month_data["b"] == member(["N"])
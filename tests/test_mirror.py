@@ -0,0 +1,81 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from PathConfig import get_paths
+from functions.mirror_functions import check_share, get_read_path, is_readable, read_from_share, sync_mirror
+
+def read(path):
+    with open(path, 'r') as file:
+        return file.read()
+
+def write(path, contents):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as file:
+        file.write(contents)
+
+@pytest.fixture
+def share_file(share):
+    path = os.path.join(get_paths().save_folder, "WS_A_2024.json")
+    write(path, '{"version": 1}')
+    return path
+
+def test_reads_are_served_from_the_mirror(share_file):
+    read_path = get_read_path(share_file)
+
+    assert read_path != share_file
+    assert read(read_path) == '{"version": 1}'
+    # A current copy is served as it is
+    assert get_read_path(share_file) == read_path
+
+def test_mirror_copy_is_refreshed_when_the_share_file_changes(share_file):
+    read_path = get_read_path(share_file)
+    write(share_file, '{"version": 12}')
+
+    assert get_read_path(share_file) == read_path
+    assert read(read_path) == '{"version": 12}'
+
+def test_read_from_share_bypasses_the_mirror(share_file):
+    get_read_path(share_file)
+
+    with read_from_share():
+        assert get_read_path(share_file) == share_file
+    assert get_read_path(share_file) != share_file
+
+def test_logs_and_locks_are_not_mirrored(share):
+    save_folder = get_paths().save_folder
+    for path in (os.path.join(save_folder, "TrackingLogs", "A_2024.json"), os.path.join(save_folder, "WS_A_2024.json.lock")):
+        write(path, "")
+        assert get_read_path(path) == path
+
+def test_sync_copies_new_files_and_removes_deleted_ones(share_file):
+    other_file = os.path.join(get_paths().save_folder, "Archive", "WS_A_2019.json")
+    write(other_file, "{}")
+    assert sync_mirror() == 2
+    assert sync_mirror() == 0
+    mirror_copy = get_read_path(other_file)
+
+    os.remove(other_file)
+    sync_mirror()
+
+    assert not os.path.exists(mirror_copy)
+    assert not os.path.exists(os.path.dirname(mirror_copy))
+    assert os.path.exists(get_read_path(share_file))
+
+def test_mirror_copy_is_served_while_the_share_is_offline(share, share_file):
+    get_read_path(share_file)
+    offline_share = f"{share}.offline"
+    os.rename(share, offline_share)
+    try:
+        read_path = get_read_path(share_file)
+        assert read(read_path) == '{"version": 1}'
+        assert is_readable(share_file)
+        with pytest.raises(FileNotFoundError):
+            get_read_path(os.path.join(get_paths().save_folder, "WS_B_2024.json"))
+    finally:
+        os.rename(offline_share, share)
+        check_share()
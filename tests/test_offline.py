@@ -0,0 +1,102 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+from contextlib import contextmanager
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from PathConfig import get_paths
+from functions import json_functions
+from functions.json_functions import DataCache, RosterTransaction, replay_offline_writes, restore_offline_writes
+from functions.merge_functions import MergeConflict
+from functions.mirror_functions import check_share, sync_mirror
+from functions.offline_functions import get_outbox_folder, count_queued_writes
+from functions.storage_functions import get_store
+from functions.write_functions import WriteJournal, atomic_write, write_file
+
+@contextmanager
+def offline(shared_path):
+    """
+    Takes the share offline for the duration of the block.
+    """
+    offline_path = f"{shared_path}.offline"
+    os.rename(shared_path, offline_path)
+    check_share()
+    try:
+        yield
+    finally:
+        os.rename(offline_path, shared_path)
+        check_share()
+
+def read(path):
+    with open(path, 'r') as file:
+        return file.read()
+
+def edit_entries(cache, name, month, entry_data):
+    cache_key = DataCache.get_cache_key("A", 2024, "work_schedule")
+    document = cache.get_document("A", 2024, "work_schedule", months=[month])
+    cache.mark_dirty(cache_key, month)
+    document["month"][str(month)][name]["monthly_hours"]["entry_data"] = list(entry_data)
+
+def load_month(month):
+    return get_store("A", 2024, "work_schedule").load()[0]["month"][str(month)]
+
+@pytest.fixture
+def roster(share):
+    transaction = RosterTransaction("A", 2024)
+    for name in ("a", "b"):
+        transaction.add_member(name)
+    transaction.commit()
+    json_functions.data_cache.get_document("A", 2024, "work_schedule")
+    sync_mirror()
+
+def test_offline_save_is_queued_and_merged_when_replayed(layout, share, roster):
+    with offline(share):
+        edit_entries(json_functions.data_cache, "a", 3, ["D"])
+        assert json_functions.flush_pending_writes() == []
+        assert os.listdir(get_outbox_folder("documents")) == [f"{DataCache.get_cache_key('A', 2024, 'work_schedule')}.json"]
+
+    # Another user saved while this one was offline
+    other_user = DataCache()
+    edit_entries(other_user, "b", 3, ["N"])
+    other_user.flush()
+
+    assert replay_offline_writes() == []
+    month_data = load_month(3)
+    assert month_data["a"]["monthly_hours"]["entry_data"] == ["D"]
+    assert month_data["b"]["monthly_hours"]["entry_data"] == ["N"]
+    assert count_queued_writes() == 0
+
+def test_queued_saves_survive_a_restart(share, roster, monkeypatch):
+    with offline(share):
+        edit_entries(json_functions.data_cache, "a", 3, ["D"])
+        json_functions.flush_pending_writes()
+
+    monkeypatch.setattr(json_functions, "data_cache", DataCache())
+    assert restore_offline_writes() == 1
+    assert replay_offline_writes() == []
+    assert load_month(3)["a"]["monthly_hours"]["entry_data"] == ["D"]
+
+def test_offline_file_write_conflicts_with_another_users_change(share, roster):
+    save_folder = get_paths().save_folder
+    changed_file, unchanged_file = (os.path.join(save_folder, name) for name in ("changed.json", "unchanged.json"))
+    for path in (changed_file, unchanged_file):
+        atomic_write(path, "saved")
+    sync_mirror()
+
+    with offline(share):
+        with WriteJournal():
+            write_file(changed_file, "mine")
+            write_file(unchanged_file, "mine")
+        assert len(os.listdir(get_outbox_folder("files"))) == 2
+
+    atomic_write(changed_file, "theirs")
+    conflicts = replay_offline_writes()
+
+    assert [(conflict.member, conflict.field) for conflict in conflicts] == [("changed.json", "file")]
+    assert all(isinstance(conflict, MergeConflict) for conflict in conflicts)
+    assert read(changed_file) == "theirs"
+    assert read(unchanged_file) == "mine"
+    assert count_queued_writes() == 0
@@ -0,0 +1,80 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import json
+import logging
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from functions.json_functions import RosterTransaction, create_hours_data_json, load_hours_data_from_json
+from functions.rollover_functions import ROLLOVER_SCHEDULE_TYPES, get_rollover_report_path, rollover_all_crews, rollover_crew
+from functions.storage_functions import get_store
+
+# December totals as {name: (total_working_hours, total_asking_hours)}
+DECEMBER_TOTALS = {"a": (20, 5), "b": (10, 5), "c": (30, 0)}
+
+@pytest.fixture
+def previous_year(share):
+    """
+    Crew A with three members in 2024 and December totals set, and crew E with
+    no members.
+    """
+    transaction = RosterTransaction("A", 2024)
+    for name in DECEMBER_TOTALS:
+        transaction.add_member(name)
+    transaction.commit()
+    for schedule_type in ("Overtime", "work_schedule"):
+        create_hours_data_json("E", 2024, schedule_type)
+
+    store = get_store("A", 2024, "Overtime")
+    document, _ = store.load()
+    for name, (total_working_hours, total_asking_hours) in DECEMBER_TOTALS.items():
+        monthly_hours = document["month"]["12"][name]["monthly_hours"]
+        monthly_hours["total_working_hours"], monthly_hours["total_asking_hours"] = total_working_hours, total_asking_hours
+    document["version"] += 1
+    store.saved_months = None
+    store.save(document)
+
+def test_rollover_seeds_the_new_year_from_december(previous_year):
+    crew, record, error = rollover_crew("A", 2025)
+
+    assert error is None
+    assert record["created"] == list(ROLLOVER_SCHEDULE_TYPES)
+    # Lowest working total ranks 0; equal asking totals keep their working order
+    assert record["seeds"] == {"a": [1, 2], "b": [0, 1], "c": [2, 0]}
+
+    overtime, _ = get_store("A", 2025, "Overtime").load()
+    january = overtime["month"]["1"]
+    assert list(january) == list(DECEMBER_TOTALS)
+    assert january["b"]["monthly_hours"]["starting_working_hours"] == 0
+    assert january["b"]["monthly_hours"]["total_asking_hours"] == 1
+    work_schedule, _ = get_store("A", 2025, "work_schedule").load()
+    assert list(work_schedule["month"]["1"]) == list(DECEMBER_TOTALS)
+
+def test_rollover_leaves_existing_years_alone(previous_year):
+    first_run = rollover_all_crews(2025, workers=1)
+    overtime, _ = get_store("A", 2025, "Overtime").load()
+    second_run = rollover_all_crews(2025, workers=1)
+
+    assert sorted(first_run["crews"]) == ["A", "E"]
+    assert first_run["errors"] == {} and second_run["errors"] == {}
+    assert second_run["crews"]["A"]["created"] == []
+    assert second_run["crews"]["A"]["skipped"] == list(ROLLOVER_SCHEDULE_TYPES)
+    assert get_store("A", 2025, "Overtime").load()[0] == overtime
+
+    with open(get_rollover_report_path(2025), 'r') as file:
+        report = json.load(file)
+    assert [run["crews"]["A"]["created"] for run in report["runs"]] == [list(ROLLOVER_SCHEDULE_TYPES), []]
+
+def test_empty_months_of_a_new_year_are_not_errors(previous_year, caplog):
+    rollover_all_crews(2025, workers=1)
+
+    with caplog.at_level(logging.ERROR):
+        for month in range(1, 13):
+            for schedule_type in ("Overtime", "work_schedule"):
+                assert load_hours_data_from_json("E", month, 2025, schedule_type) == {}
+                assert list(load_hours_data_from_json("A", month, 2025, schedule_type)) == list(DECEMBER_TOTALS)
+    assert not [record for record in caplog.records if record.levelno >= logging.ERROR]
+    assert not os.path.exists(get_store("E", 2026, "Overtime").path)
@@ -0,0 +1,135 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+import json
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from functions import json_functions, storage_functions
+from functions.json_functions import RosterTransaction, check_overtime_totals
+from functions.migration_functions import migrate_savefiles
+from functions.schema_functions import SCHEMA_VERSION, needs_upgrade, upgrade_document
+from functions.storage_functions import get_store
+
+def legacy_overtime():
+    return {"version": 3, "month": {
+        "1": {"[placeholder]": {"monthly_hours": {}}},
+        "03": {"a": {"monthly_hours": {"starting_asking_hours": "5", "total_asking_hours": 5, "asking_hours_data": ["1", None, 4]}}}
+    }}
+
+def legacy_work_schedule():
+    return {"month": {"3": {
+        "a": {"monthly_hours": {"3": {"entry_data": ["D", "N"]}}},
+        "b": {"monthly_hours": {"role_data": ["X"]}}
+    }}}
+
+def test_upgrade_document_fixes_an_overtime_document():
+    document = legacy_overtime()
+    anomalies = upgrade_document(document, "Overtime")
+
+    assert document["month"] == {"1": {}, "3": {"a": {"monthly_hours": {
+        "starting_asking_hours": 5,
+        "starting_working_hours": 0,
+        "total_asking_hours": 5,
+        "total_working_hours": 0,
+        "asking_hours_data": ["1", "", "4"],
+        "working_hours_data": []
+    }}}}
+    assert document["schema_version"] == SCHEMA_VERSION
+    assert document["version"] == 3
+    assert "month 1: removed [placeholder] entry" in anomalies
+    assert "month '03' renamed to '3'" in anomalies
+    assert not needs_upgrade(document)
+    # A current document is left alone
+    assert upgrade_document(document, "Overtime") == []
+
+def test_upgrade_document_moves_legacy_work_schedule_entries():
+    document = legacy_work_schedule()
+    anomalies = upgrade_document(document, "work_schedule")
+
+    assert document["month"]["3"] == {"a": {"monthly_hours": {"entry_data": ["D", "N"]}}, "b": {"monthly_hours": {"entry_data": ["X"]}}}
+    assert anomalies == ["month 3 a: entries keyed by month 3", "month 3 b: role_data renamed to entry_data"]
+
+def test_upgrade_document_fixes_slot_counts():
+    document = {"month": {"3": {"count": "4", "Overtime 1": ["a", None]}, "13": {}}}
+    anomalies = upgrade_document(document, "OT_Slots")
+
+    assert document["month"] == {"3": {"count": 4, "Overtime 1": ["a", ""]}}
+    assert "dropped month '13'" in anomalies
+
+@pytest.fixture
+def legacy_savefiles(share, monkeypatch):
+    """
+    A crew-year saved by an older version of the app, as year files.
+    """
+    monkeypatch.setattr(storage_functions, "STORAGE_LAYOUT", "year")
+    paths = {}
+    for schedule_type, document in (("Overtime", legacy_overtime()), ("work_schedule", legacy_work_schedule())):
+        paths[schedule_type] = get_store("A", 2024, schedule_type).path
+        os.makedirs(os.path.dirname(paths[schedule_type]), exist_ok=True)
+        with open(paths[schedule_type], 'w') as file:
+            json.dump(document, file)
+    return paths
+
+def read(path):
+    with open(path, 'r') as file:
+        return file.read()
+
+def test_validate_reports_without_writing(legacy_savefiles):
+    saved = {schedule_type: read(path) for schedule_type, path in legacy_savefiles.items()}
+    report = migrate_savefiles(dry_run=True, workers=1)
+
+    assert report["schedules"] == 2
+    assert sorted(report["anomalies"]) == ["OT_A_2024", "WS_A_2024"]
+    assert report["upgraded"] == [] and report["errors"] == {}
+    assert {schedule_type: read(path) for schedule_type, path in legacy_savefiles.items()} == saved
+
+def test_migrate_upgrades_in_place(legacy_savefiles):
+    report = migrate_savefiles(workers=1)
+    assert sorted(report["upgraded"]) == ["OT_A_2024", "WS_A_2024"]
+
+    for schedule_type, path in legacy_savefiles.items():
+        with open(path, 'r') as file:
+            document = json.load(file)
+        assert document["schema_version"] == SCHEMA_VERSION
+        assert upgrade_document(document, schedule_type) == []
+
+    report = migrate_savefiles(workers=1)
+    assert report["upgraded"] == [] and report["anomalies"] == {}
+
+def test_migrate_recomputes_totals_saved_under_the_old_carry_rule(layout, share):
+    transaction = RosterTransaction("A", 2024)
+    for name in ("a", "b"):
+        transaction.add_member(name)
+    transaction.commit()
+
+    # Under the old rule worked hours were not carried into later asking totals
+    store = get_store("A", 2024, "Overtime")
+    document, _ = store.load()
+    for month in range(1, 13):
+        for name, member_data in document["month"][str(month)].items():
+            monthly_hours = member_data["monthly_hours"]
+            monthly_hours["asking_hours_data"], monthly_hours["working_hours_data"] = ["2"], ["5"]
+            if month > 1:
+                previous_hours = document["month"][str(month - 1)][name]["monthly_hours"]
+                monthly_hours["starting_asking_hours"] = previous_hours["total_asking_hours"]
+                monthly_hours["starting_working_hours"] = previous_hours["total_working_hours"]
+            monthly_hours["total_working_hours"] = monthly_hours["starting_working_hours"] + 5
+            monthly_hours["total_asking_hours"] = monthly_hours["starting_asking_hours"] + 2 + (5 if month == 1 else 0)
+    document["version"] += 1
+    store.saved_months = None
+    store.save(document)
+    json_functions.invalidate_cache()
+    assert check_overtime_totals("A", 2024)
+
+    report = migrate_savefiles(workers=1)
+    assert "OT_A_2024" in report["upgraded"]
+    json_functions.invalidate_cache()
+    assert check_overtime_totals("A", 2024) == []
+    december = get_store("A", 2024, "Overtime").load()[0]["month"]["12"]
+    assert december["a"]["monthly_hours"]["total_asking_hours"] == 12 * 7
+
+    report = migrate_savefiles(workers=1)
+    assert "OT_A_2024" not in report["upgraded"] and "OT_A_2024" not in report["anomalies"]
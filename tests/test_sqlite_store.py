@@ -0,0 +1,125 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import json
+import os
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from PathConfig import get_paths
+from functions import json_functions, storage_functions
+from functions.json_functions import DataCache, RosterTransaction, load_legend_job_codes, save_legend_job_codes
+from functions.sqlite_functions import SqliteStore, load_overtime_slots_from_db, migrate_to_sqlite
+from functions.storage_functions import MONTHS, get_store
+
+def overtime_member(total_asking_hours, total_working_hours, working_hours_data):
+    return {
+        "monthly_hours": {
+            "starting_asking_hours": 0,
+            "starting_working_hours": 0,
+            "total_asking_hours": total_asking_hours,
+            "total_working_hours": total_working_hours,
+            "asking_hours_data": ["", ""],
+            "working_hours_data": list(working_hours_data)
+        }
+    }
+
+def new_document():
+    document = {"version": 1, "month": {month: {} for month in MONTHS}}
+    document["month"]["3"] = {"b": overtime_member(4, 12, ["8", "4"]), "a": overtime_member(0, 8, ["", "8"])}
+    return document
+
+def test_store_round_trip(share):
+    document = new_document()
+    SqliteStore("A", 2024, "Overtime").save(document)
+
+    store = SqliteStore("A", 2024, "Overtime")
+    loaded, _ = store.load()
+    assert loaded["month"] == document["month"]
+    assert list(loaded["month"]["3"]) == ["b", "a"]
+    assert store.get_stamp() == 1
+
+def test_store_saves_and_loads_single_months(share):
+    document = new_document()
+    store = SqliteStore("A", 2024, "Overtime")
+    store.save(document)
+
+    document["month"]["3"]["a"]["monthly_hours"]["working_hours_data"] = ["4", "8"]
+    document["month"]["4"] = {"a": overtime_member(0, 0, [])}
+    document["version"] = 2
+    store.save(document, months=[3])
+
+    loaded, sizes = SqliteStore("A", 2024, "Overtime").load(months=[3, 4])
+    assert list(loaded["month"]) == ["3", "4"]
+    assert loaded["month"]["3"] == document["month"]["3"]
+    # Month 4 was not part of the save
+    assert loaded["month"]["4"] == {}
+    assert loaded["version"] == 2
+    assert set(sizes) == {"3", "4"}
+
+def test_store_index_reads_the_member_rows(share):
+    SqliteStore("A", 2024, "Overtime").save(new_document())
+
+    month_index = SqliteStore("A", 2024, "Overtime").load_index()["months"]["3"]
+    assert month_index["members"] == ["b", "a"]
+    assert month_index["totals"]["a"] == {"total_asking_hours": 0, "total_working_hours": 8}
+
+@pytest.fixture
+def json_savefiles(share, monkeypatch):
+    """
+    A crew-year kept in JSON files: both schedules with some hours, OT slots and
+    the legend codes.
+    """
+    monkeypatch.setattr(storage_functions, "STORAGE_LAYOUT", "year")
+    transaction = RosterTransaction("A", 2024)
+    for name in ("a", "b"):
+        transaction.add_member(name)
+    transaction.commit()
+
+    cache = DataCache()
+    for schedule_type, field in (("work_schedule", "entry_data"), ("Overtime", "working_hours_data")):
+        cache_key = DataCache.get_cache_key("A", 2024, schedule_type)
+        document = cache.get_document("A", 2024, schedule_type, months=[3])
+        cache.mark_dirty(cache_key, 3)
+        document["month"]["3"]["a"]["monthly_hours"][field] = ["8", "", "4"]
+    cache.flush()
+
+    slots_folder = get_paths().slots_folder
+    os.makedirs(slots_folder, exist_ok=True)
+    with open(os.path.join(slots_folder, "OT_A_2024.json"), 'w') as file:
+        json.dump({"month": {"3": {"Overtime 1": ["a", "", "b"], "count": 4}}}, file)
+    os.makedirs(os.path.dirname(json_functions.LEGEND_CODES), exist_ok=True)
+    save_legend_job_codes({"Lead": "L", "Operator": "O"})
+    return {schedule_type: get_store("A", 2024, schedule_type).load()[0] for schedule_type in ("work_schedule", "Overtime")}
+
+def test_migration_moves_everything_into_the_database(json_savefiles):
+    assert migrate_to_sqlite() == 2
+    json_functions.invalidate_cache()
+
+    save_folder = get_paths().save_folder
+    assert not [name for name in os.listdir(save_folder) if name.endswith(".json")]
+    assert os.listdir(get_paths().slots_folder) == []
+    assert not os.path.exists(json_functions.LEGEND_CODES)
+
+    for schedule_type, document in json_savefiles.items():
+        store = get_store("A", 2024, schedule_type)
+        assert store.layout == SqliteStore.layout
+        assert store.load()[0]["month"] == document["month"]
+    assert load_overtime_slots_from_db("A", 3, 2024) == ({"Overtime 1": ["a", "", "b"], "count": 4}, 4)
+    assert load_legend_job_codes() == {"Lead": "L", "Operator": "O"}
+
+def test_migrated_schedules_keep_saving(json_savefiles):
+    migrate_to_sqlite()
+    json_functions.invalidate_cache()
+
+    cache = DataCache()
+    cache_key = DataCache.get_cache_key("A", 2024, "work_schedule")
+    document = cache.get_document("A", 2024, "work_schedule", months=[3])
+    cache.mark_dirty(cache_key, 3)
+    document["month"]["3"]["b"]["monthly_hours"]["entry_data"] = ["N"]
+    assert cache.flush() == []
+
+    month_data = get_store("A", 2024, "work_schedule").load(months=[3])[0]["month"]["3"]
+    assert month_data["a"]["monthly_hours"]["entry_data"] == ["8", "", "4"]
+    assert month_data["b"]["monthly_hours"]["entry_data"] == ["N"]
@@ -0,0 +1,79 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import json
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from functions import storage_functions, verify_functions
+from functions.json_functions import DataCache, RosterTransaction
+from functions.storage_functions import get_store
+from functions.verify_functions import get_flagged_schedules, verify_savefiles, verify_schedule
+
+def add_roster():
+    transaction = RosterTransaction("A", 2024)
+    for name in ("a", "b"):
+        transaction.add_member(name)
+    transaction.commit()
+
+    cache = DataCache()
+    cache_key = DataCache.get_cache_key("A", 2024, "work_schedule")
+    document = cache.get_document("A", 2024, "work_schedule", months=[4])
+    cache.mark_dirty(cache_key, 4)
+    document["month"]["4"]["a"]["monthly_hours"]["entry_data"] = ["D", "N"]
+    cache.flush()
+
+def edit_file(path, change):
+    with open(path, 'r') as file:
+        document = json.load(file)
+    change(document)
+    with open(path, 'w') as file:
+        json.dump(document, file)
+
+def set_entries(document, entry_data):
+    document["month"]["4"]["a"]["monthly_hours"]["entry_data"] = entry_data
+
+# Schedules kept in the database are not swept
+@pytest.mark.parametrize("layout", ["year", "month", "log"], indirect=True)
+def test_saved_schedules_verify(layout):
+    add_roster()
+    for schedule_type in ("Overtime", "work_schedule"):
+        assert verify_schedule(get_store("A", 2024, schedule_type)) == ([], [])
+
+@pytest.fixture
+def year_file(share, monkeypatch):
+    monkeypatch.setattr(storage_functions, "STORAGE_LAYOUT", "year")
+    add_roster()
+    return get_store("A", 2024, "work_schedule").path
+
+def test_hand_edit_is_a_mismatch(year_file):
+    edit_file(year_file, lambda document: set_entries(document, ["D", "R"]))
+
+    mismatches, unverified = verify_schedule(get_store("A", 2024, "work_schedule"))
+    assert mismatches == ["month 4: checksum mismatch"]
+    assert unverified == []
+
+def test_save_by_an_older_build_is_unverified(year_file):
+    def save_without_integrity(document):
+        # Older builds keep the record as they read it and bump the version
+        set_entries(document, ["D", "R"])
+        document["version"] += 1
+
+    edit_file(year_file, save_without_integrity)
+
+    mismatches, unverified = verify_schedule(get_store("A", 2024, "work_schedule"))
+    assert mismatches == []
+    assert unverified == ["4"]
+
+def test_sweep_flags_hand_edits_and_skips_unchanged_files(year_file, monkeypatch):
+    assert verify_savefiles() == {}
+    edit_file(year_file, lambda document: set_entries(document, ["D", "R"]))
+
+    assert verify_savefiles() == {"WS_A_2024": ["month 4: checksum mismatch"]}
+    assert get_flagged_schedules() == {"WS_A_2024": ["month 4: checksum mismatch"]}
+
+    # Nothing changed since the last sweep, so nothing is loaded again
+    with monkeypatch.context() as patch:
+        patch.setattr(verify_functions, "verify_schedule", pytest.fail)
+        assert verify_savefiles() == {"WS_A_2024": ["month 4: checksum mismatch"]}
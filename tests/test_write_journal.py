@@ -0,0 +1,113 @@
+# PEP8 Compliant Guidance
+# Standard Library Imports
+import os
+
+# Third-Party Library Imports
+import pytest
+
+# Local Application/Library Specific Imports
+from PathConfig import get_paths
+from functions import write_functions
+from functions.write_functions import WriteJournal, atomic_write, write_file, append_file, recover_journals
+
+
+class Crash(Exception):
+    """Stands in for the process dying at a given point of a commit."""
+
+def crash(*args):
+    raise Crash
+
+def read(path):
+    with open(path, 'r') as file:
+        return file.read()
+
+def list_folder(folder):
+    return sorted(os.listdir(folder)) if os.path.isdir(folder) else []
+
+@pytest.fixture
+def files(share):
+    save_folder = get_paths().save_folder
+    os.makedirs(save_folder)
+    paths = [os.path.join(save_folder, name) for name in ("OT_A_2024.json", "WS_A_2024.json")]
+    for path in paths:
+        atomic_write(path, "old")
+    return paths
+
+def test_journal_writes_every_file_on_commit(files):
+    with WriteJournal():
+        write_file(files[0], "new 0")
+        with WriteJournal():
+            # Nested journals join the outer one
+            write_file(files[1], "new 1")
+        assert [read(path) for path in files] == ["old", "old"]
+
+    assert [read(path) for path in files] == ["new 0", "new 1"]
+    assert list_folder(get_paths().journal_folder) == []
+    assert not [name for name in os.listdir(get_paths().save_folder) if name.endswith(".tmp")]
+
+def test_journal_writes_nothing_when_the_operation_fails(files):
+    with pytest.raises(ValueError):
+        with WriteJournal():
+            write_file(files[0], "new 0")
+            write_file(files[1], "new 1")
+            raise ValueError
+
+    assert [read(path) for path in files] == ["old", "old"]
+
+def crash_after_commit(files, monkeypatch):
+    """
+    Runs a journal that writes the first file and appends to the second, dying
+    once the journal is marked committed but before any target is replaced.
+    """
+    with monkeypatch.context() as patch:
+        patch.setattr(write_functions, "replay_journal", crash)
+        with pytest.raises(Crash):
+            with WriteJournal():
+                write_file(files[0], "new 0")
+                append_file(files[1], " appended")
+
+def test_recovery_finishes_a_committed_journal(files, monkeypatch):
+    crash_after_commit(files, monkeypatch)
+
+    assert [read(path) for path in files] == ["old", "old"]
+    assert recover_journals(min_age=0) == 1
+    assert [read(path) for path in files] == ["new 0", "old appended"]
+    assert list_folder(get_paths().journal_folder) == []
+
+def test_recovery_does_not_append_twice(files, monkeypatch):
+    crash_after_commit(files, monkeypatch)
+
+    # The append landed before the crash, the journal does not know
+    with open(files[1], 'a') as file:
+        file.write(" appended")
+    recover_journals(min_age=0)
+    assert read(files[1]) == "old appended"
+
+def test_recovery_discards_a_journal_that_never_committed(files, monkeypatch):
+    write_journal = WriteJournal.write_journal
+
+    def crash_before_commit(journal, state, entries):
+        if state == "committed":
+            raise Crash
+        write_journal(journal, state, entries)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(WriteJournal, "write_journal", crash_before_commit)
+        # A dead process cleans nothing up
+        patch.setattr(write_functions, "discard_journal", lambda *args: None)
+        with pytest.raises(Crash):
+            with WriteJournal():
+                write_file(files[0], "new 0")
+                write_file(files[1], "new 1")
+
+    assert recover_journals(min_age=0) == 1
+    assert [read(path) for path in files] == ["old", "old"]
+    assert list_folder(get_paths().journal_folder) == []
+    assert not [name for name in os.listdir(get_paths().save_folder) if name.endswith(".tmp")]
+
+def test_recovery_leaves_young_journals_alone(files, monkeypatch):
+    crash_after_commit(files, monkeypatch)
+
+    # Another user's save may still be running
+    assert recover_journals() == 0
+    assert [read(path) for path in files] == ["old", "old"]